@@ -0,0 +1,151 @@
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+UserModel = get_user_model()
+
+AVAILABILITY_FIELDS = ('username', 'email')
+
+
+class BloomFilter:
+    """
+    A set of strings that only stores a few bits per string, and that may
+    wrongly report that it contains a string (with the given probability)
+    but never wrongly reports that it does not.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1)
+        self.bit_count = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(
+            round(self.bit_count / capacity * math.log(2)), 1)
+        self.bits = bytearray(math.ceil(self.bit_count / 8))
+
+    def _get_positions(self, value):
+        digest = hashlib.blake2b(
+            value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little')
+        return ((h1 + i * h2) % self.bit_count
+                for i in range(self.hash_count))
+
+    def add(self, value):
+        for position in self._get_positions(value):
+            self.bits[position // 8] |= 1 << position % 8
+
+    def __contains__(self, value):
+        return all(self.bits[position // 8] & 1 << position % 8
+                   for position in self._get_positions(value))
+
+
+# the filters of this process, by field, with the time at which they were
+# built
+_filters = {}
+
+
+def build_filter(field):
+    values = UserModel.objects.values_list(field, flat=True)
+    bloom_filter = BloomFilter(
+        int(values.count() * 1.1) + 1000,
+        settings.USER_AVAILABILITY_FILTER_ERROR_RATE)
+    for value in values.iterator():
+        bloom_filter.add(value)
+    _filters[field] = (bloom_filter, time.monotonic())
+    return bloom_filter
+
+
+def get_filter(field):
+    """
+    Return a Bloom filter of the usernames or emails of every user, or None
+    if the filters are disabled.
+
+    The filter is built from the user table when it is first needed, and
+    rebuilt once it is older than USER_AVAILABILITY_FILTER_TIMEOUT, so that
+    the users who have been created by other processes are added to it.
+    (Users that are created by this process are added right away.)
+    """
+    timeout = settings.USER_AVAILABILITY_FILTER_TIMEOUT
+    if not timeout:
+        return None
+    bloom_filter, built_at = _filters.get(field, (None, None))
+    if bloom_filter is None or time.monotonic() - built_at > timeout:
+        bloom_filter = build_filter(field)
+    return bloom_filter
+
+
+def add_user_to_filters(user):
+    for field in AVAILABILITY_FIELDS:
+        if field in _filters:
+            _filters[field][0].add(getattr(user, field))
+
+
+def clear_filters():
+    _filters.clear()
+
+
+def get_cache():
+    return caches[settings.USER_AVAILABILITY_CACHE_ALIAS]
+
+
+def get_availability_key(field, value):
+    value_hash = hashlib.md5(value.encode('utf-8')).hexdigest()
+    return f'api:availability:{field}:{value_hash}'
+
+
+def get_availability(field, values):
+    """
+    Return whether each of the given usernames or emails is available, as a
+    dict.
+
+    Values that are not in the field's Bloom filter are available. The
+    others are looked up in the cache, and the rest are checked with a
+    single 'IN' query, whose answers are cached for
+    USER_AVAILABILITY_CACHE_TIMEOUT seconds. (A username or email that has
+    just been taken by another process may therefore be reported as
+    available for a little while, but it is still rejected when the form is
+    submitted.)
+    """
+    if field not in AVAILABILITY_FIELDS:
+        raise ValueError(f"The availability of '{field}' is not checked.")
+    availability = {}
+    unknown_values = set(values)
+
+    bloom_filter = get_filter(field)
+    if bloom_filter is not None:
+        for value in list(unknown_values):
+            if value not in bloom_filter:
+                availability[value] = True
+                unknown_values.remove(value)
+
+    timeout = settings.USER_AVAILABILITY_CACHE_TIMEOUT
+    if unknown_values and timeout:
+        keys = {get_availability_key(field, value): value
+                for value in unknown_values}
+        for key, available in get_cache().get_many(keys).items():
+            availability[keys[key]] = available
+            unknown_values.remove(keys[key])
+
+    if unknown_values:
+        taken_values = set(UserModel.objects
+                           .filter(**{f'{field}__in': unknown_values})
+                           .values_list(field, flat=True))
+        new_availability = {value: value not in taken_values
+                            for value in unknown_values}
+        availability.update(new_availability)
+        if timeout:
+            get_cache().set_many(
+                {get_availability_key(field, value): available
+                 for value, available in new_availability.items()},
+                timeout)
+    return availability
+
+
+def delete_cached_availability(user):
+    get_cache().delete_many(
+        [get_availability_key(field, getattr(user, field))
+         for field in AVAILABILITY_FIELDS])
@@ -0,0 +1,78 @@
+from django.db.models import Value
+from django.db.models.functions import Upper
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+# sorts after every other character, so that '<prefix><MAX_CHARACTER>' sorts
+# after every name that starts with the prefix
+MAX_CHARACTER = '\U0010ffff'
+
+
+class MenuItemFilterSerializer(serializers.Serializer):
+    price_min = serializers.IntegerField(min_value=0, required=False)
+    price_max = serializers.IntegerField(min_value=0, required=False)
+    has_price = serializers.BooleanField(required=False)
+    name_prefix = serializers.CharField(max_length=128, required=False)
+    restaurant = serializers.IntegerField(required=False)
+    menu = serializers.IntegerField(required=False)
+
+    def validate(self, data):
+        if data.get('price_min', 0) > data.get('price_max', float('inf')):
+            raise serializers.ValidationError(
+                "'price_min' cannot be greater than 'price_max'.")
+        return data
+
+
+class MenuItemFilterBackend(BaseFilterBackend):
+    """
+    Filter menu items by price range, by whether they have a price, by the
+    start of their name, and by restaurant or menu.
+
+    Prices are in cents. Each filter is backed by one of MenuItem's indexes,
+    e.g. 'restaurant' and 'price_max' by 'menuitem_restaurant_price_idx'.
+    The name prefix is compared as a range of upper-case names, which (unlike
+    'name__istartswith') can seek 'menuitem_upper_name_idx'. The results are
+    still sorted by the paginator's ordering afterwards.
+    """
+    parameters = [
+        ('price_min', 'integer', "Minimum price, in cents."),
+        ('price_max', 'integer', "Maximum price, in cents."),
+        ('has_price', 'boolean', "Only items with (or without) a price."),
+        ('name_prefix', 'string',
+         "Only items whose name starts with this text (case-insensitive)."),
+        ('restaurant', 'integer', "Only items of this restaurant (id)."),
+        ('menu', 'integer', "Only items of this menu (id)."),
+    ]
+
+    def filter_queryset(self, request, queryset, view):
+        # a plain dict, so that a missing 'has_price' is not read as False
+        serializer = MenuItemFilterSerializer(
+            data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        if 'restaurant' in params:
+            queryset = queryset.filter(restaurant=params['restaurant'])
+        if 'menu' in params:
+            queryset = queryset.filter(menu=params['menu'])
+        if 'price_min' in params:
+            queryset = queryset.filter(price__gte=params['price_min'])
+        if 'price_max' in params:
+            queryset = queryset.filter(price__lte=params['price_max'])
+        if 'has_price' in params:
+            queryset = queryset.filter(price__isnull=not params['has_price'])
+        if 'name_prefix' in params:
+            name_prefix = params['name_prefix']
+            queryset = queryset.alias(upper_name=Upper('name')).filter(
+                upper_name__gte=Upper(Value(name_prefix)),
+                upper_name__lt=Upper(Value(name_prefix + MAX_CHARACTER)))
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {'name': name,
+             'required': False,
+             'in': 'query',
+             'description': description,
+             'schema': {'type': schema_type}}
+            for name, schema_type, description in self.parameters]
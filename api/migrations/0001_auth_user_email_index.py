@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index the emails of the users, whose availability is checked by the API.
+    (The user model belongs to 'django.contrib.auth', so the index is added
+    with SQL instead of in the model's Meta.)
+    """
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX auth_user_email_idx ON auth_user (email);',
+            reverse_sql='DROP INDEX auth_user_email_idx;'),
+    ]
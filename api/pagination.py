@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from menus_project.keyset import (
+    InvalidCursor, decode_cursor, encode_cursor, get_keyset_page)
+
+
+class NameCursorPagination(BasePagination):
+    """
+    Keyset pagination over the ('name', 'id') ordering of a list.
+
+    Each cursor holds the name and id of the last (or first) object on the
+    current page, so a page is fetched with a single indexed range query no
+    matter how deep the client has paged, and objects that are created while
+    a client is paging never shift the objects on the following pages.
+
+    The page size can be chosen by the client with '?page_size=' (up to
+    API_MAX_PAGE_SIZE). Views that set 'allow_unpaginated = True' also accept
+    '?paginate=false', which returns a plain list of every object.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    unpaginated_query_param = 'paginate'
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_unpaginated(request, view):
+            return None
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        name, pk, reverse = self.decode_cursor(request)
+
+        results, has_more = get_keyset_page(
+            queryset, self.page_size, name, pk, reverse)
+        if reverse:
+            self.has_next = pk is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = pk is not None
+        self.page = results
+        return results
+
+    def is_unpaginated(self, request, view):
+        return getattr(view, 'allow_unpaginated', False) \
+            and request.query_params.get(self.unpaginated_query_param) \
+            == 'false'
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.API_PAGE_SIZE
+        if page_size <= 0:
+            return settings.API_PAGE_SIZE
+        return min(page_size, settings.API_MAX_PAGE_SIZE)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, None, False
+        try:
+            return decode_cursor(encoded)
+        except InvalidCursor:
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse):
+        return replace_query_param(
+            self.base_url, self.cursor_query_param,
+            encode_cursor(obj.name, obj.pk, reverse))
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True},
+                'previous': {'type': 'string', 'nullable': True},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        parameters = [
+            {'name': self.cursor_query_param,
+             'required': False,
+             'in': 'query',
+             'description': "The pagination cursor value.",
+             'schema': {'type': 'string'}},
+            {'name': self.page_size_query_param,
+             'required': False,
+             'in': 'query',
+             'description': "Number of results to return per page.",
+             'schema': {'type': 'integer'}}]
+        if getattr(view, 'allow_unpaginated', False):
+            parameters.append(
+                {'name': self.unpaginated_query_param,
+                 'required': False,
+                 'in': 'query',
+                 'description': "Set to 'false' to return every result.",
+                 'schema': {'type': 'string', 'enum': ['false']}})
+        return parameters
@@ -1,7 +1,7 @@
 from rest_framework import permissions
 
-from restaurants.models import Restaurant
-from menus.models import Menu, MenuSection, MenuItem
+from menus_project.permissions import (
+    RESTAURANT_OBJECT_TYPES, user_is_restaurant_admin)
 
 
 class HasRestaurantPermissionsOrReadOnly(permissions.BasePermission):
@@ -13,15 +13,8 @@ class HasRestaurantPermissionsOrReadOnly(permissions.BasePermission):
             return True
         elif request.method in permissions.SAFE_METHODS:
             return True
-        elif type(obj) == Restaurant:
-            return request.user in obj.admin_users.all()
-        elif type(obj) == Menu:
-            return request.user in obj.restaurant.admin_users.all()
-        elif type(obj) == MenuSection:
-            return request.user in obj.menu.restaurant.admin_users.all()
-        elif type(obj) == MenuItem:
-            return request.user \
-                in obj.menusection.menu.restaurant.admin_users.all()
+        elif type(obj) in RESTAURANT_OBJECT_TYPES:
+            return user_is_restaurant_admin(request, obj)
         # if non-restaurant object submitted, raise TypeError
         else:
             raise TypeError("This permission can only be used with a "
@@ -0,0 +1,53 @@
+import functools
+import gzip
+import hashlib
+
+import yaml
+from django.conf import settings
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+
+SCHEMA_RENDERERS = {
+    'yaml': OpenApiYamlRenderer,
+    'json': OpenApiJsonRenderer,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema():
+    """
+    Return the OpenAPI schema of the API.
+
+    The schema is read from API_SCHEMA_FILE if it is set (e.g. to a file that
+    is generated at deploy time with './manage.py spectacular --file <path>').
+    Otherwise, it is generated the first time that it is needed. Either way,
+    it is kept for the lifetime of the process, since it only changes when
+    the code does.
+    """
+    if settings.API_SCHEMA_FILE:
+        with open(settings.API_SCHEMA_FILE, 'rb') as schema_file:
+            return yaml.safe_load(schema_file)
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    return generator.get_schema(request=None, public=True)
+
+
+@functools.lru_cache(maxsize=None)
+def get_schema_document(schema_format):
+    """
+    Render the schema as YAML or JSON, and return the content, its gzipped
+    content and an ETag that is derived from a hash of the content.
+    """
+    content = SCHEMA_RENDERERS[schema_format]().render(
+        get_schema(), renderer_context={})
+    content_hash = hashlib.md5(content).hexdigest()
+    return {
+        'content': content,
+        'etag': f'"{content_hash}"',
+        'gzipped_content': gzip.compress(content, mtime=0),
+        'gzipped_etag': f'"{content_hash}-gzip"',
+    }
+
+
+def clear_schema_documents():
+    get_schema.cache_clear()
+    get_schema_document.cache_clear()
@@ -1,7 +1,14 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
 from rest_framework import serializers
 
+from menus_project import constants as c
+from menus_project.render_cache import bump_restaurant_generation
 from restaurants.models import Restaurant
 from menus.models import Menu, MenuSection, MenuItem
+from search.index import index_restaurants
 
 
 class RestaurantSerializer(serializers.ModelSerializer):
@@ -69,7 +76,7 @@ class MenuItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MenuItem
-        fields = ['id', 'name', 'description', 'restaurant_name',
+        fields = ['id', 'name', 'price', 'description', 'restaurant_name',
                   'menu_name', 'menusection_name']
         read_only_fields = ['restaurant_name', 'menu_name', 'menusection_name']
 
@@ -84,3 +91,229 @@ class MenuItemSerializer(serializers.ModelSerializer):
         menuitem = MenuItem.objects.create(
             menusection=self.menusection, **validated_data)
         return menuitem
+
+
+class AllMenuItemSerializer(serializers.ModelSerializer):
+    restaurant_name = serializers.ReadOnlyField(source='restaurant.name')
+    menu_name = serializers.ReadOnlyField(source='menu.name')
+    menusection_name = serializers.ReadOnlyField(source='menusection.name')
+
+    class Meta:
+        model = MenuItem
+        fields = ['id', 'name', 'price', 'description', 'restaurant_id',
+                  'restaurant_name', 'menu_id', 'menu_name', 'menusection_id',
+                  'menusection_name']
+        read_only_fields = fields
+
+
+# full menu
+
+
+class MenuItemFullSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = MenuItem
+        fields = ['id', 'name', 'slug', 'price', 'description']
+
+
+class MenuSectionFullSerializer(serializers.ModelSerializer):
+    items = MenuItemFullSerializer(source='menuitem_set', many=True)
+
+    class Meta:
+        model = MenuSection
+        fields = ['id', 'name', 'slug', 'note', 'items']
+
+
+class MenuFullSerializer(serializers.ModelSerializer):
+    """Serialize a menu with all of its sections and items."""
+    restaurant_name = serializers.ReadOnlyField(source='restaurant.name')
+    sections = MenuSectionFullSerializer(source='menusection_set', many=True)
+
+    class Meta:
+        model = Menu
+        fields = ['id', 'name', 'slug', 'description', 'theme',
+                  'restaurant', 'restaurant_name', 'sections']
+
+
+# search
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField()
+    restaurant = serializers.IntegerField(required=False)
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.API_MAX_PAGE_SIZE,
+        default=settings.API_PAGE_SIZE)
+    offset = serializers.IntegerField(min_value=0, default=0)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    kind = serializers.CharField()
+    id = serializers.IntegerField(source='object.pk')
+    name = serializers.CharField(source='object.name')
+    description = serializers.CharField()
+    restaurant_id = serializers.IntegerField(source='restaurant.pk')
+    restaurant_name = serializers.CharField(source='restaurant.name')
+    url = serializers.CharField(source='get_absolute_url')
+    rank = serializers.FloatField()
+
+
+# staff statistics
+
+class HistogramBucketSerializer(serializers.Serializer):
+    le_ms = serializers.IntegerField(allow_null=True)
+    count = serializers.IntegerField()
+
+
+class ViewRequestStatsSerializer(serializers.Serializer):
+    count = serializers.IntegerField()
+    avg_queries = serializers.FloatField()
+    avg_db_ms = serializers.FloatField()
+    avg_render_ms = serializers.FloatField()
+    avg_view_ms = serializers.FloatField()
+    avg_total_ms = serializers.FloatField()
+    max_total_ms = serializers.FloatField()
+    histogram = HistogramBucketSerializer(many=True)
+
+
+class RenderCacheStatsSerializer(serializers.Serializer):
+    hits = serializers.IntegerField()
+    misses = serializers.IntegerField()
+
+
+class RequestStatsSerializer(serializers.Serializer):
+    instrumentation_enabled = serializers.BooleanField()
+    views = serializers.DictField(child=ViewRequestStatsSerializer())
+    render_cache = RenderCacheStatsSerializer()
+
+
+class JobQueueStatsSerializer(serializers.Serializer):
+    queued = serializers.IntegerField()
+    scheduled = serializers.IntegerField()
+    running = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    oldest_queued_seconds = serializers.FloatField(allow_null=True)
+
+
+# menu import
+
+
+def validate_import_names(objects, error_message, existing_slugs=()):
+    """
+    Validate the slugs that will be generated from the names of a list of
+    objects that are being imported into the same parent.
+    """
+    slugs = set(existing_slugs)
+    for obj in objects:
+        slug = slugify(obj['name'])
+        if slug in c.RESERVED_KEYWORDS:
+            raise serializers.ValidationError(
+                f"'{obj['name']}': {c.RESERVED_KEYWORD_ERROR_STRING}")
+        if slug in slugs:
+            raise serializers.ValidationError(
+                f"'{obj['name']}': {error_message}")
+        slugs.add(slug)
+    return objects
+
+
+class MenuItemImportSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = MenuItem
+        fields = ['name', 'price', 'description']
+
+
+class MenuSectionImportSerializer(serializers.ModelSerializer):
+    items = MenuItemImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = MenuSection
+        fields = ['name', 'note', 'items']
+
+    def validate_items(self, items):
+        return validate_import_names(
+            items, "This name is too similar to another item name.")
+
+
+class MenuImportSerializer(serializers.ModelSerializer):
+    sections = MenuSectionImportSerializer(many=True, required=False)
+
+    class Meta:
+        model = Menu
+        fields = ['name', 'description', 'theme', 'sections']
+
+    def validate_sections(self, sections):
+        return validate_import_names(
+            sections, "This name is too similar to another section name.")
+
+
+class MenuTreeImportSerializer(serializers.Serializer):
+    """
+    Validate a nested document of menus, sections and items in memory, and
+    then create all of its objects with one bulk insert per model.
+    """
+    menus = MenuImportSerializer(many=True, allow_empty=False)
+
+    def validate_menus(self, menus):
+        restaurant = self.context['restaurant']
+        return validate_import_names(
+            menus,
+            "This name is too similar to one of this restaurant's "
+            "existing menu names.",
+            existing_slugs=restaurant.menu_set.values_list('slug', flat=True))
+
+    @transaction.atomic
+    def create(self, validated_data):
+        restaurant = self.context['restaurant']
+        menus_data = validated_data['menus']
+
+        # menus
+        Menu.objects.bulk_create([
+            Menu(restaurant=restaurant, slug=slugify(menu['name']),
+                 **{k: v for k, v in menu.items() if k != 'sections'})
+            for menu in menus_data])
+        # bulk_create() does not set the primary keys on every database
+        menu_pks = dict(Menu.objects.filter(
+            restaurant=restaurant,
+            slug__in=[slugify(menu['name']) for menu in menus_data])
+            .values_list('slug', 'pk'))
+
+        # sections
+        menusections = []
+        for menu in menus_data:
+            for menusection in menu.get('sections', []):
+                menusections.append(MenuSection(
+                    restaurant=restaurant,
+                    menu_id=menu_pks[slugify(menu['name'])],
+                    slug=slugify(menusection['name']),
+                    **{k: v for k, v in menusection.items() if k != 'items'}))
+        MenuSection.objects.bulk_create(menusections)
+        menusection_pks = {
+            (menu_pk, slug): pk for menu_pk, slug, pk in
+            MenuSection.objects.filter(menu__in=menu_pks.values())
+            .values_list('menu', 'slug', 'pk')}
+
+        # items
+        menuitems = []
+        for menu in menus_data:
+            menu_pk = menu_pks[slugify(menu['name'])]
+            for menusection in menu.get('sections', []):
+                menusection_pk = \
+                    menusection_pks[(menu_pk, slugify(menusection['name']))]
+                for menuitem in menusection.get('items', []):
+                    menuitems.append(MenuItem(
+                        restaurant=restaurant,
+                        menu_id=menu_pk,
+                        menusection_id=menusection_pk,
+                        slug=slugify(menuitem['name']),
+                        **menuitem))
+        MenuItem.objects.bulk_create(menuitems)
+
+        # bulk_create() does not send the post_save signal
+        Restaurant.objects.filter(pk=restaurant.pk) \
+            .update(updated_at=timezone.now())
+        bump_restaurant_generation(restaurant.slug)
+        index_restaurants([restaurant.pk])
+
+        return {'menus': len(menus_data),
+                'menusections': len(menusections),
+                'menuitems': len(menuitems)}
@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .availability import add_user_to_filters, delete_cached_availability
+from .snapshots import delete_menu_snapshots
+from restaurants.models import Restaurant
+from menus.models import Menu, MenuSection, MenuItem
+
+
+@receiver(post_save, sender=Restaurant)
+def restaurant_changed(sender, instance, **kwargs):
+    # snapshots contain the restaurant's name
+    delete_menu_snapshots(
+        instance.menu_set.values_list('pk', flat=True))
+
+
+@receiver([post_save, post_delete], sender=Menu)
+def menu_changed(sender, instance, **kwargs):
+    delete_menu_snapshots([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=MenuSection)
+@receiver([post_save, post_delete], sender=MenuItem)
+def menu_descendant_changed(sender, instance, signal, **kwargs):
+    menu_pks = {instance.menu_id}
+    # an object that has been moved is also removed from its previous menu
+    if signal == post_save:
+        menu_pks.add(instance._old_slug_path_state.menu_id)
+    menu_pks.discard(None)
+    delete_menu_snapshots(menu_pks)
+
+
+@receiver(post_save, sender=get_user_model())
+def user_saved(sender, instance, **kwargs):
+    # the username or email may have changed
+    add_user_to_filters(instance)
+    delete_cached_availability(instance)
+
+
+@receiver(post_delete, sender=get_user_model())
+def user_deleted(sender, instance, **kwargs):
+    delete_cached_availability(instance)
@@ -0,0 +1,62 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Prefetch
+from rest_framework.renderers import JSONRenderer
+
+from .serializers import MenuFullSerializer
+from menus.models import Menu, MenuSection, MenuItem
+
+
+def get_cache():
+    return caches[settings.MENU_SNAPSHOT_CACHE_ALIAS]
+
+
+def get_menu_snapshot_key(menu_pk):
+    return f'api:menu_snapshot:{menu_pk}'
+
+
+def build_menu_snapshot(menu):
+    """
+    Render a menu with all of its sections and items as JSON, and store the
+    result (with its ETag) until the menu or one of its descendants changes.
+    (See 'api.signals'.)
+    """
+    content = JSONRenderer().render(MenuFullSerializer(menu).data)
+    snapshot = {
+        'restaurant_pk': menu.restaurant_id,
+        'content': content,
+        'etag': '"%s"' % hashlib.md5(content).hexdigest(),
+    }
+    get_cache().set(get_menu_snapshot_key(menu.pk), snapshot, timeout=None)
+    return snapshot
+
+
+def get_menu_snapshot(restaurant_pk, menu_pk):
+    """
+    Return the stored snapshot of a menu, building it if necessary, or None
+    if the restaurant has no such menu.
+    """
+    snapshot = get_cache().get(get_menu_snapshot_key(menu_pk))
+    if snapshot is not None:
+        if snapshot['restaurant_pk'] != restaurant_pk:
+            return None
+        return snapshot
+
+    menu = Menu.objects.filter(pk=menu_pk, restaurant__pk=restaurant_pk) \
+        .select_related('restaurant') \
+        .prefetch_related(Prefetch(
+            'menusection_set',
+            queryset=MenuSection.objects.order_by('id').prefetch_related(
+                Prefetch('menuitem_set',
+                         queryset=MenuItem.objects.order_by('id'))))) \
+        .first()
+    if menu is None:
+        return None
+    return build_menu_snapshot(menu)
+
+
+def delete_menu_snapshots(menu_pks):
+    get_cache().delete_many(
+        [get_menu_snapshot_key(menu_pk) for menu_pk in menu_pks])
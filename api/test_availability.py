@@ -0,0 +1,98 @@
+from django.test import TestCase, override_settings
+
+from .availability import (
+    BloomFilter, clear_filters, get_availability, get_cache, get_filter)
+from menus_project import factories as f
+
+
+class BloomFilterTest(TestCase):
+
+    def test_contains(self):
+        bloom_filter = BloomFilter(100)
+        bloom_filter.add('alice')
+        self.assertIn('alice', bloom_filter)
+        self.assertNotIn('bob', bloom_filter)
+
+    def test_error_rate(self):
+        bloom_filter = BloomFilter(1000, error_rate=0.01)
+        for i in range(1000):
+            bloom_filter.add(f'user{i}')
+        for i in range(1000):
+            self.assertIn(f'user{i}', bloom_filter)
+        false_positives = sum(
+            f'other{i}' in bloom_filter for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(
+    USER_AVAILABILITY_CACHE_TIMEOUT=60, USER_AVAILABILITY_FILTER_TIMEOUT=60)
+class GetAvailabilityTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+
+    def setUp(self):
+        clear_filters()
+        get_cache().clear()
+        self.addCleanup(clear_filters)
+
+    def test_get_availability(self):
+        self.assertEqual(
+            get_availability(
+                'username', [self.test_user.username, 'available_username']),
+            {self.test_user.username: False, 'available_username': True})
+        self.assertEqual(
+            get_availability('email', [self.test_user.email]),
+            {self.test_user.email: False})
+
+    def test_get_availability_unknown_field(self):
+        with self.assertRaises(ValueError):
+            get_availability('password', ['password'])
+
+    def test_available_values_do_not_query_the_database(self):
+        get_filter('username')
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_availability('username', ['available_username']),
+                {'available_username': True})
+
+    def test_taken_values_are_checked_in_one_query(self):
+        other_user = f.UserFactory()
+        get_filter('username')
+        with self.assertNumQueries(1):
+            get_availability(
+                'username', [self.test_user.username, other_user.username])
+        # the answers are cached
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                get_availability('username', [self.test_user.username]),
+                {self.test_user.username: False})
+
+    def test_new_users_are_added_to_the_filter(self):
+        get_filter('username')
+        f.UserFactory(username='new_user')
+        self.assertIn('new_user', get_filter('username'))
+        self.assertEqual(
+            get_availability('username', ['new_user']), {'new_user': False})
+
+    def test_cached_answers_are_deleted_when_a_user_is_saved(self):
+        self.assertEqual(
+            get_availability('username', ['new_user']), {'new_user': True})
+        self.test_user.username = 'new_user'
+        self.test_user.save()
+        self.assertEqual(
+            get_availability('username', ['new_user']), {'new_user': False})
+
+    def test_filter_is_rebuilt_after_its_timeout(self):
+        bloom_filter = get_filter('username')
+        self.assertIs(get_filter('username'), bloom_filter)
+        with self.settings(USER_AVAILABILITY_FILTER_TIMEOUT=-1):
+            self.assertIsNot(get_filter('username'), bloom_filter)
+
+    @override_settings(
+        USER_AVAILABILITY_CACHE_TIMEOUT=0, USER_AVAILABILITY_FILTER_TIMEOUT=0)
+    def test_disabled(self):
+        self.assertIsNone(get_filter('username'))
+        with self.assertNumQueries(1):
+            get_availability('username', ['available_username'])
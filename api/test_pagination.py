@@ -0,0 +1,100 @@
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from menus_project import constants as c
+from menus_project import factories as f
+from restaurants.models import Restaurant
+
+
+@override_settings(API_PAGE_SIZE=2, API_MAX_PAGE_SIZE=3)
+class NameCursorPaginationTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+        for name in ['Delta', 'Alpha', 'Echo', 'Charlie', 'Bravo']:
+            f.RestaurantFactory(name=name)
+        cls.test_menu = f.MenuFactory()
+        f.MenuSectionFactory.create_batch(3, menu=cls.test_menu)
+
+        cls.current_test_url = reverse('api:restaurant_list')
+
+    def setUp(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+
+    def get_names(self, response):
+        return [obj['name'] for obj in response.data['results']]
+
+    def get_all_names(self, url):
+        names = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            names += self.get_names(response)
+            url = response.data['next']
+        return names
+
+    def test_first_page(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.get_names(self.response)[:2], ['Alpha', 'Bravo'])
+        self.assertIsNotNone(self.response.data['next'])
+        self.assertIsNone(self.response.data['previous'])
+
+    def test_next_links_return_every_object_once_in_order(self):
+        self.assertEqual(
+            self.get_all_names(self.current_test_url),
+            list(Restaurant.objects.order_by('name', 'id')
+                 .values_list('name', flat=True)))
+
+    def test_previous_link(self):
+        first_page = self.client.get(self.current_test_url)
+        second_page = self.client.get(first_page.data['next'])
+        self.assertEqual(self.get_names(second_page), ['Charlie', 'Delta'])
+
+        previous_page = self.client.get(second_page.data['previous'])
+        self.assertEqual(self.get_names(previous_page), ['Alpha', 'Bravo'])
+        self.assertIsNone(previous_page.data['previous'])
+        self.assertIsNotNone(previous_page.data['next'])
+
+    def test_cursor_is_stable_under_concurrent_inserts(self):
+        first_page = self.client.get(self.current_test_url)
+        f.RestaurantFactory(name='Aardvark')
+        second_page = self.client.get(first_page.data['next'])
+        self.assertEqual(self.get_names(second_page), ['Charlie', 'Delta'])
+
+    def test_page_size_query_param(self):
+        self.response = self.client.get(self.current_test_url + '?page_size=1')
+        self.assertEqual(len(self.response.data['results']), 1)
+
+    def test_page_size_query_param_is_capped(self):
+        self.response = \
+            self.client.get(self.current_test_url + '?page_size=100')
+        self.assertEqual(len(self.response.data['results']), 3)
+
+    def test_invalid_cursor_returns_404(self):
+        self.response = \
+            self.client.get(self.current_test_url + '?cursor=bad-cursor')
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_page_query_count_does_not_grow_with_table_size(self):
+        with self.assertNumQueries(5):  # session, user, page, prefetches
+            self.client.get(self.current_test_url)
+        f.RestaurantFactory.create_batch(5)
+        with self.assertNumQueries(5):
+            self.client.get(self.current_test_url)
+
+    def test_unpaginated_query_param_is_ignored_for_restaurant_list(self):
+        self.response = \
+            self.client.get(self.current_test_url + '?paginate=false')
+        self.assertEqual(len(self.response.data['results']), 2)
+
+    def test_unpaginated_query_param_returns_plain_list(self):
+        menusection_list_url = reverse('api:menusection_list', kwargs={
+            'restaurant_pk': self.test_menu.restaurant.pk,
+            'menu_pk': self.test_menu.pk})
+        self.response = \
+            self.client.get(menusection_list_url + '?paginate=false')
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(len(self.response.data), 3)
@@ -188,8 +188,8 @@ class MenuItemSerializerTest(APITestCase):
     def test_meta_fields(self):
         self.assertEqual(
             self.serializer.Meta.fields,
-            ['id', 'name', 'description', 'restaurant_name', 'menu_name',
-                'menusection_name'])
+            ['id', 'name', 'price', 'description', 'restaurant_name',
+                'menu_name', 'menusection_name'])
 
     def test_meta_read_only_fields(self):
         self.assertTrue(
@@ -225,3 +225,31 @@ class MenuItemSerializerTest(APITestCase):
         # object count increased by 1
         new_menuitem_count = MenuItem.objects.count()
         self.assertEqual(old_menuitem_count + 1, new_menuitem_count)
+
+
+class AllMenuItemSerializerTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.serializer = serializers.AllMenuItemSerializer
+
+        # create objects
+        cls.test_menuitem = f.MenuItemFactory(price=500)
+
+    def test_meta_model_name(self):
+        self.assertEqual(self.serializer.Meta.model.__name__, 'MenuItem')
+
+    def test_meta_read_only_fields(self):
+        self.assertEqual(
+            self.serializer.Meta.read_only_fields, self.serializer.Meta.fields)
+
+    def test_data(self):
+        data = self.serializer(self.test_menuitem).data
+        self.assertEqual(data['price'], 500)
+        self.assertEqual(
+            data['restaurant_id'], self.test_menuitem.restaurant.pk)
+        self.assertEqual(
+            data['restaurant_name'], self.test_menuitem.restaurant.name)
+        self.assertEqual(data['menu_id'], self.test_menuitem.menu.pk)
+        self.assertEqual(
+            data['menusection_name'], self.test_menuitem.menusection.name)
@@ -1,12 +1,27 @@
+import gzip
+import os
+import tempfile
+
+import yaml
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import AsyncClient, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import generics
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.test import APITestCase
 
 from menus_project import constants as c
 from menus_project import factories as f
-from . import serializers, views
+from jobs.models import Job
+from menus_project.instrumentation import request_stats
+from menus_project.render_cache import render_cache_stats
+from . import serializers, snapshots, views
+from .schema import clear_schema_documents, get_schema, get_schema_document
+from .filters import MenuItemFilterBackend
 from .permissions import HasRestaurantPermissionsOrReadOnly
 from restaurants.models import Restaurant
 from menus.models import Menu, MenuSection, MenuItem
@@ -73,6 +88,339 @@ class IsEmailAvailableTest(APITestCase):
         response_json = self.response.content.decode('utf-8')
         self.assertJSONEqual(response_json, {"isEmailAvailable": False})
 
+
+class CheckAvailabilityTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.check_availability
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+
+        # generate test url
+        cls.current_test_url = reverse('api:check_availability')
+
+    # request.GET
+    def test_request_get_method(self):
+        self.response = self.client.get(self.current_test_url, {
+            'username': [self.test_user.username, 'available_username'],
+            'email': ['available_email@email.com']})
+        self.assertEqual(self.response.status_code, 200)
+        self.assertJSONEqual(self.response.content.decode('utf-8'), {
+            'usernames': {self.test_user.username: False,
+                          'available_username': True},
+            'emails': {'available_email@email.com': True}})
+
+    def test_request_get_method_checks_each_field_in_one_query(self):
+        with self.assertNumQueries(2):
+            self.client.get(self.current_test_url, {
+                'username': [f'username{i}' for i in range(20)],
+                'email': [f'email{i}@email.com' for i in range(20)]})
+
+    def test_request_get_method_no_values(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertJSONEqual(self.response.content.decode('utf-8'),
+                             {'usernames': {}, 'emails': {}})
+
+    def test_request_get_method_too_many_values(self):
+        self.response = self.client.get(self.current_test_url, {
+            'username': [f'username{i}' for i in range(
+                views.AVAILABILITY_MAX_VALUES + 1)]})
+        self.assertEqual(self.response.status_code, 400)
+
+
+class MenuExportTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.MenuExport
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.admin_user = f.UserFactory(is_staff=True)
+        cls.test_menuitem = f.MenuItemFactory()
+
+        # generate test url
+        cls.current_test_url = reverse(
+            'api:menu_export', kwargs={'export_format': 'jsonl'})
+
+    def setUp(self):
+        self.client.login(username=self.admin_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    # view attributes
+    def test_permission_classes(self):
+        self.assertEqual(self.view.permission_classes, [IsAdminUser])
+
+    # request.GET
+    def test_request_get_method_unauthenticated_user(self):
+        self.client.logout()
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method_non_staff_user(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method_jsonl(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertTrue(self.response.streaming)
+        self.assertEqual(self.response['Content-Type'], 'application/jsonl')
+
+        lines = b''.join(self.response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 4)
+
+    def test_request_get_method_csv(self):
+        self.response = self.client.get(reverse(
+            'api:menu_export', kwargs={'export_format': 'csv'}))
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response['Content-Type'], 'text/csv')
+
+        lines = b''.join(self.response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 5)  # header + 4 rows
+
+    async def test_request_get_method_asgi(self):
+        async_client = AsyncClient()
+        await sync_to_async(async_client.force_login)(self.admin_user)
+        self.response = await async_client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response['Content-Type'], 'application/jsonl')
+
+        # the export's queries do not run in the event loop
+        lines = b''.join(self.response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 4)
+
+    def test_request_get_method_bad_format(self):
+        self.response = self.client.get(reverse(
+            'api:menu_export', kwargs={'export_format': 'xml'}))
+        self.assertEqual(self.response.status_code, 404)
+
+
+class RequestStatsTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.RequestStats
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.admin_user = f.UserFactory(is_staff=True)
+
+        # generate test url
+        cls.current_test_url = reverse('api:request_stats')
+
+    def setUp(self):
+        request_stats.reset()
+        render_cache_stats.reset()
+        self.client.login(username=self.admin_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    # view attributes
+    def test_permission_classes(self):
+        self.assertEqual(self.view.permission_classes, [IsAdminUser])
+
+    # request.GET
+    def test_request_get_method_non_staff_user(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method(self):
+        request_stats.record('api:menu_list', {
+            'queries': 3, 'db_ms': 2, 'render_ms': 0, 'view_ms': 10,
+            'total_ms': 10})
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(
+            self.response.data['views']['api:menu_list']['count'], 1)
+
+    def test_request_get_method_render_cache_stats(self):
+        render_cache_stats.record(hit=True)
+        render_cache_stats.record(hit=False)
+        render_cache_stats.record(hit=False)
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(
+            self.response.data['render_cache'], {'hits': 1, 'misses': 2})
+
+    # request.DELETE
+    def test_request_delete_method_resets_stats(self):
+        request_stats.record('api:menu_list', {
+            'queries': 3, 'db_ms': 2, 'render_ms': 0, 'view_ms': 10,
+            'total_ms': 10})
+        self.response = self.client.delete(self.current_test_url)
+        self.assertEqual(self.response.status_code, 204)
+        self.assertEqual(request_stats.get_summary(), {})
+        self.assertEqual(
+            render_cache_stats.get_summary(), {'hits': 0, 'misses': 0})
+
+
+class JobQueueStatsTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.JobQueueStats
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.admin_user = f.UserFactory(is_staff=True)
+        Job.objects.create(task='users.send_mail', max_attempts=5)
+        Job.objects.create(
+            task='users.send_mail', max_attempts=5, status=Job.FAILED)
+
+        # generate test url
+        cls.current_test_url = reverse('api:job_queue_stats')
+
+    def setUp(self):
+        self.client.login(username=self.admin_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    # view attributes
+    def test_permission_classes(self):
+        self.assertEqual(self.view.permission_classes, [IsAdminUser])
+
+    # request.GET
+    def test_request_get_method_non_staff_user(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.data['queued'], 1)
+        self.assertEqual(self.response.data['failed'], 1)
+
+
+class SchemaTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.Schema
+
+        # generate test url
+        cls.current_test_url = reverse('schema')
+
+    def setUp(self):
+        clear_schema_documents()
+        self.addCleanup(clear_schema_documents)
+
+    # request.GET
+    def test_request_get_method(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response['Content-Type'],
+                         'application/vnd.oai.openapi; charset=utf-8')
+        self.assertEqual(
+            self.response['ETag'], get_schema_document('yaml')['etag'])
+        schema = yaml.safe_load(self.response.content)
+        self.assertEqual(schema['info']['title'], 'Menu Maker')
+        self.assertIn('/api/v1/restaurants/', schema['paths'])
+
+    def test_request_get_method_json(self):
+        self.response = self.client.get(self.current_test_url + '?format=json')
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.json()['info']['title'], 'Menu Maker')
+
+    def test_request_get_method_gzip(self):
+        self.response = self.client.get(
+            self.current_test_url, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(self.response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', self.response['Vary'])
+        self.assertEqual(gzip.decompress(self.response.content),
+                         get_schema_document('yaml')['content'])
+        self.assertNotEqual(
+            self.response['ETag'], get_schema_document('yaml')['etag'])
+
+    def test_request_get_method_not_modified(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 304)
+        self.assertEqual(self.response['ETag'], etag)
+
+    def test_schema_is_generated_once(self):
+        self.assertIs(get_schema_document('yaml'), get_schema_document('yaml'))
+
+    def test_committed_schema_file_is_current(self):
+        with open(settings.BASE_DIR / 'schema.yml') as schema_file:
+            self.assertEqual(yaml.safe_load(schema_file), get_schema())
+
+    def test_schema_file(self):
+        schema_file = tempfile.NamedTemporaryFile(
+            'w', suffix='.yml', delete=False)
+        self.addCleanup(os.remove, schema_file.name)
+        with schema_file:
+            schema_file.write('openapi: 3.0.3\ninfo:\n  title: Deployed\n')
+
+        with override_settings(API_SCHEMA_FILE=schema_file.name):
+            self.response = self.client.get(self.current_test_url)
+        schema = yaml.safe_load(self.response.content)
+        self.assertEqual(schema['info']['title'], 'Deployed')
+
+
+class SearchTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.Search
+
+        # create model objects
+        cls.test_menuitem = f.MenuItemFactory(name='Spaghetti')
+        cls.other_menuitem = f.MenuItemFactory(name='Spaghetti Squash')
+
+        # generate test url
+        cls.current_test_url = reverse('api:search')
+
+    # request.GET
+    def test_request_get_method_unauthenticated_user(self):
+        self.response = self.client.get(
+            self.current_test_url, {'q': 'spaghetti squash'})
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.data['next'], None)
+        self.assertEqual(self.response.data['results'], [{
+            'kind': 'menuitem',
+            'id': self.other_menuitem.pk,
+            'name': self.other_menuitem.name,
+            'description': self.other_menuitem.description,
+            'restaurant_id': self.other_menuitem.restaurant.pk,
+            'restaurant_name': self.other_menuitem.restaurant.name,
+            'url': self.other_menuitem.get_absolute_url(),
+            'rank': self.response.data['results'][0]['rank'],
+        }])
+
+    def test_request_get_method_restaurant(self):
+        self.response = self.client.get(self.current_test_url, {
+            'q': 'spaghetti', 'restaurant': self.test_menuitem.restaurant.pk})
+        self.assertEqual(
+            [result['id'] for result in self.response.data['results']],
+            [self.test_menuitem.pk])
+
+    def test_request_get_method_limit_and_offset(self):
+        self.response = self.client.get(
+            self.current_test_url, {'q': 'spaghetti', 'limit': 1})
+        self.assertEqual(len(self.response.data['results']), 1)
+        self.assertIn('offset=1', self.response.data['next'])
+
+        self.response = self.client.get(self.response.data['next'])
+        self.assertEqual(len(self.response.data['results']), 1)
+        self.assertEqual(self.response.data['next'], None)
+
+    def test_request_get_method_without_query(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 400)
+
+    def test_request_get_method_bad_limit(self):
+        self.response = self.client.get(
+            self.current_test_url, {'q': 'spaghetti', 'limit': 0})
+        self.assertEqual(self.response.status_code, 400)
+
+
 class RestaurantListTest(APITestCase):
 
     @classmethod
@@ -116,7 +464,7 @@ class RestaurantListTest(APITestCase):
 
     def test_request_get_method_list_objects_authenticated_user(self):
         # get expected objects from serializer
-        restaurants = Restaurant.objects.all()
+        restaurants = Restaurant.objects.order_by('name', 'id')
         serializer = serializers.RestaurantSerializer(restaurants, many=True)
 
         # get actual objects from view
@@ -124,7 +472,7 @@ class RestaurantListTest(APITestCase):
         self.assertEqual(self.response.status_code, 200)
 
         # compare the expected result with the actual result
-        self.assertEqual(self.response.data, serializer.data)
+        self.assertEqual(self.response.data['results'], serializer.data)
 
     # request.POST
     def test_request_post_method_create_object_unauthenticated_user(self):
@@ -334,7 +682,8 @@ class MenuListTest(APITestCase):
     def test_request_get_method_list_objects_authorized_user(self):
         # get expected result from serializer
         menus = Menu.objects.filter(
-            restaurant__pk=self.test_menus[0].restaurant.pk)
+            restaurant__pk=self.test_menus[0].restaurant.pk) \
+            .order_by('name', 'id')
         serializer = serializers.MenuSerializer(menus, many=True)
 
         # get result from view
@@ -342,7 +691,7 @@ class MenuListTest(APITestCase):
         self.assertEqual(self.response.status_code, 200)
 
         # compare the expected result with the result
-        self.assertEqual(self.response.data, serializer.data)
+        self.assertEqual(self.response.data['results'], serializer.data)
 
     # request.POST
     def test_request_post_method_create_object_unauthenticated_user(self):
@@ -380,6 +729,147 @@ class MenuListTest(APITestCase):
         self.assertEqual(self.response.data['name'], post_data['name'])
 
 
+class MenuImportTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.MenuImport
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.restaurant_admin_user = f.UserFactory()
+        cls.test_restaurant = f.RestaurantFactory(
+            admin_users=[cls.restaurant_admin_user])
+
+        # generate test url
+        cls.kwargs = {'restaurant_pk': cls.test_restaurant.pk}
+        cls.current_test_url = reverse('api:menu_import', kwargs=cls.kwargs)
+
+    def setUp(self):
+        self.client.login(username=self.restaurant_admin_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    def get_post_data(self, menu_count=1, menusection_count=2,
+                      menuitem_count=3):
+        return {'menus': [{
+            'name': f'{c.TEST_MENU_NAME} {i+1}',
+            'sections': [{
+                'name': f'{c.TEST_MENUSECTION_NAME} {j+1}',
+                'items': [{
+                    'name': f'{c.TEST_MENUITEM_NAME} {k+1}',
+                    'description': c.TEST_MENUITEM_DESCRIPTION,
+                    'price': 500}
+                    for k in range(menuitem_count)]}
+                for j in range(menusection_count)]}
+            for i in range(menu_count)]}
+
+    # view attributes
+    def test_view_parent_class(self):
+        self.assertEqual(self.view.__bases__[-1], generics.CreateAPIView)
+
+    def test_permission_classes(self):
+        self.assertEqual(
+            self.view.permission_classes, [HasRestaurantPermissionsOrReadOnly])
+
+    def test_serializer_class(self):
+        self.assertEqual(
+            self.view.serializer_class, serializers.MenuTreeImportSerializer)
+
+    # request.POST
+    def test_request_post_method_unauthenticated_user(self):
+        self.client.logout()
+        self.response = self.client.post(
+            self.current_test_url, self.get_post_data())
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_post_method_authenticated_but_unauthorized_user(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.post(
+            self.current_test_url, self.get_post_data())
+        self.assertEqual(self.response.status_code, 403)
+        self.assertEqual(Menu.objects.count(), 0)
+
+    def test_request_post_method_authorized_user(self):
+        self.response = self.client.post(
+            self.current_test_url, self.get_post_data(menu_count=2))
+        self.assertEqual(self.response.status_code, 201)
+
+        # response contains row counts and timings
+        self.assertEqual(self.response.data['created'], {
+            'menus': 2, 'menusections': 4, 'menuitems': 12})
+        self.assertIn('validation_ms', self.response.data['timings'])
+        self.assertIn('write_ms', self.response.data['timings'])
+
+        # objects were created with the proper parents and slugs
+        self.assertEqual(self.test_restaurant.menu_set.count(), 2)
+        test_menuitem = MenuItem.objects.get(
+            menu__name=f'{c.TEST_MENU_NAME} 2',
+            menusection__name=f'{c.TEST_MENUSECTION_NAME} 2',
+            name=f'{c.TEST_MENUITEM_NAME} 3')
+        self.assertEqual(test_menuitem.restaurant, self.test_restaurant)
+        self.assertEqual(test_menuitem.menusection.menu, test_menuitem.menu)
+        self.assertEqual(test_menuitem.slug, 'test-menu-item-3')
+        self.assertEqual(test_menuitem.price, 500)
+
+    def test_request_post_method_bad_restaurant_pk(self):
+        self.response = self.client.post(
+            reverse('api:menu_import', kwargs={'restaurant_pk': 0}),
+            self.get_post_data())
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_query_count_does_not_grow_with_document_size(self):
+        with CaptureQueriesContext(connection) as small_import_queries:
+            self.client.post(self.current_test_url, self.get_post_data(
+                menu_count=1, menusection_count=1, menuitem_count=1))
+        self.test_restaurant.menu_set.all().delete()
+
+        # (SQLite splits much larger inserts into several batches)
+        with CaptureQueriesContext(connection) as large_import_queries:
+            self.client.post(self.current_test_url, self.get_post_data(
+                menu_count=2, menusection_count=4, menuitem_count=10))
+        self.assertEqual(MenuItem.objects.count(), 80)
+
+        self.assertEqual(
+            len(small_import_queries), len(large_import_queries))
+
+    # validation
+    def test_validation_duplicate_names_in_document(self):
+        post_data = self.get_post_data()
+        post_data['menus'][0]['sections'][0]['items'][1]['name'] = \
+            post_data['menus'][0]['sections'][0]['items'][0]['name']
+
+        self.response = self.client.post(self.current_test_url, post_data)
+        self.assertEqual(self.response.status_code, 400)
+        self.assertIn('too similar', str(self.response.data))
+        self.assertEqual(Menu.objects.count(), 0)
+
+    def test_validation_duplicate_name_of_existing_menu(self):
+        f.MenuFactory(
+            restaurant=self.test_restaurant, name=f'{c.TEST_MENU_NAME} 1')
+
+        self.response = self.client.post(
+            self.current_test_url, self.get_post_data())
+        self.assertEqual(self.response.status_code, 400)
+        self.assertEqual(MenuSection.objects.count(), 0)
+
+    def test_validation_reserved_keyword(self):
+        post_data = self.get_post_data()
+        post_data['menus'][0]['sections'][0]['name'] = \
+            c.RESERVED_KEYWORDS[0]
+
+        self.response = self.client.post(self.current_test_url, post_data)
+        self.assertEqual(self.response.status_code, 400)
+        self.assertIn(
+            c.RESERVED_KEYWORD_ERROR_STRING, str(self.response.data))
+        self.assertEqual(Menu.objects.count(), 0)
+
+    def test_validation_empty_document(self):
+        self.response = self.client.post(
+            self.current_test_url, {'menus': []})
+        self.assertEqual(self.response.status_code, 400)
+
+
 class MenuDetailTest(APITestCase):
 
     @classmethod
@@ -506,6 +996,140 @@ class MenuDetailTest(APITestCase):
         self.assertEqual(old_menu_count - 1, new_menu_count)
 
 
+class MenuFullTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.MenuFull
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.test_menuitem = f.MenuItemFactory(price=500)
+        cls.test_menusection = cls.test_menuitem.menusection
+        cls.test_menu = cls.test_menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+        # generate test url
+        cls.current_test_url = reverse('api:menu_full', kwargs={
+            'restaurant_pk': cls.test_restaurant.pk,
+            'menu_pk': cls.test_menu.pk})
+
+    def setUp(self):
+        snapshots.get_cache().clear()
+        self.client.login(username=self.test_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    # view attributes
+    def test_permission_classes(self):
+        self.assertEqual(self.view.permission_classes, [IsAuthenticated])
+
+    # request.GET
+    def test_request_get_method_unauthenticated_user(self):
+        self.client.logout()
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method_authenticated_user(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.json(), {
+            'id': self.test_menu.pk,
+            'name': self.test_menu.name,
+            'slug': self.test_menu.slug,
+            'description': self.test_menu.description,
+            'theme': self.test_menu.theme,
+            'restaurant': self.test_restaurant.pk,
+            'restaurant_name': self.test_restaurant.name,
+            'sections': [{
+                'id': self.test_menusection.pk,
+                'name': self.test_menusection.name,
+                'slug': self.test_menusection.slug,
+                'note': self.test_menusection.note,
+                'items': [{
+                    'id': self.test_menuitem.pk,
+                    'name': self.test_menuitem.name,
+                    'slug': self.test_menuitem.slug,
+                    'price': 500,
+                    'description': self.test_menuitem.description}]}]})
+
+    def test_request_get_method_wrong_restaurant_returns_404(self):
+        for i in range(2):  # first from the database, then from the cache
+            self.response = self.client.get(reverse('api:menu_full', kwargs={
+                'restaurant_pk': f.RestaurantFactory().pk,
+                'menu_pk': self.test_menu.pk}))
+            self.assertEqual(self.response.status_code, 404)
+            self.client.get(self.current_test_url)
+
+    def test_request_get_method_bad_menu_returns_404(self):
+        self.response = self.client.get(reverse('api:menu_full', kwargs={
+            'restaurant_pk': self.test_restaurant.pk, 'menu_pk': 0}))
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_request_get_method_is_served_from_snapshot(self):
+        self.client.get(self.current_test_url)
+        with self.assertNumQueries(2):  # session and user
+            self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response['Cache-Control'], 'no-cache')
+
+    def test_request_get_method_if_none_match(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 304)
+        self.assertEqual(self.response['ETag'], etag)
+        self.assertEqual(self.response['Cache-Control'], 'no-cache')
+
+    def test_snapshot_is_rebuilt_when_descendant_changes(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+
+        self.test_menuitem.name = 'Updated Menu Item Name'
+        self.test_menuitem.save()
+
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertNotEqual(self.response['ETag'], etag)
+        self.assertEqual(
+            self.response.json()['sections'][0]['items'][0]['name'],
+            'Updated Menu Item Name')
+
+    def test_snapshot_is_rebuilt_when_restaurant_changes(self):
+        self.client.get(self.current_test_url)
+
+        self.test_restaurant.name = 'Updated Restaurant Name'
+        self.test_restaurant.save()
+
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(
+            self.response.json()['restaurant_name'], 'Updated Restaurant Name')
+
+    def test_snapshot_is_rebuilt_when_descendant_is_moved(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+
+        self.test_menuitem.menusection = f.MenuSectionFactory()
+        self.test_menuitem.save()
+
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.json()['sections'][0]['items'], [])
+
+        self.test_menusection.menu = f.MenuFactory(
+            restaurant=self.test_restaurant)
+        self.test_menusection.save()
+
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.json()['sections'], [])
+
+    def test_snapshot_is_rebuilt_when_descendant_is_deleted(self):
+        self.client.get(self.current_test_url)
+        self.test_menusection.delete()
+
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.json()['sections'], [])
+
+
 class MenuSectionListTest(APITestCase):
 
     @classmethod
@@ -565,8 +1189,8 @@ class MenuSectionListTest(APITestCase):
 
     def test_request_get_method_list_objects_authorized_user(self):
         # get expected objects from serializer
-        menusections = \
-            MenuSection.objects.filter(menu__pk=self.test_menu.pk)
+        menusections = MenuSection.objects.filter(
+            menu__pk=self.test_menu.pk).order_by('name', 'id')
         serializer = serializers.MenuSectionSerializer(menusections, many=True)
 
         # get actual objects from view
@@ -574,7 +1198,7 @@ class MenuSectionListTest(APITestCase):
         self.assertEqual(self.response.status_code, 200)
 
         # compare the expected result with the actual result
-        self.assertEqual(self.response.data, serializer.data)
+        self.assertEqual(self.response.data['results'], serializer.data)
 
     # request.POST
     def test_request_post_method_create_object_unauthenticated_user(self):
@@ -787,6 +1411,9 @@ class MenuItemListTest(APITestCase):
         self.assertEqual(
             self.view.serializer_class, serializers.MenuItemSerializer)
 
+    def test_filter_backends(self):
+        self.assertEqual(self.view.filter_backends, [MenuItemFilterBackend])
+
     # request.GET
     def test_request_get_method_list_objects_unauthenticated_user(self):
         self.client.logout()
@@ -804,7 +1431,7 @@ class MenuItemListTest(APITestCase):
     def test_request_get_method_list_objects_authorized_user(self):
         # get expected objects from serializer
         menuitems = MenuItem.objects.filter(
-            menusection__pk=self.test_menusection.pk)
+            menusection__pk=self.test_menusection.pk).order_by('name', 'id')
         serializer = serializers.MenuItemSerializer(menuitems, many=True)
 
         # get actual objects from view
@@ -812,7 +1439,25 @@ class MenuItemListTest(APITestCase):
         self.assertEqual(self.response.status_code, 200)
 
         # compare the expected result with the actual result
-        self.assertEqual(self.response.data, serializer.data)
+        self.assertEqual(self.response.data['results'], serializer.data)
+
+    def test_request_get_method_list_objects_filtered_by_price(self):
+        MenuItem.objects.filter(pk=self.test_menuitems[0].pk).update(price=500)
+        MenuItem.objects.filter(pk=self.test_menuitems[1].pk) \
+            .update(price=1500)
+
+        self.response = self.client.get(
+            self.current_test_url, {'price_min': 100, 'price_max': 1000})
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(
+            [menuitem['id'] for menuitem in self.response.data['results']],
+            [self.test_menuitems[0].pk])
+
+    def test_request_get_method_list_objects_invalid_filter(self):
+        self.response = self.client.get(
+            self.current_test_url, {'price_min': 'cheap'})
+        self.assertEqual(self.response.status_code, 400)
+        self.assertIn('price_min', self.response.data)
 
     # request.POST
     def test_request_post_method_create_object_unauthenticated_user(self):
@@ -850,6 +1495,117 @@ class MenuItemListTest(APITestCase):
         self.assertEqual(self.response.data['name'], post_data['name'])
 
 
+class AllMenuItemListTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.view = views.AllMenuItemList
+        cls.current_test_url = reverse('api:all_menuitem_list')
+
+        # create model objects
+        cls.test_user = f.UserFactory()
+        cls.test_menusections = f.MenuSectionFactory.create_batch(size=2)
+        cls.cheap_menuitem = f.MenuItemFactory(
+            menusection=cls.test_menusections[0], name='Apple Pie',
+            price=500)
+        cls.expensive_menuitem = f.MenuItemFactory(
+            menusection=cls.test_menusections[0], name='Apple Tart',
+            price=2500)
+        cls.other_menuitem = f.MenuItemFactory(
+            menusection=cls.test_menusections[1], name='Apple Juice',
+            price=300)
+        cls.unpriced_menuitem = f.MenuItemFactory(
+            menusection=cls.test_menusections[1], name='Water')
+
+    def setUp(self):
+        self.client.login(username=self.test_user.username,
+                          password=c.TEST_USER_PASSWORD)
+
+    def get_result_ids(self, params):
+        self.response = self.client.get(self.current_test_url, params)
+        self.assertEqual(self.response.status_code, 200)
+        return [menuitem['id'] for menuitem in self.response.data['results']]
+
+    # view attributes
+    def test_view_name(self):
+        self.assertEqual(self.view.__name__, 'AllMenuItemList')
+
+    def test_view_parent_class(self):
+        self.assertEqual(self.view.__bases__[-1], generics.ListAPIView)
+
+    def test_permission_classes(self):
+        self.assertEqual(self.view.permission_classes, [IsAuthenticated])
+
+    def test_serializer_class(self):
+        self.assertEqual(
+            self.view.serializer_class, serializers.AllMenuItemSerializer)
+
+    def test_filter_backends(self):
+        self.assertEqual(self.view.filter_backends, [MenuItemFilterBackend])
+
+    # request.GET
+    def test_request_get_method_list_objects_unauthenticated_user(self):
+        self.client.logout()
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_request_get_method_list_objects(self):
+        # get expected objects from serializer
+        menuitems = MenuItem.objects.order_by('name', 'id')
+        serializer = serializers.AllMenuItemSerializer(menuitems, many=True)
+
+        # get actual objects from view
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+
+        # compare the expected result with the actual result
+        self.assertEqual(self.response.data['results'], serializer.data)
+
+    def test_request_get_method_list_objects_number_of_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.response = self.client.get(self.current_test_url)
+        self.assertEqual(len(self.response.data['results']), 4)
+        # the session, the user and the page of menu items
+        self.assertEqual(len(queries), 3)
+
+    def test_request_get_method_filter_price_range(self):
+        self.assertEqual(
+            self.get_result_ids({'price_min': 400, 'price_max': 2500}),
+            [self.cheap_menuitem.pk, self.expensive_menuitem.pk])
+
+    def test_request_get_method_filter_price_max_and_restaurant(self):
+        self.assertEqual(
+            self.get_result_ids({
+                'price_max': 1000,
+                'restaurant': self.cheap_menuitem.restaurant_id}),
+            [self.cheap_menuitem.pk])
+
+    def test_request_get_method_filter_menu(self):
+        self.assertEqual(
+            self.get_result_ids({'menu': self.other_menuitem.menu_id}),
+            [self.other_menuitem.pk, self.unpriced_menuitem.pk])
+
+    def test_request_get_method_filter_has_price(self):
+        self.assertEqual(
+            self.get_result_ids({'has_price': 'false'}),
+            [self.unpriced_menuitem.pk])
+        self.assertNotIn(
+            self.unpriced_menuitem.pk, self.get_result_ids({'has_price': 1}))
+
+    def test_request_get_method_filter_name_prefix(self):
+        self.assertEqual(
+            self.get_result_ids({'name_prefix': 'apple t'}),
+            [self.expensive_menuitem.pk])
+        self.assertEqual(
+            len(self.get_result_ids({'name_prefix': 'APPLE'})), 3)
+        self.assertEqual(self.get_result_ids({'name_prefix': 'pie'}), [])
+
+    def test_request_get_method_filter_invalid_price_range(self):
+        self.response = self.client.get(
+            self.current_test_url, {'price_min': 1000, 'price_max': 500})
+        self.assertEqual(self.response.status_code, 400)
+
+
 class MenuItemDetailTest(APITestCase):
 
     @classmethod
@@ -2,6 +2,7 @@ from django.urls import path
 from rest_framework.authtoken.views import obtain_auth_token
 
 from . import views
+from menus_project.async_views import as_async_api_view
 
 app_name = 'api'
 
@@ -20,33 +21,65 @@ urlpatterns = [
     path('users/is-email-available/<str:email>/',
          views.is_email_available,
          name='is_email_available'),
+    path('users/availability/',
+         views.check_availability,
+         name='check_availability'),
+
+    # export
+    path('export/<str:export_format>/',
+         views.MenuExport.as_view(),
+         name='menu_export'),
+
+    # instrumentation
+    path('stats/',
+         views.RequestStats.as_view(),
+         name='request_stats'),
+    path('jobs/stats/',
+         views.JobQueueStats.as_view(),
+         name='job_queue_stats'),
+
+    # search
+    path('search/',
+         as_async_api_view(views.Search),
+         name='search'),
+
+    # menu items of every restaurant
+    path('items/',
+         as_async_api_view(views.AllMenuItemList),
+         name='all_menuitem_list'),
 
     # restaurants
     path('restaurants/',
-         views.RestaurantList.as_view(),
+         as_async_api_view(views.RestaurantList),
          name='restaurant_list'),
     path('restaurants/<int:restaurant_pk>/',
-         views.RestaurantDetail.as_view(),
+         as_async_api_view(views.RestaurantDetail),
          name='restaurant_detail'),
     path('restaurants/<int:restaurant_pk>/menus/',
-         views.MenuList.as_view(),
+         as_async_api_view(views.MenuList),
          name='menu_list'),
+    path('restaurants/<int:restaurant_pk>/menus/import/',
+         views.MenuImport.as_view(),
+         name='menu_import'),
     path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/',
-         views.MenuDetail.as_view(),
+         as_async_api_view(views.MenuDetail),
          name='menu_detail'),
+    path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/full/',
+         as_async_api_view(views.MenuFull),
+         name='menu_full'),
     path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/sections/',
-         views.MenuSectionList.as_view(),
+         as_async_api_view(views.MenuSectionList),
          name='menusection_list'),
     path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/sections/'
          '<int:menusection_pk>/',
-         views.MenuSectionDetail.as_view(),
+         as_async_api_view(views.MenuSectionDetail),
          name='menusection_detail'),
     path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/sections/'
          '<int:menusection_pk>/items/',
-         views.MenuItemList.as_view(),
+         as_async_api_view(views.MenuItemList),
          name='menuitem_list'),
     path('restaurants/<int:restaurant_pk>/menus/<int:menu_pk>/sections/'
          '<int:menusection_pk>/items/<int:menuitem_pk>/',
-         views.MenuItemDetail.as_view(),
+         as_async_api_view(views.MenuItemDetail),
          name='menuitem_detail'),
     ]
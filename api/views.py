@@ -1,16 +1,42 @@
-from django.contrib.auth import get_user_model
-from django.http import HttpResponseRedirect, JsonResponse
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import (
+    FileResponse, Http404, HttpResponse, HttpResponseNotModified,
+    HttpResponseRedirect, JsonResponse, StreamingHttpResponse)
+from django.shortcuts import get_object_or_404
 from django.urls import reverse
-from rest_framework import generics
-from rest_framework.permissions import IsAuthenticated
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from drf_spectacular.views import SpectacularAPIView
+from rest_framework import generics, status
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
 
 from . import serializers
+from .availability import get_availability
+from .filters import MenuItemFilterBackend
 from .permissions import HasRestaurantPermissionsOrReadOnly
+from .schema import get_schema_document
+from .snapshots import get_menu_snapshot
+from menus_project.conditional import RestaurantObjectConditionalGetMixin
 from menus_project.constants import FRONTEND_SERVER_URL_CONFIRM_EMAIL
+from jobs.queue import get_queue_stats
+from menus_project.instrumentation import request_stats
+from menus_project.render_cache import render_cache_stats
 from restaurants.models import Restaurant
+from menus.export import (
+    EXPORT_CONTENT_TYPES, EXPORT_FORMATS, iter_export, write_export)
 from menus.models import Menu, MenuSection, MenuItem
+from search.index import search
 
-UserModel = get_user_model()
+AVAILABILITY_MAX_VALUES = 100
 
 
 def api_root(request):
@@ -22,26 +48,182 @@ def verify_email_view(request, key):
 
 
 def is_username_available(request, username):
-    if not UserModel.objects.filter(username=username).exists():
-        return JsonResponse({'isUsernameAvailable': True})
-    else:
-        return JsonResponse({'isUsernameAvailable': False})
+    return JsonResponse({
+        'isUsernameAvailable':
+            get_availability('username', [username])[username]})
 
 
 def is_email_available(request, email):
-    if not UserModel.objects.filter(email=email).exists():
-        return JsonResponse({'isEmailAvailable': True})
-    else:
-        return JsonResponse({'isEmailAvailable': False})
+    return JsonResponse({
+        'isEmailAvailable': get_availability('email', [email])[email]})
+
+
+def check_availability(request):
+    """
+    Return whether each of the 'username' and 'email' query parameters
+    (which may be given several times) is available, e.g.
+    ?username=alice&username=bob -> {"usernames": {"alice": true, ...}}
+    """
+    usernames = request.GET.getlist('username')
+    emails = request.GET.getlist('email')
+    if len(usernames) + len(emails) > AVAILABILITY_MAX_VALUES:
+        return JsonResponse(
+            {'detail': f"At most {AVAILABILITY_MAX_VALUES} usernames and "
+                       f"emails can be checked at once."},
+            status=400)
+    return JsonResponse({
+        'usernames': get_availability('username', usernames),
+        'emails': get_availability('email', emails),
+    })
+
+
+class MenuExport(APIView):
+    """
+    Stream every restaurant, menu, menu section and menu item as JSON Lines
+    or CSV (staff only).
+    """
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        parameters=[OpenApiParameter(
+            'export_format', str, OpenApiParameter.PATH,
+            enum=EXPORT_FORMATS)],
+        responses={(200, content_type): OpenApiTypes.BINARY
+                   for content_type in EXPORT_CONTENT_TYPES.values()})
+    def get(self, request, export_format):
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+        content_type = EXPORT_CONTENT_TYPES[export_format]
+        if isinstance(request._request, ASGIRequest):
+            # the ASGI handler iterates streaming responses in its event
+            # loop, where queries are not allowed, so the export is written
+            # to a temporary file first (here, in the sync thread)
+            export_file = tempfile.TemporaryFile()
+            write_export(export_format, export_file)
+            export_file.seek(0)
+            response = FileResponse(export_file, content_type=content_type)
+        else:
+            response = StreamingHttpResponse(
+                iter_export(export_format), content_type=content_type)
+        response['Content-Disposition'] = \
+            f'attachment; filename="menus.{export_format}"'
+        return response
+
+
+class RequestStats(APIView):
+    """
+    Show the query count and timings of this process' requests, per view,
+    and its render cache hits and misses (staff only). Requests are only
+    recorded when INSTRUMENTATION_ENABLED is set. A DELETE request resets
+    the statistics.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = serializers.RequestStatsSerializer
+
+    def get(self, request):
+        return Response({
+            'instrumentation_enabled': settings.INSTRUMENTATION_ENABLED,
+            'views': request_stats.get_summary(),
+            'render_cache': render_cache_stats.get_summary(),
+        })
+
+    def delete(self, request):
+        request_stats.reset()
+        render_cache_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class JobQueueStats(APIView):
+    """
+    Show the number of background jobs that are queued, scheduled for a
+    retry, running and failed, and the age of the oldest queued job, in
+    seconds (staff only).
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = serializers.JobQueueStatsSerializer
+
+    def get(self, request):
+        return Response(get_queue_stats())
+
+
+class Schema(SpectacularAPIView):
+    """
+    Serve the OpenAPI schema as YAML or JSON (see 'api.schema'), gzipped if
+    the client accepts it, and answer conditional requests with its ETag.
+    """
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        # translated schemas are not stored
+        if request.GET.get('lang'):
+            return super().get(request, *args, **kwargs)
+
+        renderer = request.accepted_renderer
+        document = get_schema_document(renderer.format)
+        gzipped = 'gzip' in request.headers.get('Accept-Encoding', '')
+        etag = document['gzipped_etag' if gzipped else 'etag']
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type += f'; charset={renderer.charset}'
+            response = HttpResponse(
+                document['gzipped_content' if gzipped else 'content'],
+                content_type=content_type)
+            if gzipped:
+                response['Content-Encoding'] = 'gzip'
+        response['ETag'] = etag
+        response['Cache-Control'] = 'no-cache'
+        patch_vary_headers(response, ['Accept', 'Accept-Encoding'])
+        return response
+
+
+class Search(APIView):
+    """
+    Search the names and descriptions of restaurants, menus, menu sections
+    and menu items, from the most relevant result.
+    """
+    serializer_class = serializers.SearchResultSerializer
+
+    def get(self, request):
+        query_serializer = \
+            serializers.SearchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        params = query_serializer.validated_data
+
+        # get one more result than needed to know if there is a next page
+        results = search(
+            params['q'], params.get('restaurant'), limit=params['limit'] + 1,
+            offset=params['offset'])
+        next_url = None
+        if len(results) > params['limit']:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), 'offset',
+                params['offset'] + params['limit'])
+
+        return Response({
+            'next': next_url,
+            'results': self.serializer_class(
+                results[:params['limit']], many=True).data,
+        })
 
 
 class RestaurantList(generics.ListCreateAPIView):
     permission_classes = [IsAuthenticated]
-    queryset = Restaurant.objects.all()
+    queryset = Restaurant.objects.prefetch_related('admin_users', 'menu_set')
     serializer_class = serializers.RestaurantSerializer
 
 
-class RestaurantDetail(generics.RetrieveUpdateDestroyAPIView):
+class RestaurantDetail(RestaurantObjectConditionalGetMixin,
+                       generics.RetrieveUpdateDestroyAPIView):
+    """
+    Retrieve, update or delete a restaurant.
+
+    GET requests with an If-None-Match or If-Modified-Since header are
+    answered with '304 Not Modified' while the restaurant is unchanged.
+    """
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'restaurant_pk'
     serializer_class = serializers.RestaurantSerializer
@@ -54,6 +236,7 @@ class MenuList(generics.ListCreateAPIView):
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'restaurant_pk'
     serializer_class = serializers.MenuSerializer
+    allow_unpaginated = True
 
     def check_permissions(self, request):
         super().check_permissions(request)
@@ -66,10 +249,51 @@ class MenuList(generics.ListCreateAPIView):
         return context
 
     def get_queryset(self):
-        return Menu.objects.filter(restaurant__pk=self.kwargs['restaurant_pk'])
+        return Menu.objects \
+            .filter(restaurant__pk=self.kwargs['restaurant_pk']) \
+            .select_related('restaurant').prefetch_related('menusection_set')
 
 
-class MenuDetail(generics.RetrieveUpdateDestroyAPIView):
+class MenuImport(generics.CreateAPIView):
+    permission_classes = [HasRestaurantPermissionsOrReadOnly]
+    serializer_class = serializers.MenuTreeImportSerializer
+
+    def check_permissions(self, request):
+        super().check_permissions(request)
+        self.restaurant = get_object_or_404(
+            Restaurant, pk=self.kwargs['restaurant_pk'])
+        super().check_object_permissions(request, self.restaurant)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['restaurant'] = self.restaurant
+        return context
+
+    def create(self, request, *args, **kwargs):
+        start_time = time.perf_counter()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        validation_time = time.perf_counter()
+        counts = serializer.save()
+        write_time = time.perf_counter()
+
+        return Response({
+            'created': counts,
+            'timings': {
+                'validation_ms':
+                    round((validation_time - start_time) * 1000, 2),
+                'write_ms': round((write_time - validation_time) * 1000, 2),
+            }}, status=status.HTTP_201_CREATED)
+
+
+class MenuDetail(RestaurantObjectConditionalGetMixin,
+                 generics.RetrieveUpdateDestroyAPIView):
+    """
+    Retrieve, update or delete a menu.
+
+    GET requests with an If-None-Match or If-Modified-Since header are
+    answered with '304 Not Modified' while the restaurant is unchanged.
+    """
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'menu_pk'
     serializer_class = serializers.MenuSerializer
@@ -78,10 +302,37 @@ class MenuDetail(generics.RetrieveUpdateDestroyAPIView):
         return Menu.objects.filter(pk=self.kwargs['menu_pk'])
 
 
+class MenuFull(APIView):
+    """
+    Return a menu with all of its sections and items.
+
+    The response is served from a stored JSON snapshot of the menu, which is
+    rebuilt after the menu or one of its descendants has changed.
+    """
+    permission_classes = [IsAuthenticated]
+    serializer_class = serializers.MenuFullSerializer
+
+    def get(self, request, restaurant_pk, menu_pk):
+        snapshot = get_menu_snapshot(restaurant_pk, menu_pk)
+        if snapshot is None:
+            raise Http404
+
+        if snapshot['etag'] in \
+                parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                snapshot['content'], content_type='application/json')
+        response['ETag'] = snapshot['etag']
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
 class MenuSectionList(generics.ListCreateAPIView):
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'menu_pk'
     serializer_class = serializers.MenuSectionSerializer
+    allow_unpaginated = True
 
     def check_permissions(self, request):
         super().check_permissions(request)
@@ -94,10 +345,19 @@ class MenuSectionList(generics.ListCreateAPIView):
         return context
 
     def get_queryset(self):
-        return MenuSection.objects.filter(menu__pk=self.kwargs['menu_pk'])
+        return MenuSection.objects.filter(menu__pk=self.kwargs['menu_pk']) \
+            .select_related('menu__restaurant') \
+            .prefetch_related('menuitem_set')
 
 
-class MenuSectionDetail(generics.RetrieveUpdateDestroyAPIView):
+class MenuSectionDetail(RestaurantObjectConditionalGetMixin,
+                        generics.RetrieveUpdateDestroyAPIView):
+    """
+    Retrieve, update or delete a menu section.
+
+    GET requests with an If-None-Match or If-Modified-Since header are
+    answered with '304 Not Modified' while the restaurant is unchanged.
+    """
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'menusection_pk'
     serializer_class = serializers.MenuSectionSerializer
@@ -110,6 +370,8 @@ class MenuItemList(generics.ListCreateAPIView):
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'menu_pk'
     serializer_class = serializers.MenuItemSerializer
+    filter_backends = [MenuItemFilterBackend]
+    allow_unpaginated = True
 
     def check_permissions(self, request):
         super().check_permissions(request)
@@ -123,10 +385,27 @@ class MenuItemList(generics.ListCreateAPIView):
 
     def get_queryset(self):
         return MenuItem.objects.filter(
-            menusection=self.kwargs['menusection_pk'])
+            menusection=self.kwargs['menusection_pk']) \
+            .select_related('menusection__menu__restaurant')
+
+
+class AllMenuItemList(generics.ListAPIView):
+    """The menu items of every restaurant, e.g. '?price_max=1000'."""
+    permission_classes = [IsAuthenticated]
+    queryset = MenuItem.objects \
+        .select_related('restaurant', 'menu', 'menusection')
+    serializer_class = serializers.AllMenuItemSerializer
+    filter_backends = [MenuItemFilterBackend]
+
 
+class MenuItemDetail(RestaurantObjectConditionalGetMixin,
+                     generics.RetrieveUpdateDestroyAPIView):
+    """
+    Retrieve, update or delete a menu item.
 
-class MenuItemDetail(generics.RetrieveUpdateDestroyAPIView):
+    GET requests with an If-None-Match or If-Modified-Since header are
+    answered with '304 Not Modified' while the restaurant is unchanged.
+    """
     permission_classes = [HasRestaurantPermissionsOrReadOnly]
     lookup_url_kwarg = 'menuitem_pk'
     serializer_class = serializers.MenuItemSerializer
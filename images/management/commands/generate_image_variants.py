@@ -0,0 +1,32 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from images.tasks import process_image
+from images.variants import IMAGE_MODELS
+
+
+class Command(BaseCommand):
+    help = "Generate the missing resized variants of every restaurant, " \
+        "menu and menu section image, e.g. for images that were uploaded " \
+        "before the variants existed, or after changing their widths."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true',
+            help="Regenerate the variants of every image")
+
+    def handle(self, *args, **options):
+        start_time = time.perf_counter()
+        count = 0
+        for model_label in IMAGE_MODELS:
+            model = apps.get_model(model_label)
+            pks = model.objects.exclude(image='').exclude(image=None) \
+                .order_by('pk').values_list('pk', flat=True)
+            for pk in pks.iterator():
+                process_image(model_label, pk, force=options['all'])
+                count += 1
+        self.stdout.write(self.style.SUCCESS(
+            f"Checked {count} images in "
+            f"{time.perf_counter() - start_time:.1f} s."))
@@ -0,0 +1,33 @@
+from django.db import transaction
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from .tasks import schedule_process_image
+from .variants import delete_variants
+from menus.models import Menu, MenuSection
+from restaurants.models import Restaurant
+
+
+@receiver(pre_save, sender=Restaurant)
+@receiver(pre_save, sender=Menu)
+@receiver(pre_save, sender=MenuSection)
+def image_pre_save(sender, instance, update_fields=None, **kwargs):
+    # forget the variants of an image that has been cleared
+    if update_fields is None and not instance.image \
+            and instance.image_variants:
+        image_variants = instance.image_variants
+        storage = instance.image.storage
+        transaction.on_commit(
+            lambda: delete_variants(storage, image_variants))
+        instance.image_variants = {}
+
+
+@receiver(post_save, sender=Restaurant)
+@receiver(post_save, sender=Menu)
+@receiver(post_save, sender=MenuSection)
+def image_post_save(sender, instance, update_fields=None, **kwargs):
+    if instance.image \
+            and (update_fields is None or 'image' in update_fields) \
+            and instance.image_variants.get('original') \
+            != instance.image.name:
+        schedule_process_image(instance)
@@ -0,0 +1,42 @@
+from django.apps import apps
+from django.db import transaction
+
+from .variants import delete_variants, generate_variants
+from jobs.queue import enqueue, task
+
+
+@task('images.process_image')
+def process_image(model_label, pk, force=False):
+    """
+    Generate the variants of an object's image, unless they have already been
+    generated, and store them in the object's 'image_variants' field.
+
+    The object is saved (which invalidates its cached pages) only if its
+    image has not been replaced in the meantime.
+    """
+    model = apps.get_model(model_label)
+    obj = model.objects.filter(pk=pk).first()
+    if obj is None or not obj.image or not force \
+            and obj.image_variants.get('original') == obj.image.name:
+        return
+    storage = obj.image.storage
+    name = obj.image.name
+    image_variants = generate_variants(obj.image)
+
+    with transaction.atomic():
+        obj = model.objects.select_for_update().filter(pk=pk).first()
+        if obj is None or obj.image.name != name:
+            delete_variants(storage, image_variants)
+            return
+        old_image_variants = obj.image_variants
+        obj.image_variants = image_variants
+        obj.save(update_fields=['image_variants', 'updated_at'])
+    # the variants of a previous image are replaced
+    delete_variants(storage, old_image_variants, keep={
+        variant['name'] for variant in image_variants['variants']})
+
+
+def schedule_process_image(instance):
+    """Generate the variants of an object's image in a background job."""
+    enqueue('images.process_image',
+            model_label=instance._meta.label, pk=instance.pk)
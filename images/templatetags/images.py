@@ -0,0 +1,42 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+
+from images.variants import get_current_variants
+
+register = template.Library()
+
+
+@register.simple_tag
+def responsive_image(obj, sizes='100vw', **attrs):
+    """
+    Return a <picture> element for the image of a restaurant, menu or menu
+    section, with a 'srcset' of its WebP variants and another one of its
+    JPEG variants, so that browsers download the smallest image that fills
+    the given 'sizes'. The other arguments are added to the <img> element,
+    e.g. {% responsive_image restaurant sizes="50vw" class="restaurant-img" %}
+
+    Until the variants have been generated, the original image is used.
+    """
+    if not obj.image:
+        return ''
+    variants = get_current_variants(obj.image, obj.image_variants)
+    if not variants:
+        return format_html('<img src="{}"{}>', obj.image.url, flatatt(attrs))
+
+    storage = obj.image.storage
+    srcsets = {}
+    for variant in variants:
+        srcsets.setdefault(variant['format'], []).append(
+            f"{storage.url(variant['name'])} {variant['width']}w")
+    largest_jpeg = max(
+        (variant for variant in variants if variant['format'] == 'jpeg'),
+        key=lambda variant: variant['width'])
+    return format_html(
+        '<picture>'
+        '<source type="image/webp" srcset="{}" sizes="{}">'
+        '<img src="{}" srcset="{}" sizes="{}"{}>'
+        '</picture>',
+        ', '.join(srcsets['webp']), sizes,
+        storage.url(largest_jpeg['name']), ', '.join(srcsets['jpeg']), sizes,
+        flatatt(attrs))
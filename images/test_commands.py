@@ -0,0 +1,37 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from .test_variants import MediaRootMixin, get_test_image
+from menus_project import factories as f
+
+
+class GenerateImageVariantsCommandTest(MediaRootMixin, TestCase):
+
+    def setUp(self):
+        # images whose variants have not been generated yet
+        self.restaurant = f.RestaurantFactory()
+        self.menu = f.MenuFactory()
+        with self.settings(JOBS_RUN_IMMEDIATELY=False):
+            for obj in (self.restaurant, self.menu):
+                obj.image = get_test_image()
+                obj.save()
+
+    def test_command_generates_missing_variants(self):
+        stdout = StringIO()
+        call_command('generate_image_variants', stdout=stdout)
+        self.assertIn("Checked 2 images", stdout.getvalue())
+
+        for obj in (self.restaurant, self.menu):
+            obj.refresh_from_db()
+            self.assertEqual(obj.image_variants['original'], obj.image.name)
+
+    def test_command_all_regenerates_variants(self):
+        call_command('generate_image_variants', stdout=StringIO())
+        self.restaurant.refresh_from_db()
+        old_updated_at = self.restaurant.updated_at
+
+        call_command('generate_image_variants', '--all', stdout=StringIO())
+        self.restaurant.refresh_from_db()
+        self.assertGreater(self.restaurant.updated_at, old_updated_at)
@@ -0,0 +1,47 @@
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+
+from .test_variants import MediaRootMixin, get_test_image
+from menus_project import factories as f
+
+
+@override_settings(IMAGE_VARIANT_WIDTHS=[320, 640])
+class ResponsiveImageTest(MediaRootMixin, TestCase):
+
+    def setUp(self):
+        self.restaurant = f.RestaurantFactory()
+
+    def render(self, template_string):
+        return Template('{% load images %}' + template_string) \
+            .render(Context({'restaurant': self.restaurant}))
+
+    def test_no_image(self):
+        self.assertEqual(self.render('{% responsive_image restaurant %}'), '')
+
+    def test_image_without_variants(self):
+        self.restaurant.image = get_test_image()
+        # the variants are generated later, by a worker
+        with self.settings(JOBS_RUN_IMMEDIATELY=False):
+            self.restaurant.save()
+        self.assertHTMLEqual(
+            self.render(
+                '{% responsive_image restaurant class="restaurant-img" %}'),
+            f'<img src="{self.restaurant.image.url}" class="restaurant-img">')
+
+    def test_image_with_variants(self):
+        self.restaurant.image = get_test_image()
+        self.restaurant.save()
+        self.restaurant.refresh_from_db()
+        base_url = self.restaurant.image.url.rsplit('.', 1)[0]
+
+        self.assertHTMLEqual(
+            self.render(
+                '{% responsive_image restaurant sizes="50vw" '
+                'class="restaurant-img" %}'),
+            f'<picture>'
+            f'<source type="image/webp" srcset="{base_url}-320w.webp 320w, '
+            f'{base_url}-640w.webp 640w" sizes="50vw">'
+            f'<img src="{base_url}-640w.jpg" srcset="{base_url}-320w.jpg '
+            f'320w, {base_url}-640w.jpg 640w" sizes="50vw" '
+            f'class="restaurant-img">'
+            f'</picture>')
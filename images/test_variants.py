@@ -0,0 +1,210 @@
+import io
+import shutil
+import tempfile
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from .tasks import process_image
+from .variants import (
+    delete_variants, generate_variants, get_current_variants,
+    get_variant_name, get_variant_widths)
+from jobs.models import Job
+from menus_project import factories as f
+from menus_project import render_cache
+from restaurants.models import Restaurant
+
+
+def get_test_image(size=(1000, 500), mode='RGB', image_format='PNG',
+                   name='image.png'):
+    output = io.BytesIO()
+    Image.new(mode, size).save(output, image_format)
+    return SimpleUploadedFile(name, output.getvalue())
+
+
+class MediaRootMixin:
+    """Save the uploaded files of a test case in a temporary directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_root_override = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_root_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.media_root_override.disable()
+        shutil.rmtree(cls.media_root)
+
+
+@override_settings(IMAGE_VARIANT_WIDTHS=[320, 640, 1280])
+class VariantsTest(MediaRootMixin, TestCase):
+
+    def setUp(self):
+        self.restaurant = f.RestaurantFactory()
+
+    def set_image(self, image):
+        self.restaurant.image = image
+        # the files of cleared images are deleted after the commit
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.save()
+        self.restaurant.refresh_from_db()
+
+    def get_image_size(self, name):
+        with default_storage.open(name) as image_file:
+            return Image.open(image_file).size
+
+    def test_get_variant_name(self):
+        self.assertEqual(
+            get_variant_name('img/restaurants/1.png', 320, 'webp'),
+            'img/restaurants/1-320w.webp')
+
+    def test_get_variant_widths_does_not_enlarge_images(self):
+        self.assertEqual(get_variant_widths(2000), [320, 640, 1280])
+        self.assertEqual(get_variant_widths(500), [320, 500])
+        self.assertEqual(get_variant_widths(100), [100])
+
+    def test_generate_variants(self):
+        self.restaurant.image = get_test_image()
+        self.restaurant.save()
+        image_variants = generate_variants(self.restaurant.image)
+
+        self.assertEqual(
+            image_variants['original'], self.restaurant.image.name)
+        self.assertEqual(image_variants['width'], 1000)
+        self.assertEqual(
+            [(variant['format'], variant['width'])
+             for variant in image_variants['variants']],
+            [('webp', 320), ('jpeg', 320), ('webp', 640), ('jpeg', 640),
+             ('webp', 1000), ('jpeg', 1000)])
+        # the aspect ratio is kept
+        self.assertEqual(
+            self.get_image_size(image_variants['variants'][0]['name']),
+            (320, 160))
+
+    def test_generate_variants_of_transparent_image(self):
+        self.restaurant.image = get_test_image(size=(200, 100), mode='RGBA')
+        self.restaurant.save()
+        image_variants = generate_variants(self.restaurant.image)
+        self.assertEqual(len(image_variants['variants']), 2)
+
+    def test_saving_an_image_generates_its_variants(self):
+        self.set_image(get_test_image())
+        self.assertEqual(
+            self.restaurant.image_variants['original'],
+            self.restaurant.image.name)
+        for variant in self.restaurant.image_variants['variants']:
+            self.assertTrue(default_storage.exists(variant['name']))
+
+    def test_replacing_an_image_deletes_the_old_variants(self):
+        self.set_image(get_test_image())
+        old_image_variants = self.restaurant.image_variants
+        self.set_image(get_test_image(size=(200, 100), name='image.jpg'))
+
+        self.assertEqual(len(self.restaurant.image_variants['variants']), 2)
+        for variant in old_image_variants['variants']:
+            self.assertFalse(default_storage.exists(variant['name']))
+
+    def test_clearing_an_image_deletes_its_variants(self):
+        self.set_image(get_test_image())
+        old_image_variants = self.restaurant.image_variants
+        self.set_image(None)
+
+        self.assertEqual(self.restaurant.image_variants, {})
+        for variant in old_image_variants['variants']:
+            self.assertFalse(default_storage.exists(variant['name']))
+
+    def test_deleting_a_restaurant_deletes_its_variants(self):
+        self.set_image(get_test_image())
+        image_variants = self.restaurant.image_variants
+        self.restaurant.delete()
+        for variant in image_variants['variants']:
+            self.assertFalse(default_storage.exists(variant['name']))
+
+    def test_process_image_skips_images_with_variants(self):
+        self.set_image(get_test_image())
+        with self.assertNumQueries(1):
+            process_image('restaurants.Restaurant', self.restaurant.pk)
+
+    def test_process_image_of_menusection(self):
+        menusection = f.MenuSectionFactory()
+        menusection.image = get_test_image()
+        menusection.save()
+        menusection.refresh_from_db()
+        self.assertEqual(
+            menusection.image_variants['original'], menusection.image.name)
+
+    def test_saving_an_image_enqueues_a_job(self):
+        self.restaurant.image = get_test_image()
+        with self.settings(JOBS_RUN_IMMEDIATELY=False):
+            self.restaurant.save()
+        job = Job.objects.get()
+        self.assertEqual(job.task, 'images.process_image')
+        self.assertEqual(
+            job.kwargs,
+            {'model_label': 'restaurants.Restaurant',
+             'pk': self.restaurant.pk})
+
+    def test_process_image_saves_the_restaurant(self):
+        self.restaurant.image = get_test_image()
+        with self.settings(JOBS_RUN_IMMEDIATELY=False):
+            self.restaurant.save()
+        old_updated_at = self.restaurant.updated_at
+
+        process_image('restaurants.Restaurant', self.restaurant.pk)
+        self.restaurant.refresh_from_db()
+        # e.g. the cached pages of the restaurant are invalidated
+        self.assertGreater(self.restaurant.updated_at, old_updated_at)
+
+    def test_process_image_invalidates_cached_pages_on_commit(self):
+        self.restaurant.image = get_test_image()
+        with self.settings(JOBS_RUN_IMMEDIATELY=False):
+            self.restaurant.save()
+        generation = render_cache.get_restaurant_generation(
+            self.restaurant.slug)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            process_image('restaurants.Restaurant', self.restaurant.pk)
+            # pages cached before the variants are committed are stale
+            self.assertGreater(
+                render_cache.get_restaurant_generation(self.restaurant.slug),
+                generation)
+            generation = render_cache.get_restaurant_generation(
+                self.restaurant.slug)
+        self.assertGreater(
+            render_cache.get_restaurant_generation(self.restaurant.slug),
+            generation)
+
+    def test_get_current_variants(self):
+        self.set_image(get_test_image())
+        self.assertEqual(
+            get_current_variants(
+                self.restaurant.image, self.restaurant.image_variants),
+            self.restaurant.image_variants['variants'])
+
+        # the variants of another image are ignored
+        self.restaurant.image.name = 'img/restaurants/other.png'
+        self.assertEqual(
+            get_current_variants(
+                self.restaurant.image, self.restaurant.image_variants), [])
+
+    def test_delete_variants_keeps_the_given_names(self):
+        self.set_image(get_test_image())
+        variants = self.restaurant.image_variants['variants']
+        delete_variants(
+            default_storage, self.restaurant.image_variants,
+            keep={variants[0]['name']})
+        self.assertTrue(default_storage.exists(variants[0]['name']))
+        self.assertFalse(default_storage.exists(variants[1]['name']))
+
+
+class ImageModelsTest(TestCase):
+
+    def test_image_variants_default(self):
+        self.assertEqual(f.RestaurantFactory().image_variants, {})
+        self.assertFalse(
+            Restaurant._meta.get_field('image_variants').editable)
@@ -0,0 +1,94 @@
+import io
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+# the models whose 'image' field has variants
+IMAGE_MODELS = ['restaurants.Restaurant', 'menus.Menu', 'menus.MenuSection']
+
+# the formats of the variants, and their content types and file extensions
+FORMATS = {
+    'webp': ('image/webp', '.webp'),
+    'jpeg': ('image/jpeg', '.jpg'),
+}
+
+
+def get_variant_name(name, width, image_format):
+    """Return the file name of a variant, next to the original image."""
+    base, extension = os.path.splitext(name)
+    return f"{base}-{width}w{FORMATS[image_format][1]}"
+
+
+def get_variant_widths(original_width):
+    # images are never enlarged, so small images get a single width
+    return sorted({min(width, original_width)
+                   for width in settings.IMAGE_VARIANT_WIDTHS})
+
+
+def encode(image, image_format):
+    if image_format == 'jpeg' and image.mode == 'RGBA':
+        # JPEG has no transparency, so transparent areas become white
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A'))
+        image = background
+    output = io.BytesIO()
+    image.save(output, image_format.upper(),
+               quality=settings.IMAGE_VARIANT_QUALITY)
+    return output.getvalue()
+
+
+def generate_variants(image_field):
+    """
+    Save a resized WebP and JPEG copy of an image at each width in
+    IMAGE_VARIANT_WIDTHS, next to the original, and return a description of
+    the variants, which is stored in the model's 'image_variants' field:
+
+        {'original': 'img/restaurants/1.png', 'width': 1600,
+         'variants': [{'format': 'webp', 'width': 320,
+                       'name': 'img/restaurants/1-320w.webp'}, ...]}
+    """
+    storage = image_field.storage
+    with storage.open(image_field.name) as f:
+        image = Image.open(f)
+        # apply the camera's orientation, which is lost when resizing
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+
+    variants = []
+    for width in get_variant_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.LANCZOS) \
+            if width != image.width else image
+        for image_format in FORMATS:
+            name = get_variant_name(image_field.name, width, image_format)
+            if storage.exists(name):
+                storage.delete(name)
+            name = storage.save(
+                name, ContentFile(encode(resized, image_format)))
+            variants.append(
+                {'format': image_format, 'width': width, 'name': name})
+    return {'original': image_field.name, 'width': image.width,
+            'variants': variants}
+
+
+def get_current_variants(image_field, image_variants):
+    """
+    Return the variants of the image that is currently in the field, or an
+    empty list if they have not been generated yet.
+    """
+    if not image_field or not image_variants \
+            or image_variants.get('original') != image_field.name:
+        return []
+    return image_variants['variants']
+
+
+def delete_variants(storage, image_variants, keep=()):
+    """Delete the files of the given variants, except the ones in 'keep'."""
+    for variant in (image_variants or {}).get('variants', []):
+        if variant['name'] not in keep:
+            storage.delete(variant['name'])
@@ -0,0 +1,13 @@
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('task', 'status', 'attempts', 'run_at', 'pk')
+    list_filter = ('status', 'task')
+    readonly_fields = ['attempts', 'started_at', 'last_error', 'created_at']
+
+    class Meta:
+        model = Job
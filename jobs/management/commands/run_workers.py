@@ -0,0 +1,64 @@
+import multiprocessing
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from jobs.queue import get_queue_stats
+from jobs.worker import run_worker, run_worker_process
+
+
+class Command(BaseCommand):
+    help = "Run the background jobs (e.g. sending emails and resizing " \
+        "images) in a pool of worker processes, until interrupted."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', type=int, default=settings.JOBS_WORKER_PROCESSES,
+            help="Number of worker processes")
+        parser.add_argument(
+            '--poll-interval', type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help="Seconds between checks of an empty queue")
+        parser.add_argument(
+            '--burst', action='store_true',
+            help="Run the jobs that are due in this process, then exit")
+
+    def handle(self, *args, **options):
+        if options['burst']:
+            count = run_worker(threading.Event(), 0, burst=True)
+            self.stdout.write(self.style.SUCCESS(
+                f"Ran {count} jobs. Queue: {self.format_stats()}"))
+            return
+
+        if options['processes'] < 1:
+            raise CommandError("There must be at least 1 worker process.")
+        self.stdout.write(
+            f"Starting {options['processes']} workers. "
+            f"Queue: {self.format_stats()}")
+        # the database connection must not be shared with the workers
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        stop_event = context.Event()
+        processes = [
+            context.Process(
+                target=run_worker_process, name=f'worker-{i + 1}',
+                args=(stop_event, options['poll_interval']))
+            for i in range(options['processes'])]
+        for process in processes:
+            process.start()
+
+        def stop(signum, frame):
+            self.stdout.write("Stopping the workers...")
+            stop_event.set()
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+        for process in processes:
+            process.join()
+        self.stdout.write(self.style.SUCCESS("The workers have stopped."))
+
+    def format_stats(self):
+        return ', '.join(
+            f"{key}: {value}" for key, value in get_queue_stats().items())
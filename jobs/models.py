@@ -0,0 +1,42 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A call of a task (see the 'queue' module) that is waiting to be run by
+    a worker process, or that has failed too many times.
+
+    Jobs are deleted as soon as they have been run successfully.
+    """
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (FAILED, "Failed")]
+
+    task = models.CharField(max_length=128)
+    kwargs = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField()
+    # the job is not run before this time (e.g. when it is retried)
+    run_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # used by the workers to find the next job
+            models.Index(
+                fields=['status', 'run_at', 'id'],
+                name='job_status_run_at_id_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} ({self.status})"
@@ -0,0 +1,150 @@
+import datetime
+import logging
+import traceback
+
+from django.conf import settings
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+# the registered tasks, by name
+TASKS = {}
+
+
+def task(name):
+    """
+    Register a function as a task, which can be run by the workers with
+    enqueue(name, **kwargs). The arguments must be JSON serializable.
+
+    Tasks are registered when the 'tasks' module of each app is imported.
+    """
+    def decorator(func):
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, max_attempts=None, run_at=None, **kwargs):
+    """
+    Add a job to the queue, or run it right away if JOBS_RUN_IMMEDIATELY is
+    set (e.g. in the tests).
+
+    The job is saved in the current transaction, so it is only run if the
+    transaction is committed.
+    """
+    if name not in TASKS:
+        raise LookupError(f"There is no task named '{name}'.")
+    if settings.JOBS_RUN_IMMEDIATELY:
+        TASKS[name](**kwargs)
+        return None
+    return Job.objects.create(
+        task=name, kwargs=kwargs,
+        max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+        run_at=run_at or timezone.now())
+
+
+def get_retry_delay(attempts):
+    """Return the delay before a job is retried, which doubles each time."""
+    return datetime.timedelta(
+        seconds=settings.JOBS_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_next_job():
+    """
+    Mark the next job that is due as running, and return it (or None).
+
+    Jobs that have been running for longer than JOBS_TIMEOUT (e.g. because
+    their worker has been killed) are claimed again. A job is claimed with
+    a conditional UPDATE, so that two workers never run the same job, even on
+    databases without SELECT ... FOR UPDATE.
+    """
+    now = timezone.now()
+    due_jobs = Job.objects \
+        .filter(Q(status=Job.QUEUED, run_at__lte=now)
+                | Q(status=Job.RUNNING,
+                    started_at__lt=now - datetime.timedelta(
+                        seconds=settings.JOBS_TIMEOUT))) \
+        .order_by('run_at', 'id')
+    # another worker may claim the same job first
+    for i in range(10):
+        job = due_jobs.first()
+        if job is None:
+            return None
+        claimed = Job.objects \
+            .filter(pk=job.pk, status=job.status, attempts=job.attempts) \
+            .update(status=Job.RUNNING, started_at=now,
+                    attempts=F('attempts') + 1)
+        if claimed:
+            job.status = Job.RUNNING
+            job.started_at = now
+            job.attempts += 1
+            return job
+    return None
+
+
+def run_job(job):
+    """
+    Run a claimed job, and return True if it has succeeded. A job that has
+    failed is retried later, until it has been attempted max_attempts times.
+    """
+    try:
+        if job.attempts > job.max_attempts:
+            raise TimeoutError("The job has timed out too many times.")
+        func = TASKS.get(job.task)
+        if func is None:
+            raise LookupError(f"There is no task named '{job.task}'.")
+        func(**job.kwargs)
+    except Exception:
+        error = traceback.format_exc()
+        jobs = Job.objects.filter(pk=job.pk)
+        if job.attempts >= job.max_attempts:
+            logger.error("Job %s (%s) has failed:\n%s",
+                         job.pk, job.task, error)
+            jobs.update(status=Job.FAILED, last_error=error)
+        else:
+            logger.warning(
+                "Job %s (%s) has failed and will be retried:\n%s",
+                job.pk, job.task, error)
+            jobs.update(
+                status=Job.QUEUED, last_error=error,
+                run_at=timezone.now() + get_retry_delay(job.attempts))
+        return False
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def run_next_job():
+    """
+    Run the next job that is due, and return the job (or None if no job is
+    due).
+    """
+    job = claim_next_job()
+    if job is not None:
+        run_job(job)
+    return job
+
+
+def get_queue_stats():
+    """
+    Return the number of jobs that are due ('queued'), waiting for a later
+    time ('scheduled', e.g. retries), running and failed, and how long the
+    oldest due job has been waiting, in seconds.
+    """
+    now = timezone.now()
+    counts = dict(Job.objects.order_by().values_list('status')
+                  .annotate(Count('id')))
+    due_jobs = Job.objects.filter(status=Job.QUEUED, run_at__lte=now) \
+        .aggregate(count=Count('id'), oldest_run_at=Min('run_at'))
+    oldest_run_at = due_jobs['oldest_run_at']
+    return {
+        'queued': due_jobs['count'],
+        'scheduled': counts.get(Job.QUEUED, 0) - due_jobs['count'],
+        'running': counts.get(Job.RUNNING, 0),
+        'failed': counts.get(Job.FAILED, 0),
+        'oldest_queued_seconds':
+            round((now - oldest_run_at).total_seconds(), 1)
+            if oldest_run_at else None,
+    }
@@ -0,0 +1,31 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+
+from .models import Job
+from .queue import enqueue
+from .test_queue import calls
+
+
+@override_settings(JOBS_RUN_IMMEDIATELY=False)
+class RunWorkersCommandTest(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_command_burst_runs_due_jobs(self):
+        enqueue('jobs.test_append', value=1)
+        enqueue('jobs.test_append', value=2)
+
+        stdout = StringIO()
+        call_command('run_workers', '--burst', stdout=stdout)
+        self.assertIn("Ran 2 jobs.", stdout.getvalue())
+        self.assertIn("queued: 0", stdout.getvalue())
+        self.assertEqual(calls, [1, 2])
+        self.assertFalse(Job.objects.exists())
+
+    def test_command_requires_a_process(self):
+        with self.assertRaises(CommandError):
+            call_command('run_workers', '--processes', '0', stdout=StringIO())
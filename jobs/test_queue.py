@@ -0,0 +1,141 @@
+import datetime
+import threading
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from .models import Job
+from .queue import (
+    claim_next_job, enqueue, get_queue_stats, get_retry_delay, run_next_job,
+    task)
+from .worker import run_worker
+
+calls = []
+
+
+@task('jobs.test_append')
+def append(value):
+    calls.append(value)
+
+
+@task('jobs.test_fail')
+def fail():
+    raise ValueError("This task always fails.")
+
+
+@override_settings(
+    JOBS_RUN_IMMEDIATELY=False, JOBS_MAX_ATTEMPTS=3, JOBS_RETRY_DELAY=10,
+    JOBS_TIMEOUT=60)
+class QueueTest(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_unknown_task(self):
+        with self.assertRaises(LookupError):
+            enqueue('jobs.unknown')
+
+    def test_enqueue(self):
+        job = enqueue('jobs.test_append', value=1)
+        self.assertEqual(job.task, 'jobs.test_append')
+        self.assertEqual(job.kwargs, {'value': 1})
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertEqual(job.max_attempts, 3)
+        # the job is not run yet
+        self.assertEqual(calls, [])
+
+    def test_enqueue_run_immediately(self):
+        with self.settings(JOBS_RUN_IMMEDIATELY=True):
+            self.assertIsNone(enqueue('jobs.test_append', value=1))
+        self.assertEqual(calls, [1])
+        self.assertFalse(Job.objects.exists())
+
+    def test_run_next_job(self):
+        job = enqueue('jobs.test_append', value=1)
+        self.assertEqual(run_next_job().pk, job.pk)
+        self.assertEqual(calls, [1])
+        # successful jobs are deleted
+        self.assertFalse(Job.objects.exists())
+
+    def test_run_next_job_empty_queue(self):
+        self.assertIsNone(run_next_job())
+
+    def test_jobs_are_run_in_order(self):
+        enqueue('jobs.test_append', value=1)
+        enqueue('jobs.test_append', value=2,
+                run_at=timezone.now() - datetime.timedelta(minutes=1))
+        run_next_job()
+        run_next_job()
+        self.assertEqual(calls, [2, 1])
+
+    def test_jobs_are_not_run_before_run_at(self):
+        enqueue('jobs.test_append', value=1,
+                run_at=timezone.now() + datetime.timedelta(minutes=1))
+        self.assertIsNone(run_next_job())
+
+    def test_claimed_job_is_not_claimed_again(self):
+        enqueue('jobs.test_append', value=1)
+        self.assertIsNotNone(claim_next_job())
+        self.assertIsNone(claim_next_job())
+
+    def test_timed_out_job_is_claimed_again(self):
+        job = enqueue('jobs.test_append', value=1)
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING, attempts=1,
+            started_at=timezone.now() - datetime.timedelta(minutes=2))
+        job = claim_next_job()
+        self.assertEqual(job.attempts, 2)
+
+    def test_failed_job_is_retried_later(self):
+        job = enqueue('jobs.test_fail')
+        with self.assertLogs('jobs.queue', 'WARNING'):
+            run_next_job()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn("This task always fails.", job.last_error)
+        self.assertGreater(
+            job.run_at, timezone.now() + datetime.timedelta(seconds=5))
+
+    def test_failed_job_fails_after_max_attempts(self):
+        job = enqueue('jobs.test_fail', max_attempts=1)
+        with self.assertLogs('jobs.queue', 'ERROR'):
+            run_next_job()
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertIsNone(run_next_job())
+
+    def test_get_retry_delay(self):
+        self.assertEqual(get_retry_delay(1).total_seconds(), 10)
+        self.assertEqual(get_retry_delay(2).total_seconds(), 20)
+        self.assertEqual(get_retry_delay(3).total_seconds(), 40)
+
+    def test_get_queue_stats(self):
+        self.assertEqual(get_queue_stats(), {
+            'queued': 0, 'scheduled': 0, 'running': 0, 'failed': 0,
+            'oldest_queued_seconds': None})
+
+        enqueue('jobs.test_append', value=1,
+                run_at=timezone.now() - datetime.timedelta(minutes=1))
+        enqueue('jobs.test_append', value=2,
+                run_at=timezone.now() + datetime.timedelta(minutes=1))
+        Job.objects.create(
+            task='jobs.test_fail', max_attempts=1, status=Job.FAILED)
+        stats = get_queue_stats()
+        self.assertEqual(stats['queued'], 1)
+        self.assertEqual(stats['scheduled'], 1)
+        self.assertEqual(stats['failed'], 1)
+        self.assertGreaterEqual(stats['oldest_queued_seconds'], 60)
+
+    def test_run_worker_burst(self):
+        enqueue('jobs.test_append', value=1)
+        enqueue('jobs.test_append', value=2)
+        self.assertEqual(run_worker(threading.Event(), 0, burst=True), 2)
+        self.assertEqual(calls, [1, 2])
+
+    def test_run_worker_stops(self):
+        stop_event = threading.Event()
+        stop_event.set()
+        enqueue('jobs.test_append', value=1)
+        self.assertEqual(run_worker(stop_event, 0), 0)
@@ -0,0 +1,38 @@
+import logging
+import signal
+
+from django.db import connections
+
+from .queue import run_next_job
+
+logger = logging.getLogger(__name__)
+
+
+def run_worker(stop_event, poll_interval, burst=False):
+    """
+    Run the jobs that are due, one at a time, until stop_event is set (or,
+    in burst mode, until no job is due), and return the number of jobs that
+    have been run. When no job is due, the queue is polled again after
+    poll_interval seconds.
+    """
+    count = 0
+    try:
+        while not stop_event.is_set():
+            if run_next_job() is not None:
+                count += 1
+            elif burst:
+                break
+            else:
+                stop_event.wait(poll_interval)
+    finally:
+        connections.close_all()
+    return count
+
+
+def run_worker_process(stop_event, poll_interval):
+    # the parent process stops the workers once their current job is done
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+    logger.info("Worker started.")
+    run_worker(stop_event, poll_interval)
+    logger.info("Worker stopped.")
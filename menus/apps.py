@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class MenusConfig(AppConfig):
     name = 'menus'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from menus_project import checks  # noqa: F401
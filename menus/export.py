@@ -0,0 +1,72 @@
+import csv
+import json
+
+from restaurants.models import Restaurant
+from .models import Menu, MenuSection, MenuItem
+
+CHUNK_SIZE = 2000
+EXPORT_FORMATS = ['jsonl', 'csv']
+EXPORT_CONTENT_TYPES = {'jsonl': 'application/jsonl', 'csv': 'text/csv'}
+
+# the fields of each exported record ('type' is the name of the model)
+EXPORT_FIELDS = ['type', 'id', 'restaurant_id', 'menu_id', 'menusection_id',
+                 'name', 'slug', 'description', 'note', 'theme', 'price']
+EXPORT_QUERYSETS = [
+    ('restaurant', Restaurant.objects.order_by('pk'),
+     ['id', 'name', 'slug']),
+    ('menu', Menu.objects.order_by('pk'),
+     ['id', 'restaurant_id', 'name', 'slug', 'description', 'theme']),
+    ('menusection', MenuSection.objects.order_by('pk'),
+     ['id', 'restaurant_id', 'menu_id', 'name', 'slug', 'note']),
+    ('menuitem', MenuItem.objects.order_by('pk'),
+     ['id', 'restaurant_id', 'menu_id', 'menusection_id', 'name', 'slug',
+      'description', 'price']),
+]
+
+
+def iter_export_records(chunk_size=CHUNK_SIZE):
+    """
+    Yield a flat record (dict) for every restaurant, menu, menu section and
+    menu item in the database, in that order. Rows are fetched in chunks, so
+    memory use does not depend on the size of the database.
+    """
+    for type_name, queryset, fields in EXPORT_QUERYSETS:
+        rows = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+        for row in rows:
+            yield {'type': type_name, **dict(zip(fields, row))}
+
+
+def iter_jsonl(records):
+    for record in records:
+        yield json.dumps(record) + '\n'
+
+
+class Echo:
+    """A file-like object that returns the written value instead of storing
+    it, so that csv.writer can be used in a generator."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(records):
+    writer = csv.DictWriter(Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+    for record in records:
+        yield writer.writerow(record)
+
+
+def iter_export(export_format, chunk_size=CHUNK_SIZE):
+    records = iter_export_records(chunk_size)
+    if export_format == 'jsonl':
+        return iter_jsonl(records)
+    elif export_format == 'csv':
+        return iter_csv(records)
+    raise ValueError(
+        f"Export format must be one of: {', '.join(EXPORT_FORMATS)}")
+
+
+def write_export(export_format, export_file, chunk_size=CHUNK_SIZE):
+    """Write an export to a file that is opened in binary mode."""
+    for chunk in iter_export(export_format, chunk_size):
+        export_file.write(chunk.encode('utf-8'))
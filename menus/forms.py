@@ -1,24 +1,40 @@
 from django import forms
+from django.core.exceptions import ValidationError
 from django.forms import ModelForm
 
-from .models import Menu, MenuSection, MenuItem
+from .models import Menu, MenuSection, MenuItem, validate_unique_slug
 
 
-class MenuForm(ModelForm):
+class UniqueSlugModelForm(ModelForm):
+    """
+    Validate the unique slug constraints of the model, even though the slug
+    (which is generated from the name) is not one of the form's fields.
+    """
+
+    def validate_unique(self):
+        exclude = [field for field in self._get_validation_exclusions()
+                   if field != 'slug']
+        try:
+            validate_unique_slug(self.instance, exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
+
+
+class MenuForm(UniqueSlugModelForm):
     class Meta:
         model = Menu
         fields = ['restaurant', 'name', 'description', 'image']
         widgets = {'restaurant': forms.HiddenInput()}
 
 
-class MenuSectionForm(ModelForm):
+class MenuSectionForm(UniqueSlugModelForm):
     class Meta:
         model = MenuSection
         fields = ['menu', 'name', 'image', 'note']
         widgets = {'menu': forms.HiddenInput()}
 
 
-class MenuItemForm(ModelForm):
+class MenuItemForm(UniqueSlugModelForm):
     class Meta:
         model = MenuItem
         fields = ['menusection', 'name', 'price', 'description']
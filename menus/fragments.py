@@ -0,0 +1,67 @@
+import hashlib
+
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.template.loader import render_to_string
+
+from menus_project import render_cache
+
+MENUSECTION_BLOCK_TEMPLATE_NAME = 'menus/menusection_block.html'
+
+
+def get_menusection_block_key(menusection, show_name=True, compact=False):
+    """
+    Return the cache key of a section's rendered block.
+
+    The key contains the section's 'updated_at', which changes whenever the
+    section or one of its items is saved or deleted, and the slugs of its
+    menu and restaurant, which are part of the block's links.
+    """
+    slugs = f'{menusection.menu.restaurant.slug}/{menusection.menu.slug}'
+    slugs_hash = hashlib.md5(slugs.encode('utf-8')).hexdigest()
+    version = menusection.updated_at.timestamp()
+    return f'menusection_block:{menusection.pk}:{version}:{slugs_hash}:' \
+        f'{int(show_name)}:{int(compact)}'
+
+
+def prefetch_uncached_menuitems(menusections, show_name=True,
+                                compact=False):
+    """
+    Load the items of the sections whose blocks are not cached, with a
+    single query, and keep the cached blocks of the others on the sections
+    so that rendering them does not look them up again.
+    """
+    uncached_menusections = menusections
+    if settings.RENDER_CACHE_ENABLED:
+        keys = {get_menusection_block_key(menusection, show_name, compact):
+                menusection for menusection in menusections}
+        uncached_menusections = []
+        cached_blocks = render_cache.get_cache().get_many(keys)
+        for key, menusection in keys.items():
+            if key in cached_blocks:
+                menusection._menusection_block = (key, cached_blocks[key])
+            else:
+                uncached_menusections.append(menusection)
+    prefetch_related_objects(uncached_menusections, 'menuitem_set')
+
+
+def render_menusection_block(menusection, show_name=True, compact=False):
+    """
+    Return the HTML of a section with its items, which is cached until the
+    section or one of its items changes (when the render cache is enabled).
+    """
+    context = {'menusection': menusection, 'show_name': show_name,
+               'compact': compact}
+    if not settings.RENDER_CACHE_ENABLED:
+        return render_to_string(MENUSECTION_BLOCK_TEMPLATE_NAME, context)
+
+    key = get_menusection_block_key(menusection, show_name, compact)
+    prefetched_key, html = getattr(
+        menusection, '_menusection_block', (None, None))
+    if prefetched_key != key:
+        html = render_cache.get_cache().get(key)
+    if html is None:
+        html = render_to_string(MENUSECTION_BLOCK_TEMPLATE_NAME, context)
+        render_cache.get_cache().set(
+            key, html, settings.RENDER_CACHE_TIMEOUT)
+    return html
@@ -0,0 +1,231 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test import Client, LiveServerTestCase, override_settings
+from django.test.runner import DiscoverRunner
+from django.test.testcases import LiveServerThread
+from django.test.utils import (
+    CaptureQueriesContext, setup_test_environment, teardown_test_environment)
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+
+from menus.models import MenuItem
+from menus.seeding import MenuSeeder
+from menus_project import factories as f
+from menus_project import render_cache
+from menus_project.load_generator import run_load
+
+HOST = '127.0.0.1'
+
+
+def seed_restaurants(restaurants, menus, sections, items):
+    """
+    Insert restaurants of the given size, and return the first restaurant,
+    menu, menu section and menu item.
+    """
+    MenuSeeder(restaurants, menus, sections, items).seed()
+    menuitem = MenuItem.objects \
+        .select_related('restaurant', 'menu', 'menusection').earliest('pk')
+    return (menuitem.restaurant, menuitem.menu, menuitem.menusection,
+            menuitem)
+
+
+def get_endpoints(restaurant, menu, menusection, menuitem):
+    """Return the name, path and 'is api' flag of each benchmarked endpoint."""
+    restaurant_kwargs = {'restaurant_slug': restaurant.slug}
+    menu_kwargs = dict(restaurant_kwargs, menu_slug=menu.slug)
+    menusection_kwargs = dict(menu_kwargs, menusection_slug=menusection.slug)
+    menuitem_kwargs = dict(menusection_kwargs, menuitem_slug=menuitem.slug)
+    api_menu_kwargs = {'restaurant_pk': restaurant.pk, 'menu_pk': menu.pk}
+    api_menusection_kwargs = \
+        dict(api_menu_kwargs, menusection_pk=menusection.pk)
+    return [
+        ('html:restaurant_list',
+         reverse('restaurants:restaurant_list'), False),
+        ('html:restaurant_detail',
+         reverse('restaurants:restaurant_detail', kwargs=restaurant_kwargs),
+         False),
+        ('html:menu_detail',
+         reverse('menus:menu_detail', kwargs=menu_kwargs), False),
+        ('html:menusection_detail',
+         reverse('menus:menusection_detail', kwargs=menusection_kwargs),
+         False),
+        ('html:menuitem_detail',
+         reverse('menus:menuitem_detail', kwargs=menuitem_kwargs), False),
+        ('api:restaurant_list', reverse('api:restaurant_list'), True),
+        ('api:menu_list',
+         reverse('api:menu_list', kwargs={'restaurant_pk': restaurant.pk}),
+         True),
+        ('api:menu_detail',
+         reverse('api:menu_detail', kwargs=api_menu_kwargs), True),
+        ('api:menu_full',
+         reverse('api:menu_full', kwargs=api_menu_kwargs), True),
+        ('api:menusection_list',
+         reverse('api:menusection_list', kwargs=api_menu_kwargs), True),
+        ('api:menuitem_list',
+         reverse('api:menuitem_list', kwargs=api_menusection_kwargs), True),
+    ]
+
+
+def compare_reports(report, baseline, tolerance):
+    """
+    Return a description of every endpoint whose query count or p95 latency
+    has regressed from the baseline report.
+    """
+    regressions = []
+    for name, baseline_stats in baseline['endpoints'].items():
+        stats = report['endpoints'].get(name)
+        if stats is None:
+            continue
+        if stats['queries'] > baseline_stats['queries']:
+            regressions.append(
+                f"{name}: {stats['queries']} queries "
+                f"(baseline: {baseline_stats['queries']})")
+        if stats['p95_ms'] is not None and baseline_stats['p95_ms'] \
+                and stats['p95_ms'] > \
+                baseline_stats['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f"{name}: p95 {stats['p95_ms']} ms "
+                f"(baseline: {baseline_stats['p95_ms']} ms)")
+    return regressions
+
+
+class Command(BaseCommand):
+    help = "Seed a test database with restaurants of a configurable size, " \
+        "then measure the latency, throughput and query count of the HTML " \
+        "and API endpoints that are used to browse menus."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--restaurants', type=int, default=1)
+        parser.add_argument(
+            '--menus', type=int, default=3, help="Menus per restaurant")
+        parser.add_argument(
+            '--sections', type=int, default=5, help="Sections per menu")
+        parser.add_argument(
+            '--items', type=int, default=10, help="Items per section")
+        parser.add_argument(
+            '--clients', type=int, default=10,
+            help="Number of concurrent clients")
+        parser.add_argument(
+            '--requests', type=int, default=20,
+            help="Number of requests made by each client, per endpoint")
+        parser.add_argument(
+            '--no-render-cache', action='store_true',
+            help="Disable the render cache while benchmarking")
+        parser.add_argument(
+            '--output', help="Write the report to this JSON file")
+        parser.add_argument(
+            '--baseline',
+            help="Compare the report to this JSON file, and exit with an "
+                 "error if an endpoint has regressed")
+        parser.add_argument(
+            '--tolerance', type=float, default=0.25,
+            help="Allowed p95 latency increase over the baseline "
+                 "(default: 0.25 = 25%%)")
+
+    def handle(self, *args, **options):
+        if min(options['restaurants'], options['menus'],
+               options['sections'], options['items']) < 1:
+            raise CommandError("Every size must be at least 1.")
+
+        # use a separate test database, like the test runner does
+        setup_test_environment(debug=False)
+        runner = DiscoverRunner(verbosity=0)
+        old_config = runner.setup_databases()
+        try:
+            with override_settings(
+                    ALLOWED_HOSTS=[HOST, 'testserver'],
+                    RENDER_CACHE_ENABLED=not options['no_render_cache']):
+                report = self.run_benchmark(options)
+        finally:
+            runner.teardown_databases(old_config)
+            teardown_test_environment()
+
+        report_json = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                output_file.write(report_json + '\n')
+        self.write_summary(report)
+
+        if options['baseline']:
+            with open(options['baseline']) as baseline_file:
+                regressions = compare_reports(
+                    report, json.load(baseline_file), options['tolerance'])
+            if regressions:
+                raise CommandError(
+                    "Regressions found:\n" + '\n'.join(regressions))
+            self.stdout.write("No regressions found.")
+
+    def run_benchmark(self, options):
+        self.stderr.write("Seeding the test database...")
+        first_objects = seed_restaurants(
+            options['restaurants'], options['menus'], options['sections'],
+            options['items'])
+        token = Token.objects.create(user=f.UserFactory()).key
+        endpoints = get_endpoints(*first_objects)
+
+        server = self.start_live_server()
+        try:
+            results = {}
+            for name, path, is_api in endpoints:
+                self.stderr.write(f"Benchmarking {name}...")
+                headers = {'Authorization': f'Token {token}'} \
+                    if is_api else {}
+
+                # count the queries of an uncached request
+                render_cache.get_cache().clear()
+                with CaptureQueriesContext(connection) as queries:
+                    Client().get(path, **{
+                        f"HTTP_{header.upper()}": value
+                        for header, value in headers.items()})
+
+                stats = run_load(
+                    HOST, server.port, path, options['clients'],
+                    options['requests'], headers=headers)
+                results[name] = dict(
+                    path=path, queries=len(queries), **stats)
+        finally:
+            server.terminate()
+            self.stop_sharing_connections()
+
+        return {
+            'config': {key: options[key] for key in (
+                'restaurants', 'menus', 'sections', 'items', 'clients',
+                'requests', 'no_render_cache')},
+            'endpoints': results,
+        }
+
+    def start_live_server(self):
+        # share in-memory SQLite databases with the server's threads
+        connections_override = {}
+        for conn in connections.all():
+            if conn.vendor == 'sqlite' and conn.is_in_memory_db():
+                conn.inc_thread_sharing()
+                connections_override[conn.alias] = conn
+
+        server = LiveServerThread(
+            HOST, LiveServerTestCase.static_handler,
+            connections_override=connections_override)
+        server.daemon = True
+        server.start()
+        server.is_ready.wait()
+        if server.error:
+            raise server.error
+        return server
+
+    def stop_sharing_connections(self):
+        for conn in connections.all():
+            if conn.vendor == 'sqlite' and conn.is_in_memory_db():
+                conn.dec_thread_sharing()
+
+    def write_summary(self, report):
+        self.stdout.write(
+            f"{'endpoint':<24} {'queries':>7} {'req/s':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>6}")
+        for name, stats in report['endpoints'].items():
+            self.stdout.write(
+                f"{name:<24} {stats['queries']:>7} "
+                f"{stats['throughput_rps']:>8} {stats['p50_ms']!s:>8} "
+                f"{stats['p95_ms']!s:>8} {stats['p99_ms']!s:>8} "
+                f"{stats['errors']:>6}")
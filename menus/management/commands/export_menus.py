@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from menus.export import CHUNK_SIZE, EXPORT_FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    help = "Export every restaurant, menu, menu section and menu item as " \
+        "JSON Lines or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format', choices=EXPORT_FORMATS, default='jsonl',
+            dest='export_format')
+        parser.add_argument(
+            '--output', help="Output file (default: stdout)")
+        parser.add_argument(
+            '--chunk-size', type=int, default=CHUNK_SIZE,
+            help="Number of rows fetched from the database at a time")
+
+    def handle(self, *args, **options):
+        chunks = iter_export(options['export_format'], options['chunk_size'])
+        if options['output']:
+            with open(options['output'], 'w', newline='') as output_file:
+                output_file.writelines(chunks)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
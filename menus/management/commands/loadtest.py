@@ -0,0 +1,46 @@
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from menus_project.load_generator import run_load
+
+
+class Command(BaseCommand):
+    help = "Load test a running server with concurrent (optionally slow) " \
+        "clients, e.g. to compare the WSGI and ASGI deployments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'url', nargs='?', default='http://127.0.0.1:8003/')
+        parser.add_argument(
+            '--clients', type=int, default=50,
+            help="Number of concurrent clients")
+        parser.add_argument(
+            '--requests', type=int, default=10,
+            help="Number of requests made by each client")
+        parser.add_argument(
+            '--slow-client-ms', type=int, default=0,
+            help="Delay between each line sent and each chunk read by a "
+                 "client, in milliseconds")
+
+    def handle(self, *args, **options):
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError("Only http:// URLs are supported.")
+        path = url.path or '/'
+        if url.query:
+            path += '?' + url.query
+
+        stats = run_load(
+            url.hostname, url.port or 80, path, options['clients'],
+            options['requests'], options['slow_client_ms'] / 1000)
+
+        self.stdout.write(
+            f"requests:   {stats['requests']} ({stats['errors']} errors)")
+        self.stdout.write(f"total time: {stats['total_time_s']:.2f} s")
+        self.stdout.write(
+            f"throughput: {stats['throughput_rps']:.1f} requests/s")
+        for percent in (50, 95, 99):
+            latency_ms = stats[f'p{percent}_ms']
+            if latency_ms is not None:
+                self.stdout.write(f"p{percent}:        {latency_ms:.1f} ms")
@@ -0,0 +1,77 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from menus.seeding import BATCH_SIZE, MenuSeeder
+from search.index import index_restaurants
+
+
+class Command(BaseCommand):
+    help = "Quickly insert restaurants of a configurable size (e.g. for " \
+        "load testing), using bulk inserts instead of the test factories. " \
+        "The cached first page of the restaurant list is deleted from the " \
+        "render cache, which the server only sees if it is a shared cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--restaurants', type=int, default=10)
+        parser.add_argument(
+            '--menus', type=int, default=3, help="Menus per restaurant")
+        parser.add_argument(
+            '--sections', type=int, default=5, help="Sections per menu")
+        parser.add_argument(
+            '--items', type=int, default=10, help="Items per section")
+        parser.add_argument(
+            '--batch-size', type=int, default=BATCH_SIZE,
+            help="Number of objects inserted per bulk insert")
+        parser.add_argument(
+            '--name-prefix', default='Seeded',
+            help="Prefix of the restaurant names (default: 'Seeded')")
+        parser.add_argument(
+            '--admin-user', action='append', default=[],
+            help="Username of a restaurant admin (may be repeated)")
+        parser.add_argument(
+            '--no-search-index', action='store_true',
+            help="Do not add the new objects to the search index")
+
+    def handle(self, *args, **options):
+        self.verbosity = options['verbosity']
+        usernames = options['admin_user']
+        admin_users = list(get_user_model().objects.filter(
+            username__in=usernames))
+        if len(admin_users) != len(set(usernames)):
+            raise CommandError("One or more admin users do not exist.")
+
+        try:
+            seeder = MenuSeeder(
+                options['restaurants'], options['menus'],
+                options['sections'], options['items'],
+                batch_size=options['batch_size'],
+                name_prefix=options['name_prefix'],
+                admin_users=admin_users, progress=self.write_progress)
+            start_time = time.perf_counter()
+            counts = seeder.seed()
+        except ValueError as e:
+            raise CommandError(e)
+        total_time = time.perf_counter() - start_time
+
+        total_count = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Inserted {total_count} objects in {total_time:.1f} s "
+            f"({total_count / max(total_time, 0.001):.0f} objects/s)."))
+
+        # bulk_create() does not send the signals that update the index
+        if not options['no_search_index']:
+            start_time = time.perf_counter()
+            with transaction.atomic():
+                index_restaurants(seeder.restaurant_pks)
+            self.stdout.write(self.style.SUCCESS(
+                f"Indexed the new objects in "
+                f"{time.perf_counter() - start_time:.1f} s."))
+
+    def write_progress(self, counts):
+        if self.verbosity >= 2:
+            self.stderr.write(', '.join(
+                f"{model._meta.verbose_name_plural}: {count}"
+                for model, count in counts.items()))
@@ -0,0 +1,35 @@
+# Generated by Django 3.2 on 2026-10-17 18:49
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0002_auto_20201229_0321'),
+        ('menus', '0008_menu_description'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menuitem',
+            name='menu',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu section', null=True, on_delete=django.db.models.deletion.CASCADE, to='menus.menu'),
+        ),
+        migrations.AddField(
+            model_name='menuitem',
+            name='restaurant',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu section', null=True, on_delete=django.db.models.deletion.CASCADE, to='restaurants.restaurant'),
+        ),
+        migrations.AddField(
+            model_name='menusection',
+            name='restaurant',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu', null=True, on_delete=django.db.models.deletion.CASCADE, to='restaurants.restaurant'),
+        ),
+        migrations.AlterField(
+            model_name='menusection',
+            name='note',
+            field=models.CharField(blank=True, help_text="An optional note about this section (e.g.'Drinks come with complimentary refills.')", max_length=256, null=True),
+        ),
+    ]
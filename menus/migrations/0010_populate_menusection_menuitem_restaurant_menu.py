@@ -0,0 +1,30 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def populate_restaurant_and_menu(apps, schema_editor):
+    Menu = apps.get_model('menus', 'Menu')
+    MenuSection = apps.get_model('menus', 'MenuSection')
+    MenuItem = apps.get_model('menus', 'MenuItem')
+
+    MenuSection.objects.update(restaurant=Subquery(
+        Menu.objects.filter(pk=OuterRef('menu')).values('restaurant')[:1]))
+    MenuItem.objects.update(
+        menu=Subquery(
+            MenuSection.objects.filter(pk=OuterRef('menusection'))
+            .values('menu')[:1]),
+        restaurant=Subquery(
+            MenuSection.objects.filter(pk=OuterRef('menusection'))
+            .values('restaurant')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0009_menusection_menuitem_restaurant_menu'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            populate_restaurant_and_menu, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.2 on 2026-10-17 18:50
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0002_auto_20201229_0321'),
+        ('menus', '0010_populate_menusection_menuitem_restaurant_menu'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='menuitem',
+            name='menu',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu section', on_delete=django.db.models.deletion.CASCADE, to='menus.menu'),
+        ),
+        migrations.AlterField(
+            model_name='menuitem',
+            name='restaurant',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu section', on_delete=django.db.models.deletion.CASCADE, to='restaurants.restaurant'),
+        ),
+        migrations.AlterField(
+            model_name='menusection',
+            name='restaurant',
+            field=models.ForeignKey(editable=False, help_text='Set automatically from the menu', on_delete=django.db.models.deletion.CASCADE, to='restaurants.restaurant'),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(fields=['restaurant', 'menu', 'menusection', 'slug'], name='menuitem_slug_path_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menusection',
+            index=models.Index(fields=['restaurant', 'menu', 'slug'], name='menusection_slug_path_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0011_menusection_menuitem_restaurant_menu_not_null'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='menu',
+            constraint=models.UniqueConstraint(fields=('restaurant', 'slug'), name='menu_unique_restaurant_slug'),
+        ),
+        migrations.AddConstraint(
+            model_name='menuitem',
+            constraint=models.UniqueConstraint(fields=('menusection', 'slug'), name='menuitem_unique_menusection_slug'),
+        ),
+        migrations.AddConstraint(
+            model_name='menusection',
+            constraint=models.UniqueConstraint(fields=('menu', 'slug'), name='menusection_unique_menu_slug'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2 on 2026-10-17 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0012_unique_slug_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menu',
+            index=models.Index(fields=['restaurant', 'name', 'id'], name='menu_restaurant_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(fields=['menusection', 'name', 'id'], name='menuitem_section_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='menusection',
+            index=models.Index(fields=['menu', 'name', 'id'], name='menusection_menu_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0015_menuitem_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='menu',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+        migrations.AddField(
+            model_name='menusection',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
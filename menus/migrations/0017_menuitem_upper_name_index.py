@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-17 22:08
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0016_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='menuitem',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='menuitem_upper_name_idx'),
+        ),
+    ]
@@ -1,13 +1,43 @@
 import os
+from contextlib import contextmanager
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils.text import slugify
 
 from menus_project import constants
 
 
+@contextmanager
+def unique_slug_validation(instance):
+    """
+    If a save is rejected by one of the instance's unique constraints (e.g. a
+    duplicate slug), raise a ValidationError instead of an IntegrityError.
+    """
+    try:
+        with transaction.atomic():
+            yield
+    except IntegrityError:
+        # raises a ValidationError if a unique constraint has been violated
+        instance.validate_unique()
+        raise
+
+
+def validate_unique_slug(instance, exclude=None):
+    """
+    Validate the instance's unique constraints with the slug that it will
+    be saved with, without changing the slug of the instance.
+    """
+    slug = instance.slug
+    instance.slug = slugify(instance.name)
+    try:
+        instance.validate_unique(exclude=exclude)
+    finally:
+        instance.slug = slug
+
+
 def menu_upload_to(instance, filename):
     base, extension = os.path.splitext(filename)
     extension = extension.lower()
@@ -31,33 +61,45 @@ class Menu(models.Model):
     image = models.ImageField(
         help_text="An image or logo for this menu (optional)",
         upload_to=menu_upload_to, blank=True, null=True)
+    # resized copies of the image (see the 'images' app)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     description = models.CharField(max_length=256, blank=True, null=True)
     theme = models.CharField(
         max_length=32,
         choices=THEME_CHOICES,
         default='default')
+    # also updated when one of the menu's sections or items changes
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['name']
+        constraints = [
+            # do not allow a restaurant to have duplicate menu slugs
+            models.UniqueConstraint(
+                fields=['restaurant', 'slug'],
+                name='menu_unique_restaurant_slug'),
+        ]
+        indexes = [
+            # used by the api's cursor pagination
+            models.Index(
+                fields=['restaurant', 'name', 'id'],
+                name='menu_restaurant_name_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.restaurant.name} - {self.name}"
 
     def clean(self):
         # do not allow slugs to be reserved keywords
-        if self.slug in constants.RESERVED_KEYWORDS:
+        if slugify(self.name) in constants.RESERVED_KEYWORDS:
             raise ValidationError(constants.RESERVED_KEYWORD_ERROR_STRING)
 
-        # do not allow a restaurant to have duplicate menu slugs
-        menus_with_same_slug = Menu.objects.filter(
-            restaurant=self.restaurant,
-            slug=slugify(self.name))
-        if menus_with_same_slug.count():
-            if menus_with_same_slug.first() != self \
-                    or menus_with_same_slug.last() != self:
-                raise ValidationError(
-                    "This name is too similar to one of this restaurant's "
-                    "existing menu names.")
+    def unique_error_message(self, model_class, unique_check):
+        if tuple(unique_check) == ('restaurant', 'slug'):
+            return ValidationError(
+                "This name is too similar to one of this restaurant's "
+                "existing menu names.", code='unique_slug')
+        return super().unique_error_message(model_class, unique_check)
 
     def get_absolute_url(self):
         return reverse('menus:menu_detail', kwargs={
@@ -65,10 +107,18 @@ class Menu(models.Model):
             'menu_slug': self.slug})
 
     def save(self, *args, **kwargs):
-        if not self.slug == slugify(self.name):
-            self.slug = slugify(self.name)
         self.clean()
-        super().save(*args, **kwargs)
+        self.slug = slugify(self.name)
+        adding = self._state.adding
+        with unique_slug_validation(self):
+            super().save(*args, **kwargs)
+
+        # keep the denormalized restaurant of sections and items consistent
+        if not adding:
+            self.menusection_set.exclude(restaurant=self.restaurant_id) \
+                .update(restaurant=self.restaurant_id)
+            self.menuitem_set.exclude(restaurant=self.restaurant_id) \
+                .update(restaurant=self.restaurant_id)
 
 
 def menusection_upload_to(instance, filename):
@@ -81,50 +131,89 @@ def menusection_upload_to(instance, filename):
 
 class MenuSection(models.Model):
 
+    restaurant = models.ForeignKey(
+        'restaurants.Restaurant',
+        on_delete=models.CASCADE,
+        editable=False,
+        help_text="Set automatically from the menu")
     menu = models.ForeignKey('Menu', on_delete=models.CASCADE)
     name = models.CharField(max_length=128, default=None, blank=False)
     slug = models.SlugField(max_length=128)
     image = models.ImageField(
         help_text="An image or logo for this section (optional)",
         upload_to=menusection_upload_to, blank=True, null=True)
+    # resized copies of the image (see the 'images' app)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     note = models.CharField(
             help_text="An optional note about this section (e.g."
                       "'Drinks come with complimentary refills.')",
             max_length=256, blank=True, null=True)
+    # also updated when one of the section's items changes
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # do not allow a menu to have duplicate section slugs
+            models.UniqueConstraint(
+                fields=['menu', 'slug'],
+                name='menusection_unique_menu_slug'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['restaurant', 'menu', 'slug'],
+                name='menusection_slug_path_idx'),
+            models.Index(
+                fields=['menu', 'name', 'id'],
+                name='menusection_menu_name_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.menu.restaurant.name}: {self.menu.name} - {self.name}"
 
     def clean(self):
         # do not allow slugs to be reserved keywords
-        if self.slug in constants.RESERVED_KEYWORDS:
+        if slugify(self.name) in constants.RESERVED_KEYWORDS:
             raise ValidationError(constants.RESERVED_KEYWORD_ERROR_STRING)
 
-        # do not allow a menu to have duplicate section slugs
-        menusections_with_same_slug = MenuSection.objects.filter(
-            menu=self.menu,
-            slug=slugify(self.name))
-        if menusections_with_same_slug.count():
-            if menusections_with_same_slug.first() != self \
-                    or menusections_with_same_slug.last() != self:
-                raise ValidationError(
-                    "This name is too similar to one of this menu's "
-                    "existing section names.")
+    def unique_error_message(self, model_class, unique_check):
+        if tuple(unique_check) == ('menu', 'slug'):
+            return ValidationError(
+                "This name is too similar to one of this menu's "
+                "existing section names.", code='unique_slug')
+        return super().unique_error_message(model_class, unique_check)
 
     def get_absolute_url(self):
         return reverse('menus:menusection_detail', kwargs={
-            'restaurant_slug': self.menu.restaurant.slug,
+            'restaurant_slug': self.restaurant.slug,
             'menu_slug': self.menu.slug,
             'menusection_slug': self.slug})
 
     def save(self, *args, **kwargs):
-        if not self.slug == slugify(self.name):
-            self.slug = slugify(self.name)
+        self.restaurant_id = self.menu.restaurant_id
         self.clean()
-        super().save(*args, **kwargs)
+        self.slug = slugify(self.name)
+        adding = self._state.adding
+        with unique_slug_validation(self):
+            super().save(*args, **kwargs)
+
+        # keep the denormalized menu and restaurant of items consistent
+        if not adding:
+            self.menuitem_set \
+                .exclude(menu=self.menu_id, restaurant=self.restaurant_id) \
+                .update(menu=self.menu_id, restaurant=self.restaurant_id)
 
 
 class MenuItem(models.Model):
+    restaurant = models.ForeignKey(
+        'restaurants.Restaurant',
+        on_delete=models.CASCADE,
+        editable=False,
+        help_text="Set automatically from the menu section")
+    menu = models.ForeignKey(
+        'Menu',
+        on_delete=models.CASCADE,
+        editable=False,
+        help_text="Set automatically from the menu section")
     menusection = models.ForeignKey('MenuSection', on_delete=models.CASCADE)
     name = models.CharField(max_length=128, default=None, blank=False)
     slug = models.SlugField(max_length=128)
@@ -132,6 +221,33 @@ class MenuItem(models.Model):
         help_text="Enter the price in cents (e.g. $5.00 = 500 cents)",
         blank=True, null=True)
     description = models.CharField(max_length=1024, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # do not allow a menusection to have duplicate menuitem slugs
+            models.UniqueConstraint(
+                fields=['menusection', 'slug'],
+                name='menuitem_unique_menusection_slug'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['restaurant', 'menu', 'menusection', 'slug'],
+                name='menuitem_slug_path_idx'),
+            models.Index(
+                fields=['menusection', 'name', 'id'],
+                name='menuitem_section_name_id_idx'),
+            # used by the API's menu item filters (see api.filters)
+            models.Index(
+                fields=['restaurant', 'price'],
+                name='menuitem_restaurant_price_idx'),
+            models.Index(
+                fields=['menu', 'price'],
+                name='menuitem_menu_price_idx'),
+            models.Index(fields=['price'], name='menuitem_price_idx'),
+            models.Index(fields=['name', 'id'], name='menuitem_name_id_idx'),
+            models.Index(Upper('name'), name='menuitem_upper_name_idx'),
+        ]
 
     def __str__(self):
         return f"{self.menusection.menu.restaurant.name}: "\
@@ -140,24 +256,20 @@ class MenuItem(models.Model):
 
     def clean(self):
         # do not allow slugs to be reserved keywords
-        if self.slug in constants.RESERVED_KEYWORDS:
+        if slugify(self.name) in constants.RESERVED_KEYWORDS:
             raise ValidationError(constants.RESERVED_KEYWORD_ERROR_STRING)
 
-        # do not allow a menusection to have duplicate menuitem slugs
-        menuitems_with_same_slug = MenuItem.objects.filter(
-            menusection=self.menusection,
-            slug=slugify(self.name))
-        if menuitems_with_same_slug.count():
-            if menuitems_with_same_slug.first() != self \
-                    or menuitems_with_same_slug.last() != self:
-                raise ValidationError(
-                    "This name is too similar to one of this menu's "
-                    "existing item names.")
+    def unique_error_message(self, model_class, unique_check):
+        if tuple(unique_check) == ('menusection', 'slug'):
+            return ValidationError(
+                "This name is too similar to one of this menu's "
+                "existing item names.", code='unique_slug')
+        return super().unique_error_message(model_class, unique_check)
 
     def get_absolute_url(self):
         return reverse('menus:menuitem_detail', kwargs={
-            'restaurant_slug': self.menusection.menu.restaurant.slug,
-            'menu_slug': self.menusection.menu.slug,
+            'restaurant_slug': self.restaurant.slug,
+            'menu_slug': self.menu.slug,
             'menusection_slug': self.menusection.slug,
             'menuitem_slug': self.slug})
 
@@ -168,7 +280,9 @@ class MenuItem(models.Model):
         return f"${dollars}.{padded_cents}"
 
     def save(self, *args, **kwargs):
-        if not self.slug == slugify(self.name):
-            self.slug = slugify(self.name)
+        self.menu_id = self.menusection.menu_id
+        self.restaurant_id = self.menusection.restaurant_id
         self.clean()
-        super().save(*args, **kwargs)
+        self.slug = slugify(self.name)
+        with unique_slug_validation(self):
+            super().save(*args, **kwargs)
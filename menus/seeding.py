@@ -0,0 +1,169 @@
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils.text import slugify
+
+from menus_project import constants
+from menus_project.render_cache import delete_restaurant_list_first_page
+from restaurants.models import Restaurant
+from .models import Menu, MenuSection, MenuItem
+
+BATCH_SIZE = 5000
+SEED_MODELS = [Restaurant, Menu, MenuSection, MenuItem]
+
+
+def get_names(label, count):
+    """
+    Return the names and slugs of 'count' siblings (e.g. 'Menu 1', 'Menu 2',
+    ...), which are the same for every parent, so they only need to be
+    generated and checked once.
+    """
+    names = []
+    for i in range(count):
+        name = f"{label} {i + 1}"
+        slug = slugify(name)
+        if slug in constants.RESERVED_KEYWORDS:
+            raise ValueError(f"'{name}' is a reserved keyword.")
+        names.append((name, slug))
+    return names
+
+
+def get_next_pk(model):
+    return (model.objects.aggregate(Max('pk'))['pk__max'] or 0) + 1
+
+
+def reset_sequences():
+    """
+    Move the primary key sequences past the explicitly assigned primary keys.
+    (SQLite does this on its own, so there are no statements to run there.)
+    """
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), SEED_MODELS):
+            cursor.execute(sql)
+
+
+class MenuSeeder:
+    """
+    Insert restaurants with the given number of menus, sections per menu and
+    items per section, using bulk_create() in batches.
+
+    The objects are built in memory with their primary keys already assigned
+    (counting up from the current maximum), so that children can refer to
+    their parents without reading the parents' primary keys back from the
+    database, and memory use is bounded by the batch size rather than by the
+    size of the dataset. The database should therefore not be written to by
+    anything else while seeding.
+
+    Like bulk_create() itself, this does not call save() or send signals, so
+    the names are chosen to satisfy the models' clean() rules: slugs are never
+    reserved keywords, are unique among their siblings, and restaurant slugs
+    contain the restaurant's (new) primary key, so they are unique too.
+    """
+
+    def __init__(self, restaurants, menus, sections, items,
+                 batch_size=BATCH_SIZE, name_prefix='Seeded',
+                 admin_users=None, progress=None):
+        if min(restaurants, menus, sections, items, batch_size) < 1:
+            raise ValueError("Every size must be at least 1.")
+        self.restaurants = restaurants
+        self.menu_names = get_names('Menu', menus)
+        self.menusection_names = get_names('Section', sections)
+        self.menuitem_names = get_names('Item', items)
+        self.batch_size = batch_size
+        self.name_prefix = name_prefix
+        self.admin_users = admin_users or []
+        self.progress = progress
+        self.counts = {model: 0 for model in SEED_MODELS}
+
+    def seed(self):
+        """
+        Insert the objects in a single transaction, and return the number of
+        inserted objects of each model.
+        """
+        with transaction.atomic():
+            self.buffers = {model: [] for model in SEED_MODELS}
+            self.admin_user_links = []
+            next_pks = {model: get_next_pk(model) for model in SEED_MODELS}
+
+            self.restaurant_pks = range(
+                next_pks[Restaurant], next_pks[Restaurant] + self.restaurants)
+            for restaurant_pk in self.restaurant_pks:
+                self.add_restaurant(restaurant_pk, next_pks)
+            self.flush()
+            reset_sequences()
+        # bulk_create() does not send the signals that invalidate it (this
+        # reaches the server since the render cache is a shared cache)
+        delete_restaurant_list_first_page()
+        return self.counts
+
+    def add_restaurant(self, restaurant_pk, next_pks):
+        name = f"{self.name_prefix} Restaurant {restaurant_pk}"
+        slug = slugify(name)
+        if slug in constants.RESERVED_KEYWORDS:
+            raise ValueError(f"'{name}' is a reserved keyword.")
+        self.add(Restaurant(pk=restaurant_pk, name=name, slug=slug))
+        for user in self.admin_users:
+            self.admin_user_links.append(Restaurant.admin_users.through(
+                restaurant_id=restaurant_pk, user_id=user.pk))
+
+        for menu_name, menu_slug in self.menu_names:
+            menu_pk = next_pks[Menu]
+            next_pks[Menu] += 1
+            self.add(Menu(
+                pk=menu_pk, restaurant_id=restaurant_pk, name=menu_name,
+                slug=menu_slug))
+
+            for menusection_name, menusection_slug in self.menusection_names:
+                menusection_pk = next_pks[MenuSection]
+                next_pks[MenuSection] += 1
+                self.add(MenuSection(
+                    pk=menusection_pk, restaurant_id=restaurant_pk,
+                    menu_id=menu_pk, name=menusection_name,
+                    slug=menusection_slug))
+
+                for i, (menuitem_name, menuitem_slug) in \
+                        enumerate(self.menuitem_names):
+                    self.add(MenuItem(
+                        pk=next_pks[MenuItem], restaurant_id=restaurant_pk,
+                        menu_id=menu_pk, menusection_id=menusection_pk,
+                        name=menuitem_name, slug=menuitem_slug,
+                        price=100 + (i * 25) % 2000, description=''))
+                    next_pks[MenuItem] += 1
+
+    def add(self, obj):
+        model = type(obj)
+        self.buffers[model].append(obj)
+        if len(self.buffers[model]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        # parents are inserted before their children
+        for model in SEED_MODELS:
+            objs = self.buffers[model]
+            if not objs:
+                continue
+            if model == Restaurant:
+                self.check_restaurant_slugs(objs)
+            model.objects.bulk_create(objs, batch_size=self.batch_size)
+            self.counts[model] += len(objs)
+            self.buffers[model] = []
+        if self.admin_user_links:
+            Restaurant.admin_users.through.objects.bulk_create(
+                self.admin_user_links, batch_size=self.batch_size)
+            self.admin_user_links = []
+        if self.progress:
+            self.progress(self.counts)
+
+    def check_restaurant_slugs(self, restaurants):
+        # the slugs are derived from new primary keys, but an existing
+        # restaurant may have been given the same name (the slugs are checked
+        # in chunks to stay below SQLite's limit of query parameters)
+        slugs = [restaurant.slug for restaurant in restaurants]
+        for i in range(0, len(slugs), 500):
+            duplicate_slug = Restaurant.objects \
+                .filter(slug__in=slugs[i:i + 500]) \
+                .values_list('slug', flat=True).first()
+            if duplicate_slug is not None:
+                raise ValueError(
+                    f"A restaurant with the slug '{duplicate_slug}' already "
+                    "exists. Use a different name prefix.")
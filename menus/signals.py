@@ -0,0 +1,108 @@
+import collections
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import (
+    post_delete, post_init, post_save, pre_save)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Menu, MenuSection, MenuItem
+from menus_project.render_cache import bump_restaurant_generation
+from menus_project.slug_paths import bump_slug_path_generation
+from restaurants.models import Restaurant
+
+
+def update_ancestors_updated_at(instance, updated_at, old_state):
+    """
+    Set the 'updated_at' of every ancestor of a menu object to the time at
+    which the object changed.
+
+    The section that an item has just been moved out of is updated too, so
+    that its cached block no longer lists the item.
+    """
+    if type(instance) == MenuItem:
+        menusection_pks = {instance.menusection_id, old_state.parent_id}
+        MenuSection.objects.filter(pk__in=menusection_pks) \
+            .update(updated_at=updated_at)
+    if type(instance) in (MenuSection, MenuItem):
+        Menu.objects.filter(pk=instance.menu_id) \
+            .update(updated_at=updated_at)
+    Restaurant.objects.filter(pk=instance.restaurant_id) \
+        .update(updated_at=updated_at)
+
+
+@receiver([post_save, post_delete], sender=Menu)
+@receiver([post_save, post_delete], sender=MenuSection)
+@receiver([post_save, post_delete], sender=MenuItem)
+def menu_object_changed(sender, instance, signal, **kwargs):
+    try:
+        restaurant = instance.restaurant
+    # the restaurant has already been deleted (and its pages invalidated)
+    except ObjectDoesNotExist:
+        return
+    # update the timestamps before the cached pages are invalidated
+    if signal == post_save:
+        update_ancestors_updated_at(
+            instance, instance.updated_at, instance._old_slug_path_state)
+    else:
+        update_ancestors_updated_at(
+            instance, timezone.now(), instance._slug_path_state)
+    bump_restaurant_generation(restaurant.slug)
+    if signal == post_delete:
+        bump_slug_path_generation(restaurant.slug)
+    else:
+        menu_object_saved(instance, kwargs['created'])
+
+
+# slug paths
+
+# the parent of each type of menu object, which is part of its URL
+PARENT_FIELDS = {
+    Menu: 'restaurant_id',
+    MenuSection: 'menu_id',
+    MenuItem: 'menusection_id',
+}
+
+
+SlugPathState = collections.namedtuple(
+    'SlugPathState', ['slug', 'parent_id', 'menu_id', 'restaurant_id'])
+
+
+def get_slug_path_state(instance):
+    # deferred fields are not loaded (they are compared as None)
+    values = instance.__dict__
+    return SlugPathState(
+        values.get('slug'), values.get(PARENT_FIELDS[type(instance)]),
+        values.get('menu_id'), values.get('restaurant_id'))
+
+
+# remember the slug and parent of each object as it was loaded or saved, so
+# that changes to its URL are noticed without querying the old values
+@receiver(post_init, sender=Menu)
+@receiver(post_init, sender=MenuSection)
+@receiver(post_init, sender=MenuItem)
+def remember_slug_path_state(sender, instance, **kwargs):
+    instance._slug_path_state = get_slug_path_state(instance)
+
+
+# keep the state from before the save for the post_save receivers of every
+# app (e.g. to find the menu or section that an object has been moved out of)
+@receiver(pre_save, sender=Menu)
+@receiver(pre_save, sender=MenuSection)
+@receiver(pre_save, sender=MenuItem)
+def remember_old_slug_path_state(sender, instance, **kwargs):
+    instance._old_slug_path_state = instance._slug_path_state
+
+
+def menu_object_saved(instance, created):
+    # if the object's URL has changed, forget the resolved slug paths of its
+    # old restaurant (once the new values are saved, so that the old paths
+    # cannot be resolved again from the old rows)
+    old_state = instance._old_slug_path_state
+    remember_slug_path_state(type(instance), instance)
+    if not created and old_state != instance._slug_path_state:
+        old_restaurant_slug = Restaurant.objects \
+            .filter(pk=old_state.restaurant_id) \
+            .values_list('slug', flat=True).first()
+        if old_restaurant_slug:
+            bump_slug_path_generation(old_restaurant_slug)
@@ -0,0 +1,21 @@
+from django import template
+from django.utils.safestring import mark_safe
+
+from menus.fragments import render_menusection_block
+
+register = template.Library()
+
+
+@register.simple_tag
+def menusection_block(menusection, show_name=True, compact=False):
+    """
+    Render a menu section with its items (and its name, unless show_name is
+    False), e.g. {% menusection_block menusection show_name=False %}
+
+    A compact block (e.g. in the restaurant page's list of menus) leaves out
+    the section's image and note, and has tighter spacing.
+
+    The block is cached until the section or one of its items changes, so
+    editing an item only re-renders the blocks of its own section.
+    """
+    return mark_safe(render_menusection_block(menusection, show_name, compact))
@@ -0,0 +1,127 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+from django.utils.text import slugify
+
+from menus_project import factories as f
+from restaurants.models import Restaurant
+from search.index import search
+from search.models import SearchEntry
+from .management.commands.benchmark import compare_reports
+from .models import Menu, MenuSection, MenuItem
+
+
+class LoadtestCommandTest(SimpleTestCase):
+
+    def test_https_url_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            call_command('loadtest', 'https://127.0.0.1/')
+
+
+class BenchmarkCommandTest(SimpleTestCase):
+
+    def setUp(self):
+        self.baseline = {'endpoints': {
+            'html:menu_detail': {'queries': 4, 'p95_ms': 10.0},
+            'api:menu_full': {'queries': 4, 'p95_ms': 10.0}}}
+
+    def get_report(self, queries=4, p95_ms=10.0):
+        return {'endpoints': {
+            'html:menu_detail': {'queries': queries, 'p95_ms': p95_ms}}}
+
+    def test_compare_reports_without_regressions(self):
+        self.assertEqual(compare_reports(
+            self.get_report(queries=3, p95_ms=12.0), self.baseline, 0.25),
+            [])
+
+    def test_compare_reports_query_count_regression(self):
+        self.assertEqual(
+            compare_reports(self.get_report(queries=5), self.baseline, 0.25),
+            ['html:menu_detail: 5 queries (baseline: 4)'])
+
+    def test_compare_reports_latency_regression(self):
+        self.assertEqual(
+            compare_reports(self.get_report(p95_ms=13.0), self.baseline, 0.25),
+            ['html:menu_detail: p95 13.0 ms (baseline: 10.0 ms)'])
+
+    def test_benchmark_bad_size_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark', '--items=0')
+
+
+class SeedMenusCommandTest(TestCase):
+
+    def seed(self, *args):
+        call_command(
+            'seed_menus', '--restaurants=2', '--menus=2', '--sections=3',
+            '--items=4', '--batch-size=5', *args, stdout=StringIO())
+
+    def test_seed_menus_inserts_expected_number_of_objects(self):
+        self.seed()
+        self.assertEqual(Restaurant.objects.count(), 2)
+        self.assertEqual(Menu.objects.count(), 4)
+        self.assertEqual(MenuSection.objects.count(), 12)
+        self.assertEqual(MenuItem.objects.count(), 48)
+
+    def test_seed_menus_sets_denormalized_foreign_keys(self):
+        self.seed()
+        menuitems = MenuItem.objects.select_related('menusection__menu')
+        for menuitem in menuitems:
+            menusection = menuitem.menusection
+            self.assertEqual(menuitem.menu_id, menusection.menu_id)
+            self.assertEqual(
+                menuitem.restaurant_id, menusection.menu.restaurant_id)
+            self.assertEqual(menusection.restaurant_id, menuitem.restaurant_id)
+
+    def test_seed_menus_slugs_satisfy_clean(self):
+        self.seed()
+        for model in (Restaurant, Menu, MenuSection, MenuItem):
+            for obj in model.objects.all():
+                slug = obj.slug
+                obj.full_clean()
+                self.assertEqual(obj.slug, slugify(obj.name))
+                self.assertEqual(obj.slug, slug)
+
+    def test_seed_menus_can_be_run_repeatedly(self):
+        self.seed()
+        self.seed()
+        self.assertEqual(Restaurant.objects.count(), 4)
+        self.assertEqual(MenuItem.objects.count(), 96)
+
+        # objects can still be created normally afterwards
+        f.MenuItemFactory()
+
+    def test_seed_menus_adds_admin_users(self):
+        user = f.UserFactory()
+        self.seed(f'--admin-user={user.username}')
+        self.assertEqual(user.restaurant_set.count(), 2)
+
+    def test_seed_menus_unknown_admin_user_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            self.seed('--admin-user=unknown_user')
+        self.assertFalse(Restaurant.objects.exists())
+
+    def test_seed_menus_duplicate_restaurant_slug_raises_command_error(self):
+        restaurant = f.RestaurantFactory()
+        Restaurant.objects.filter(pk=restaurant.pk).update(
+            name=f'Seeded Restaurant {restaurant.pk + 1}',
+            slug=f'seeded-restaurant-{restaurant.pk + 1}')
+        with self.assertRaises(CommandError):
+            self.seed()
+        self.assertEqual(Restaurant.objects.count(), 1)
+        self.assertFalse(Menu.objects.exists())
+
+    def test_seed_menus_bad_size_raises_command_error(self):
+        with self.assertRaises(CommandError):
+            self.seed('--sections=0')
+
+    def test_seed_menus_indexes_new_objects(self):
+        self.seed()
+        self.assertEqual(SearchEntry.objects.count(), 66)
+        self.assertEqual(len(search('seeded restaurant')), 2)
+
+    def test_seed_menus_no_search_index(self):
+        self.seed('--no-search-index')
+        self.assertFalse(SearchEntry.objects.exists())
@@ -0,0 +1,84 @@
+import csv
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from menus_project import factories as f
+from . import export
+
+
+class IterExportTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitems = f.MenuItemFactory.create_batch(2, price=500)
+        cls.test_menuitem = cls.test_menuitems[0]
+
+    def test_iter_export_records_contains_every_object(self):
+        records = list(export.iter_export_records())
+        self.assertEqual(
+            [record['type'] for record in records],
+            ['restaurant'] * 2 + ['menu'] * 2 + ['menusection'] * 2
+            + ['menuitem'] * 2)
+
+    def test_iter_export_records_menuitem_record(self):
+        record = list(export.iter_export_records())[-2]
+        self.assertEqual(record, {
+            'type': 'menuitem',
+            'id': self.test_menuitem.pk,
+            'restaurant_id': self.test_menuitem.restaurant_id,
+            'menu_id': self.test_menuitem.menu_id,
+            'menusection_id': self.test_menuitem.menusection_id,
+            'name': self.test_menuitem.name,
+            'slug': self.test_menuitem.slug,
+            'description': self.test_menuitem.description,
+            'price': 500})
+
+    def test_iter_export_uses_one_query_per_model(self):
+        with self.assertNumQueries(4):
+            list(export.iter_export_records(chunk_size=1))
+
+    def test_iter_export_jsonl(self):
+        lines = list(export.iter_export('jsonl'))
+        self.assertEqual(len(lines), 8)
+        self.assertEqual(json.loads(lines[0])['type'], 'restaurant')
+
+    def test_iter_export_csv(self):
+        rows = list(csv.DictReader(StringIO(''.join(
+            export.iter_export('csv')))))
+        self.assertEqual(len(rows), 8)
+        self.assertEqual(rows[-1]['type'], 'menuitem')
+        self.assertEqual(rows[-1]['price'], '500')
+        self.assertEqual(rows[0]['price'], '')
+
+    def test_iter_export_bad_format(self):
+        with self.assertRaises(ValueError):
+            export.iter_export('xml')
+
+
+class ExportMenusCommandTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+
+    def test_command_writes_to_stdout(self):
+        stdout = StringIO()
+        call_command('export_menus', stdout=stdout)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(json.loads(lines[-1])['id'], self.test_menuitem.pk)
+
+    def test_command_writes_csv_to_output_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = os.path.join(temp_dir, 'menus.csv')
+            call_command(
+                'export_menus', '--format=csv', f'--output={output_path}')
+            with open(output_path, newline='') as output_file:
+                rows = list(csv.DictReader(output_file))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[-1]['name'], self.test_menuitem.name)
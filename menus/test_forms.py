@@ -1,7 +1,43 @@
 from django.forms import widgets
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 
-from menus.forms import MenuSectionForm, MenuItemForm
+from menus_project import factories as f
+from menus.forms import MenuForm, MenuSectionForm, MenuItemForm
+
+
+class UniqueSlugModelFormTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menu = f.MenuFactory()
+
+    def test_duplicate_slug_is_a_form_error(self):
+        form = MenuForm(data={
+            'restaurant': self.test_menu.restaurant.pk,
+            'name': self.test_menu.name})
+        self.assertFalse(form.is_valid())
+        self.assertIn(
+            "This name is too similar", str(form.non_field_errors()))
+
+    def test_unique_slug_is_valid(self):
+        form = MenuForm(data={
+            'restaurant': self.test_menu.restaurant.pk,
+            'name': f'{self.test_menu.name} 2'})
+        self.assertTrue(form.is_valid())
+
+    def test_existing_object_does_not_conflict_with_itself(self):
+        form = MenuForm(instance=self.test_menu, data={
+            'restaurant': self.test_menu.restaurant.pk,
+            'name': self.test_menu.name})
+        self.assertTrue(form.is_valid())
+
+    def test_invalid_form_does_not_change_the_slug(self):
+        other_menu = f.MenuFactory(restaurant=self.test_menu.restaurant)
+        form = MenuForm(instance=other_menu, data={
+            'restaurant': self.test_menu.restaurant.pk,
+            'name': self.test_menu.name})
+        self.assertFalse(form.is_valid())
+        self.assertNotEqual(form.instance.slug, self.test_menu.slug)
 
 
 class MenuSectionFormTest(SimpleTestCase):
@@ -1,6 +1,7 @@
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import IntegrityError, connection, models
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.text import slugify
 
@@ -123,11 +124,33 @@ class MenuModelTest(TestCase):
         ordering = self.test_menu._meta.ordering
         self.assertEqual(ordering, ['name'])
 
+    def test_meta_constraints(self):
+        constraint = self.test_menu._meta.constraints[0]
+        self.assertEqual(constraint.fields, ('restaurant', 'slug'))
+
     # VALIDATION #
     def test_validation_fail_restaurant_makes_two_menus_with_same_slug(self):
         with self.assertRaises(ValidationError):
             self.test_restaurant.menu_set.create(name=f"{self.test_menu.name}")
 
+    def test_validation_fail_error_message_for_duplicate_slug(self):
+        with self.assertRaisesMessage(ValidationError, "This name is too "
+                                      "similar to one of this restaurant's "
+                                      "existing menu names."):
+            self.test_restaurant.menu_set.create(name=self.test_menu.name)
+
+    def test_validation_database_rejects_duplicate_slug(self):
+        with self.assertRaises(IntegrityError):
+            Menu.objects.bulk_create([Menu(
+                restaurant=self.test_restaurant, name=self.test_menu.name,
+                slug=self.test_menu.slug)])
+
+    def test_save_does_not_query_for_duplicate_slugs(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.test_menu.save()
+        for query in queries:
+            self.assertNotIn('SELECT', query['sql'])
+
     def test_validation_do_not_allow_slug_if_it_is_a_reserved_keyword(self):
         with self.assertRaises(ValidationError):
             self.test_restaurant.menu_set.create(name='all')
@@ -197,6 +220,21 @@ class MenuSectionModelTest(TestCase):
                 .remote_field.on_delete
         self.assertTrue(on_delete is models.CASCADE)
 
+    # restaurant
+    def test_field_restaurant_related_model(self):
+        related_model = self.test_menusection._meta.get_field('restaurant') \
+            .related_model.__name__
+        self.assertEqual(related_model, 'Restaurant')
+
+    def test_field_restaurant_editable(self):
+        editable = \
+            self.test_menusection._meta.get_field('restaurant').editable
+        self.assertEqual(editable, False)
+
+    def test_field_restaurant_is_set_from_menu(self):
+        self.assertEqual(
+            self.test_menusection.restaurant, self.test_restaurant)
+
     # name
     def test_field_name_verbose_name(self):
         verbose_name = \
@@ -241,6 +279,13 @@ class MenuSectionModelTest(TestCase):
             self.test_menu.menusection_set.create(
                 name=self.test_menusection.name)
 
+    def test_validation_database_rejects_duplicate_slug(self):
+        with self.assertRaises(IntegrityError):
+            MenuSection.objects.bulk_create([MenuSection(
+                restaurant=self.test_restaurant, menu=self.test_menu,
+                name=self.test_menusection.name,
+                slug=self.test_menusection.slug)])
+
     def test_validation_do_not_allow_slug_if_it_is_a_reserved_keyword(self):
         with self.assertRaises(ValidationError):
             self.test_menu.menusection_set.create(name='all')
@@ -251,6 +296,36 @@ class MenuSectionModelTest(TestCase):
         test_menu_2.menusection_set.create(name=self.test_menusection.name)
         self.assertEqual(MenuSection.objects.count(), 2)
 
+    # denormalized fields
+    def test_save_moving_to_another_restaurant_updates_menuitems(self):
+        test_menuitem = self.test_menusection.menuitem_set.create(
+            name=c.TEST_MENUITEM_NAME)
+        test_restaurant_2 = \
+            Restaurant.objects.create(name=f'{c.TEST_RESTAURANT_NAME} 2')
+        test_menu_2 = test_restaurant_2.menu_set.create(name=c.TEST_MENU_NAME)
+
+        self.test_menusection.menu = test_menu_2
+        self.test_menusection.save()
+
+        self.assertEqual(self.test_menusection.restaurant, test_restaurant_2)
+        test_menuitem.refresh_from_db()
+        self.assertEqual(test_menuitem.menu, test_menu_2)
+        self.assertEqual(test_menuitem.restaurant, test_restaurant_2)
+
+    def test_menu_save_moving_to_another_restaurant_updates_children(self):
+        test_menuitem = self.test_menusection.menuitem_set.create(
+            name=c.TEST_MENUITEM_NAME)
+        test_restaurant_2 = \
+            Restaurant.objects.create(name=f'{c.TEST_RESTAURANT_NAME} 2')
+
+        self.test_menu.restaurant = test_restaurant_2
+        self.test_menu.save()
+
+        self.test_menusection.refresh_from_db()
+        test_menuitem.refresh_from_db()
+        self.assertEqual(self.test_menusection.restaurant, test_restaurant_2)
+        self.assertEqual(test_menuitem.restaurant, test_restaurant_2)
+
     # METHODS #
     def test_method_str(self):
         self.assertEqual(
@@ -359,10 +434,28 @@ class MenuItemModelTest(TestCase):
             self.test_menusection.menuitem_set.create(
                 name=self.test_menuitem.name)
 
+    def test_validation_database_rejects_duplicate_slug(self):
+        with self.assertRaises(IntegrityError):
+            MenuItem.objects.bulk_create([MenuItem(
+                restaurant=self.test_restaurant, menu=self.test_menu,
+                menusection=self.test_menusection,
+                name=self.test_menuitem.name, slug=self.test_menuitem.slug)])
+
     def test_validation_do_not_allow_slug_if_it_is_a_reserved_keyword(self):
         with self.assertRaises(ValidationError):
             self.test_menusection.menuitem_set.create(name='all')
 
+    # denormalized fields
+    def test_fields_restaurant_and_menu_are_set_from_menusection(self):
+        self.assertEqual(self.test_menuitem.restaurant, self.test_restaurant)
+        self.assertEqual(self.test_menuitem.menu, self.test_menu)
+
+    def test_fields_restaurant_and_menu_are_not_editable(self):
+        for field_name in ('restaurant', 'menu'):
+            self.assertEqual(
+                self.test_menuitem._meta.get_field(field_name).editable,
+                False)
+
     def test_validation_pass_two_menusections_with_same_menuitem_slug(self):
         test_menusection_2 = self.test_menu.menusection_set.create(
             name='{self.test_menusection.name} 2')
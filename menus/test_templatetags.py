@@ -0,0 +1,140 @@
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .fragments import get_menusection_block_key, prefetch_uncached_menuitems
+from .models import MenuSection, MenuItem
+from menus_project import factories as f
+from menus_project import render_cache
+
+
+@override_settings(RENDER_CACHE_ENABLED=True)
+class MenuSectionBlockTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory(price=500)
+        cls.test_menusection = cls.test_menuitem.menusection
+        cls.test_menu = cls.test_menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+    def setUp(self):
+        render_cache.get_cache().clear()
+
+    def render(self, menusection, template_string=None):
+        template_string = template_string \
+            or '{% menusection_block menusection %}'
+        return Template('{% load menus %}' + template_string) \
+            .render(Context({'menusection': menusection}))
+
+    def get_menusection(self, pk=None):
+        return MenuSection.objects.get(pk=pk or self.test_menusection.pk)
+
+    def test_menusection_block(self):
+        html = self.render(self.get_menusection())
+        self.assertIn(self.test_menusection.name, html)
+        self.assertIn(self.test_menuitem.name, html)
+        self.assertIn('$5.00', html)
+        self.assertIn(self.test_menuitem.get_absolute_url(), html)
+
+    def test_menusection_block_without_name(self):
+        html = self.render(
+            self.get_menusection(),
+            '{% menusection_block menusection show_name=False %}')
+        self.assertNotIn(
+            f'href="{self.test_menusection.get_absolute_url()}"', html)
+        self.assertIn(self.test_menuitem.name, html)
+
+    def test_menusection_block_compact(self):
+        menusection = self.get_menusection()
+        menusection.note = 'Test Note'
+        html = self.render(
+            menusection, '{% menusection_block menusection compact=True %}')
+        self.assertNotIn('Test Note', html)
+        self.assertIn('<ul class="mt-2 mb-4">', html)
+        self.assertIn(self.test_menuitem.name, html)
+
+        # compact blocks are cached separately
+        self.assertIn('Test Note', self.render(menusection))
+
+    def test_menusection_block_without_items(self):
+        menusection = f.MenuSectionFactory(menu=self.test_menu)
+        self.assertIn("This section has no items.",
+                      self.render(self.get_menusection(menusection.pk)))
+
+    def test_menusection_block_is_cached(self):
+        self.render(self.get_menusection())
+        menusection = self.get_menusection()
+        # the section's items are not loaded
+        with self.assertNumQueries(2):
+            html = self.render(menusection)
+        self.assertIn(self.test_menuitem.name, html)
+
+    @override_settings(RENDER_CACHE_ENABLED=False)
+    def test_menusection_block_render_cache_disabled(self):
+        self.render(self.get_menusection())
+        self.assertFalse(render_cache.get_cache().get(
+            get_menusection_block_key(self.get_menusection())))
+
+    def test_menuitem_change_rerenders_the_block(self):
+        self.render(self.get_menusection())
+        self.test_menuitem.name = 'Renamed Item'
+        self.test_menuitem.save()
+        self.assertIn('Renamed Item', self.render(self.get_menusection()))
+
+    def test_menuitem_delete_rerenders_the_block(self):
+        self.render(self.get_menusection())
+        self.test_menuitem.delete()
+        self.assertIn("This section has no items.",
+                      self.render(self.get_menusection()))
+
+    def test_menuitem_move_rerenders_the_old_block(self):
+        other_menusection = f.MenuSectionFactory(menu=self.test_menu)
+        self.render(self.get_menusection())
+
+        menuitem = MenuItem.objects.get(pk=self.test_menuitem.pk)
+        menuitem.menusection = other_menusection
+        menuitem.save()
+        self.assertIn("This section has no items.",
+                      self.render(self.get_menusection()))
+        self.assertIn(
+            menuitem.get_absolute_url(),
+            self.render(self.get_menusection(other_menusection.pk)))
+
+    def test_menuitem_change_keeps_the_other_blocks(self):
+        other_menusection = f.MenuSectionFactory(menu=self.test_menu)
+        key = get_menusection_block_key(
+            self.get_menusection(other_menusection.pk))
+        self.render(self.get_menusection(other_menusection.pk))
+
+        self.test_menuitem.save()
+        self.assertEqual(
+            get_menusection_block_key(
+                self.get_menusection(other_menusection.pk)),
+            key)
+
+    def test_restaurant_rename_rerenders_the_block(self):
+        self.render(self.get_menusection())
+        self.test_restaurant.name = 'Renamed Restaurant'
+        self.test_restaurant.save()
+        self.assertIn(reverse('menus:menuitem_detail', kwargs={
+            'restaurant_slug': 'renamed-restaurant',
+            'menu_slug': self.test_menu.slug,
+            'menusection_slug': self.test_menusection.slug,
+            'menuitem_slug': self.test_menuitem.slug}),
+            self.render(self.get_menusection()))
+
+    def test_prefetch_uncached_menuitems(self):
+        other_menusection = f.MenuSectionFactory(menu=self.test_menu)
+        f.MenuItemFactory(menusection=other_menusection)
+        self.render(self.get_menusection())
+
+        menusections = list(
+            MenuSection.objects.select_related('menu__restaurant')
+            .filter(menu=self.test_menu).order_by('pk'))
+        # one query for the items of the uncached section
+        with self.assertNumQueries(1):
+            prefetch_uncached_menuitems(menusections)
+        with self.assertNumQueries(0):
+            for menusection in menusections:
+                self.render(menusection)
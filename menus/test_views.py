@@ -1,4 +1,6 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.text import slugify
 
@@ -297,6 +299,18 @@ class MenuDetailViewTest(TestCase):
     def test_model_name(self):
         self.assertEqual(self.view.model.__name__, 'Menu')
 
+    # get_context_data()
+    def test_context_user_is_restaurant_admin_unauthenticated_user(self):
+        self.assertFalse(self.context['user_is_restaurant_admin'])
+
+    def test_context_user_is_restaurant_admin_authorized_user(self):
+        self.client.login(
+            username=self.restaurant_admin_user.username,
+            password=c.TEST_USER_PASSWORD)
+        self.setUp()
+
+        self.assertTrue(self.context['user_is_restaurant_admin'])
+
     # get_object()
     def test_method_get_object(self):
         self.assertEqual(self.view.get_object(), self.test_menu)
@@ -351,6 +365,27 @@ class MenuDetailViewTest(TestCase):
         for i in range(len(test_menusections)):
             self.assertIn(test_menusections[i].name, self.html)
 
+    # template - query count
+    def test_query_count_does_not_grow_with_menu_size(self):
+        # get query count for a menu with 1 section and 1 item
+        test_menusection = f.MenuSectionFactory(menu=self.test_menu)
+        f.MenuItemFactory(menusection=test_menusection)
+        with CaptureQueriesContext(connection) as small_menu_queries:
+            self.client.get(self.current_test_url)
+
+        # get query count for a menu with 5 sections and 5 items per section
+        for i in range(4):
+            f.MenuSectionFactory(menu=self.test_menu)
+        for menusection in self.test_menu.menusection_set.all():
+            f.MenuItemFactory.create_batch(
+                5 - menusection.menuitem_set.count(), menusection=menusection)
+        self.assertEqual(MenuItem.objects.count(), 25)
+        with CaptureQueriesContext(connection) as large_menu_queries:
+            self.client.get(self.current_test_url)
+
+        self.assertEqual(
+            len(small_menu_queries), len(large_menu_queries))
+
     # bad kwargs
     def test_bad_kwargs(self):
         for i in range(len(self.view.kwargs)):
@@ -463,6 +498,11 @@ class MenuUpdateViewTest(TestCase):
     def test_request_get_method_authorized_user(self):
         self.assertEqual(self.response.status_code, 200)
 
+    def test_request_get_method_authorized_user_query_count(self):
+        # session, user, object (with its ancestors) and permissions
+        with self.assertNumQueries(4):
+            self.client.get(self.current_test_url)
+
     def test_request_get_method_staff_user(self):
         # give staff privileges to self.test_user
         self.test_user.is_staff = True
@@ -587,6 +627,22 @@ class MenuUpdateViewTest(TestCase):
         self.assertEqual(self.test_menu.name, old_menu_name)
         self.assertEqual(self.test_menu.slug, old_menu_slug)
 
+    def test_validation_post_attempt_duplicate_renders_original_object(self):
+        test_menu_2 = self.test_restaurant.menu_set.create(
+            name='Other Menu')
+
+        self.response = self.client.post(self.current_test_url, {
+            'restaurant': self.test_menu.restaurant.pk,
+            'name': test_menu_2.name})
+        self.html = unescape(self.response.content.decode('utf-8'))
+
+        # the page still shows the menu's saved name and URL
+        self.assertIn(f"Return to Menu: {self.test_menu.name}</a>", self.html)
+        self.assertIn(
+            f'href="{self.test_menu.get_absolute_url()}"', self.html)
+        self.assertNotIn(
+            f'href="{test_menu_2.get_absolute_url()}"', self.html)
+
     # bad kwargs
     def test_bad_kwargs(self):
         for i in range(len(self.view.kwargs)):
@@ -1054,6 +1110,17 @@ class MenuSectionDetailViewTest(TestCase):
         self.assertEqual(
             self.view.model.__name__, 'MenuSection')
 
+    # get_context_data()
+    def test_context_user_is_restaurant_admin_authorized_user(self):
+        self.assertTrue(self.context['user_is_restaurant_admin'])
+
+    def test_context_user_is_restaurant_admin_unauthorized_user(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+
+        self.assertFalse(self.response.context['user_is_restaurant_admin'])
+
     # get_object()
     def test_method_get_object(self):
         self.assertEqual(self.view.get_object(), self.test_menusection)
@@ -1196,6 +1263,11 @@ class MenuSectionUpdateViewTest(TestCase):
     def test_request_get_method_authorized_user(self):
         self.assertEqual(self.response.status_code, 200)
 
+    def test_request_get_method_authorized_user_query_count(self):
+        # session, user, object (with its ancestors) and permissions
+        with self.assertNumQueries(4):
+            self.client.get(self.current_test_url)
+
     def test_request_get_method_staff_user(self):
         # give staff privileges to self.test_user
         self.test_user.is_staff = True
@@ -1324,6 +1396,24 @@ class MenuSectionUpdateViewTest(TestCase):
         self.assertEqual(self.test_menusection.name, old_menusection_name)
         self.assertEqual(self.test_menusection.slug, old_menusection_slug)
 
+    def test_validation_post_attempt_duplicate_renders_original_object(self):
+        test_menusection_2 = \
+            self.test_menusection.menu.menusection_set.create(
+                name=f'New {self.test_menusection.name}')
+
+        self.response = self.client.post(self.current_test_url, {
+            'menu': self.test_menusection.menu.pk,
+            'name': test_menusection_2.name})
+        self.html = unescape(self.response.content.decode('utf-8'))
+
+        # the page still shows the section's saved name and URL
+        self.assertIn(
+            f"Return to Section: {self.test_menusection.name}</a>", self.html)
+        self.assertIn(
+            f'href="{self.test_menusection.get_absolute_url()}"', self.html)
+        self.assertNotIn(
+            f'href="{test_menusection_2.get_absolute_url()}"', self.html)
+
     # bad kwargs
     def test_bad_kwargs(self):
         for i in range(len(self.view.kwargs)):
@@ -1832,6 +1922,18 @@ class MenuItemDetailViewTest(TestCase):
     def test_model_name(self):
         self.assertEqual(self.view.model.__name__, 'MenuItem')
 
+    # get_context_data()
+    def test_context_user_is_restaurant_admin_unauthenticated_user(self):
+        self.assertFalse(self.context['user_is_restaurant_admin'])
+
+    def test_context_user_is_restaurant_admin_authorized_user(self):
+        self.client.login(
+            username=self.restaurant_admin_user.username,
+            password=c.TEST_USER_PASSWORD)
+        self.setUp()
+
+        self.assertTrue(self.context['user_is_restaurant_admin'])
+
     # get_object()
     def test_method_get_object(self):
         self.assertEqual(self.view.get_object(), self.test_menuitem)
@@ -1967,6 +2069,11 @@ class MenuItemUpdateViewTest(TestCase):
     def test_request_get_method_authorized_user(self):
         self.assertEqual(self.response.status_code, 200)
 
+    def test_request_get_method_authorized_user_query_count(self):
+        # session, user, object (with its ancestors) and permissions
+        with self.assertNumQueries(4):
+            self.client.get(self.current_test_url)
+
     def test_request_get_method_staff_user(self):
         # give staff privileges to self.test_user
         self.test_user.is_staff = True
@@ -2122,6 +2229,25 @@ class MenuItemUpdateViewTest(TestCase):
             self.test_menuitem.description, old_menuitem_description)
         self.assertEqual(self.test_menuitem.slug, old_menuitem_slug)
 
+    def test_validation_post_attempt_duplicate_renders_original_object(self):
+        test_menuitem_2 = \
+            self.test_menuitem.menusection.menuitem_set.create(
+                name=f'Updated {self.test_menuitem.name}')
+
+        self.response = self.client.post(self.current_test_url, {
+            'menusection': self.test_menuitem.menusection.pk,
+            'name': test_menuitem_2.name,
+            'description': self.test_menuitem.description})
+        self.html = unescape(self.response.content.decode('utf-8'))
+
+        # the page still shows the item's saved name and URL
+        self.assertIn(
+            f"Return to Item: {self.test_menuitem.name}</a>", self.html)
+        self.assertIn(
+            f'href="{self.test_menuitem.get_absolute_url()}"', self.html)
+        self.assertNotIn(
+            f'href="{test_menuitem_2.get_absolute_url()}"', self.html)
+
     # bad kwargs
     def test_bad_kwargs(self):
         for i in range(len(self.view.kwargs)):
@@ -1,6 +1,7 @@
 from django.urls import path
 
 from . import views
+from menus_project.async_views import as_async_view
 
 app_name = 'menus'
 
@@ -12,7 +13,7 @@ urlpatterns = [
          views.MenuCreateView.as_view(),
          name='menu_create'),
     path('<slug:menu_slug>/',
-         views.MenuDetailView.as_view(),
+         as_async_view(views.MenuDetailView),
          name='menu_detail'),
     path('<slug:menu_slug>/edit/',
          views.MenuUpdateView.as_view(),
@@ -24,7 +25,7 @@ urlpatterns = [
          views.MenuSectionCreateView.as_view(),
          name='menusection_create'),
     path('<slug:menu_slug>/<slug:menusection_slug>/',
-         views.MenuSectionDetailView.as_view(),
+         as_async_view(views.MenuSectionDetailView),
          name='menusection_detail'),
     path('<slug:menu_slug>/<slug:menusection_slug>/edit/',
          views.MenuSectionUpdateView.as_view(),
@@ -36,7 +37,7 @@ urlpatterns = [
          views.MenuItemCreateView.as_view(),
          name='menuitem_create'),
     path('<slug:menu_slug>/<slug:menusection_slug>/<slug:menuitem_slug>/',
-         views.MenuItemDetailView.as_view(),
+         as_async_view(views.MenuItemDetailView),
          name='menuitem_detail'),
     path('<slug:menu_slug>/<slug:menusection_slug>/<slug:menuitem_slug>/edit/',
          views.MenuItemUpdateView.as_view(),
@@ -1,13 +1,20 @@
+import copy
+
 from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
 from django.http import HttpResponseRedirect
-from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.views.generic import CreateView, DetailView, DeleteView
 from django.views.generic.edit import UpdateView
 
-from menus_project.permissions import UserHasRestaurantPermissionsMixin
+from menus_project.conditional import RestaurantConditionalGetMixin
+from menus_project.helpers import memoize_object
+from menus_project.permissions import (
+    UserHasRestaurantPermissionsMixin, user_is_restaurant_admin)
+from menus_project.render_cache import RestaurantRenderCacheMixin
+from menus_project.slug_paths import get_object_by_slug_path
 from .forms import MenuForm, MenuSectionForm, MenuItemForm
+from .fragments import prefetch_uncached_menuitems
 from .models import Menu, MenuSection, MenuItem
 from restaurants.models import Restaurant
 
@@ -25,8 +32,7 @@ class MenuCreateView(
     success_message = "Menu Created: %(name)s"
 
     def dispatch(self, request, *args, **kwargs):
-        self.restaurant = get_object_or_404(
-            Restaurant, slug=self.kwargs['restaurant_slug'])
+        self.restaurant = get_object_by_slug_path(Restaurant, self.kwargs)
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -39,14 +45,26 @@ class MenuCreateView(
         return {'restaurant': self.restaurant}
 
 
-class MenuDetailView(DetailView):
+class MenuDetailView(RestaurantConditionalGetMixin,
+                     RestaurantRenderCacheMixin, DetailView):
     model = Menu
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'user_is_restaurant_admin':
+                user_is_restaurant_admin(self.request, self.object)})
+        return context
+
     def get_object(self):
-        return get_object_or_404(
-            Menu,
-            restaurant__slug=self.kwargs['restaurant_slug'],
-            slug=self.kwargs['menu_slug'])
+        # load the whole menu tree up front so that the template does not
+        # make any additional queries per section or per item (the items of
+        # sections whose blocks are cached are not needed)
+        queryset = Menu.objects.select_related('restaurant') \
+            .prefetch_related('menusection_set')
+        menu = get_object_by_slug_path(queryset, self.kwargs)
+        prefetch_uncached_menuitems(list(menu.menusection_set.all()))
+        return menu
 
 
 class MenuUpdateView(
@@ -66,11 +84,17 @@ class MenuUpdateView(
         return {'restaurant': self.get_object().restaurant,
                 'name': self.get_object().name}
 
+    def get_form_kwargs(self):
+        # the form writes the submitted values into a copy of the object, so
+        # that a rejected form does not change the object in the context
+        kwargs = super().get_form_kwargs()
+        kwargs['instance'] = copy.copy(self.get_object())
+        return kwargs
+
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            Menu,
-            restaurant__slug=self.kwargs['restaurant_slug'],
-            slug=self.kwargs['menu_slug'])
+        return get_object_by_slug_path(
+            Menu.objects.select_related('restaurant'), self.kwargs)
 
 
 class MenuDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
@@ -82,11 +106,10 @@ class MenuDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
         messages.success(self.request, self.success_message % obj.__dict__)
         return super().delete(request, *args, **kwargs)
 
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            Menu,
-            restaurant__slug=self.kwargs['restaurant_slug'],
-            slug=self.kwargs['menu_slug'])
+        return get_object_by_slug_path(
+            Menu.objects.select_related('restaurant'), self.kwargs)
 
     def get_success_url(self):
         return self.object.restaurant.get_absolute_url()
@@ -99,10 +122,7 @@ class MenuSectionCreateView(
     success_message = "Menu Section Created: %(name)s"
 
     def dispatch(self, request, *args, **kwargs):
-        self.menu = get_object_or_404(
-            Menu,
-            restaurant__slug=self.kwargs['restaurant_slug'],
-            slug=self.kwargs['menu_slug'])
+        self.menu = get_object_by_slug_path(Menu, self.kwargs)
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -115,15 +135,19 @@ class MenuSectionCreateView(
         return {'menu': self.menu}
 
 
-class MenuSectionDetailView(DetailView):
+class MenuSectionDetailView(RestaurantConditionalGetMixin,
+                            RestaurantRenderCacheMixin, DetailView):
     model = MenuSection
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'user_is_restaurant_admin':
+                user_is_restaurant_admin(self.request, self.object)})
+        return context
+
     def get_object(self):
-        return get_object_or_404(
-            MenuSection,
-            menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menu__slug=self.kwargs['menu_slug'],
-            slug=self.kwargs['menusection_slug'])
+        return get_object_by_slug_path(MenuSection, self.kwargs)
 
 
 class MenuSectionUpdateView(
@@ -143,12 +167,18 @@ class MenuSectionUpdateView(
         return {'menu': self.get_object().menu,
                 'name': self.get_object().name}
 
+    def get_form_kwargs(self):
+        # the form writes the submitted values into a copy of the object, so
+        # that a rejected form does not change the object in the context
+        kwargs = super().get_form_kwargs()
+        kwargs['instance'] = copy.copy(self.get_object())
+        return kwargs
+
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            MenuSection,
-            menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menu__slug=self.kwargs['menu_slug'],
-            slug=self.kwargs['menusection_slug'])
+        return get_object_by_slug_path(
+            MenuSection.objects.select_related('menu__restaurant'),
+            self.kwargs)
 
 
 class MenuSectionDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
@@ -160,12 +190,11 @@ class MenuSectionDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
         messages.success(self.request, self.success_message % obj.__dict__)
         return super().delete(request, *args, **kwargs)
 
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            MenuSection,
-            menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menu__slug=self.kwargs['menu_slug'],
-            slug=self.kwargs['menusection_slug'])
+        return get_object_by_slug_path(
+            MenuSection.objects.select_related('menu__restaurant'),
+            self.kwargs)
 
     def get_success_url(self):
         return self.object.menu.get_absolute_url()
@@ -178,11 +207,7 @@ class MenuItemCreateView(
     success_message = "Menu Item Created: %(name)s"
 
     def dispatch(self, request, *args, **kwargs):
-        self.menusection = get_object_or_404(
-            MenuSection,
-            menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menu__slug=self.kwargs['menu_slug'],
-            slug=self.kwargs['menusection_slug'])
+        self.menusection = get_object_by_slug_path(MenuSection, self.kwargs)
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -198,16 +223,19 @@ class MenuItemCreateView(
         return self.object.menusection.get_absolute_url()
 
 
-class MenuItemDetailView(DetailView):
+class MenuItemDetailView(RestaurantConditionalGetMixin,
+                         RestaurantRenderCacheMixin, DetailView):
     model = MenuItem
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'user_is_restaurant_admin':
+                user_is_restaurant_admin(self.request, self.object)})
+        return context
+
     def get_object(self):
-        return get_object_or_404(
-            MenuItem,
-            menusection__menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menusection__menu__slug=self.kwargs['menu_slug'],
-            menusection__slug=self.kwargs['menusection_slug'],
-            slug=self.kwargs['menuitem_slug'])
+        return get_object_by_slug_path(MenuItem, self.kwargs)
 
 
 class MenuItemUpdateView(
@@ -228,13 +256,18 @@ class MenuItemUpdateView(
                 'name': self.get_object().name,
                 'description': self.get_object().description}
 
+    def get_form_kwargs(self):
+        # the form writes the submitted values into a copy of the object, so
+        # that a rejected form does not change the object in the context
+        kwargs = super().get_form_kwargs()
+        kwargs['instance'] = copy.copy(self.get_object())
+        return kwargs
+
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            MenuItem,
-            menusection__menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menusection__menu__slug=self.kwargs['menu_slug'],
-            menusection__slug=self.kwargs['menusection_slug'],
-            slug=self.kwargs['menuitem_slug'])
+        return get_object_by_slug_path(
+            MenuItem.objects.select_related('menusection__menu__restaurant'),
+            self.kwargs)
 
 
 class MenuItemDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
@@ -246,13 +279,11 @@ class MenuItemDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
         messages.success(self.request, self.success_message % obj.__dict__)
         return super().delete(request, *args, **kwargs)
 
+    @memoize_object
     def get_object(self):
-        return get_object_or_404(
-            MenuItem,
-            menusection__menu__restaurant__slug=self.kwargs['restaurant_slug'],
-            menusection__menu__slug=self.kwargs['menu_slug'],
-            menusection__slug=self.kwargs['menusection_slug'],
-            slug=self.kwargs['menuitem_slug'])
+        return get_object_by_slug_path(
+            MenuItem.objects.select_related('menusection__menu__restaurant'),
+            self.kwargs)
 
     def get_success_url(self):
         return self.object.menusection.get_absolute_url()
@@ -3,6 +3,9 @@ ASGI config for menus_project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+To serve it with gunicorn and a uvicorn worker, see the 'gunicorn-start-asgi'
+script and the 'Deployment' section of the README.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
 """
@@ -0,0 +1,113 @@
+import functools
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from menus_project.conditional import (
+    get_cached_restaurant_updated_at, get_conditional_get_response)
+from menus_project.render_cache import (
+    RestaurantRenderCacheMixin, get_cached_page)
+
+
+def get_cached_response(request, restaurant_slug):
+    """
+    Return the response to an anonymous request for a restaurant page if it
+    can be answered from the render cache alone, without touching the
+    database. Otherwise, return None.
+
+    A request is only known to be anonymous (and to have no pending messages)
+    without loading its session if it has no session or messages cookie.
+    """
+    if not settings.RENDER_CACHE_ENABLED \
+            or request.method != 'GET' \
+            or request.GET \
+            or settings.SESSION_COOKIE_NAME in request.COOKIES \
+            or 'messages' in request.COOKIES:
+        return None
+
+    updated_at = get_cached_restaurant_updated_at(restaurant_slug)
+    if updated_at is None:
+        return None
+    content = get_cached_page(restaurant_slug, request.path)
+    if content is None:
+        return None
+    response = get_conditional_get_response(
+        request, updated_at, lambda: HttpResponse(content))
+    # the page depends on the session, like the sync view's responses
+    patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+def as_async_view(view_class, **initkwargs):
+    """
+    Return an async version of a public, read-only class-based view.
+
+    Under ASGI, pages that are in the render cache are answered without
+    waiting for the thread that runs the sync views and their database work,
+    so that slow clients and cache misses do not hold up cache hits. (Cache
+    backends may block, so the cache lookups run in the default thread pool.)
+    Every other request is handed to the sync view, which runs on Django's
+    sync thread as usual.
+    """
+    view = view_class.as_view(**initkwargs)
+    sync_view = sync_to_async(view)
+    cached_response = \
+        sync_to_async(get_cached_response, thread_sensitive=False)
+    uses_render_cache = issubclass(view_class, RestaurantRenderCacheMixin)
+
+    async def async_view(request, *args, **kwargs):
+        if uses_render_cache:
+            response = await cached_response(
+                request, kwargs['restaurant_slug'])
+            if response is not None:
+                return response
+        return await sync_view(request, *args, **kwargs)
+
+    async_view.view_class = view_class
+    async_view.view_initkwargs = initkwargs
+    return async_view
+
+
+def run_in_thread_pool(view, request, *args, **kwargs):
+    # the connections of this thread are closed like those of the sync
+    # thread, which are closed by the request_started and request_finished
+    # signals (subject to CONN_MAX_AGE)
+    close_old_connections()
+    try:
+        response = view(request, *args, **kwargs)
+        # the response is rendered while the connection is still open
+        if hasattr(response, 'render'):
+            response.render()
+        return response
+    finally:
+        close_old_connections()
+
+
+def as_async_api_view(view_class, **initkwargs):
+    """
+    Return an async version of an API view whose GET and HEAD requests run
+    in the default thread pool, with their own database connections, instead
+    of on Django's single sync thread.
+
+    Under ASGI, several API reads (and their queries) can then run at once.
+    Requests that write run on the sync thread as usual. This is disabled by
+    ASYNC_API_THREAD_POOL = False (e.g. in the tests, whose transactions
+    are not visible from other threads).
+    """
+    view = view_class.as_view(**initkwargs)
+    sync_view = sync_to_async(view)
+    pooled_view = sync_to_async(
+        functools.partial(run_in_thread_pool, view), thread_sensitive=False)
+
+    async def async_view(request, *args, **kwargs):
+        if settings.ASYNC_API_THREAD_POOL \
+                and request.method in ('GET', 'HEAD'):
+            return await pooled_view(request, *args, **kwargs)
+        return await sync_view(request, *args, **kwargs)
+
+    # e.g. csrf_exempt, and the view class for drf-spectacular
+    async_view.__dict__.update(view.__dict__)
+    return async_view
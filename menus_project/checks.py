@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core import checks
+
+LOCAL_MEMORY_CACHE_BACKEND = 'django.core.cache.backends.locmem.LocMemCache'
+
+
+@checks.register(checks.Tags.caches)
+def check_shared_render_cache(app_configs, **kwargs):
+    """
+    The render cache (and the menu snapshots) are invalidated by signals,
+    which also run in other processes than the web server's (e.g. the job
+    workers and management commands), so they must be stored in a cache that
+    every process shares.
+    """
+    if not settings.RENDER_CACHE_ENABLED:
+        return []
+    errors = []
+    for alias in sorted({settings.RENDER_CACHE_ALIAS,
+                         settings.MENU_SNAPSHOT_CACHE_ALIAS}):
+        backend = settings.CACHES.get(alias, {}).get('BACKEND')
+        if backend == LOCAL_MEMORY_CACHE_BACKEND:
+            errors.append(checks.Error(
+                f"The '{alias}' cache is a local-memory cache, which is not "
+                "shared by the server's processes, so their changes would "
+                "not invalidate each other's cached pages.",
+                hint="Use a shared cache backend in CACHES (e.g. a "
+                     "file-based cache or memcached), or set "
+                     "RENDER_CACHE_ENABLED = False.",
+                id='menus_project.E001'))
+    return errors
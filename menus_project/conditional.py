@@ -0,0 +1,126 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib import messages
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from menus_project import render_cache
+from menus_project.helpers import memoize_object
+from menus_project.permissions import get_restaurant_pk
+from restaurants.models import Restaurant
+
+
+def _get_updated_at_key(restaurant_slug):
+    generation = render_cache.get_restaurant_generation(restaurant_slug)
+    return f'render_cache:updated_at:{restaurant_slug}:{generation}'
+
+
+def get_restaurant_updated_at(restaurant_slug):
+    """
+    Return the time at which a restaurant or one of its menus, sections or
+    items last changed, or None if there is no such restaurant.
+
+    When the render cache is enabled, the result is cached until the
+    restaurant's generation is bumped.
+    """
+    if not settings.RENDER_CACHE_ENABLED:
+        return Restaurant.objects.filter(slug=restaurant_slug) \
+            .values_list('updated_at', flat=True).first()
+
+    cache = render_cache.get_cache()
+    key = _get_updated_at_key(restaurant_slug)
+    updated_at = cache.get(key)
+    if updated_at is None:
+        updated_at = Restaurant.objects.filter(slug=restaurant_slug) \
+            .values_list('updated_at', flat=True).first()
+        if updated_at is not None:
+            cache.set(key, updated_at, settings.RENDER_CACHE_TIMEOUT)
+    return updated_at
+
+
+def get_cached_restaurant_updated_at(restaurant_slug):
+    """
+    Return the cached result of get_restaurant_updated_at() without querying
+    the database, or None if it is not cached.
+    """
+    if not settings.RENDER_CACHE_ENABLED:
+        return None
+    return render_cache.get_cache().get(_get_updated_at_key(restaurant_slug))
+
+
+def get_etag(updated_at):
+    return '"%s"' % hashlib.md5(
+        updated_at.isoformat().encode('utf-8')).hexdigest()
+
+
+def get_conditional_get_response(request, updated_at, get_response):
+    """
+    Return '304 Not Modified' if the client's copy of a page is still current.
+    Otherwise, return the response of get_response() with an ETag and a
+    Last-Modified header that are derived from updated_at.
+
+    Either way, clients are told to revalidate their copy before every use,
+    instead of reusing it for a heuristic amount of time.
+    """
+    etag = get_etag(updated_at)
+    last_modified = int(updated_at.timestamp())
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = get_response()
+        if response.status_code != 200:
+            return response
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
+class RestaurantConditionalGetMixin:
+    """
+    Answer conditional GET requests for public restaurant pages.
+
+    The validators are derived from the restaurant's 'updated_at', which is
+    updated whenever the restaurant or one of its menus, sections or items
+    changes, so they can be checked without loading the page's objects.
+    Like the render cache, only anonymous requests without pending messages
+    are handled, since only their pages are identical for every visitor.
+    """
+
+    def get(self, request, *args, **kwargs):
+        if request.user.is_authenticated \
+                or len(messages.get_messages(request)):
+            return super().get(request, *args, **kwargs)
+
+        updated_at = get_restaurant_updated_at(self.kwargs['restaurant_slug'])
+        if updated_at is None:
+            return super().get(request, *args, **kwargs)
+        return get_conditional_get_response(
+            request, updated_at,
+            lambda: super(RestaurantConditionalGetMixin, self).get(
+                request, *args, **kwargs))
+
+
+class RestaurantObjectConditionalGetMixin:
+    """
+    Answer conditional GET requests for the API's restaurant objects.
+
+    The object is still retrieved (and its permissions checked), but it is
+    only serialized when the client's copy is out of date. It is only
+    retrieved once per request, so a full response costs no more than it
+    would without this mixin.
+    """
+
+    @memoize_object
+    def get_object(self):
+        return super().get_object()
+
+    def get(self, request, *args, **kwargs):
+        obj = self.get_object()
+        updated_at = Restaurant.objects.filter(pk=get_restaurant_pk(obj)) \
+            .values_list('updated_at', flat=True).first()
+        return get_conditional_get_response(
+            request, updated_at,
+            lambda: super(RestaurantObjectConditionalGetMixin, self).get(
+                request, *args, **kwargs))
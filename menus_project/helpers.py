@@ -1,4 +1,23 @@
+import functools
+
+
 def get_next_url(request, url):
     if request.GET.get('next', None):
         return request.GET['next']
     return url
+
+
+def memoize_object(get_object):
+    """
+    Decorate a view's get_object() so that the object is only retrieved once
+    per request. (A view instance only lives for a single request.)
+
+    This lets get_context_data(), get_initial(), the generic view itself and
+    UserHasRestaurantPermissionsMixin.test_func() share the same object.
+    """
+    @functools.wraps(get_object)
+    def wrapper(self):
+        if not hasattr(self, '_memoized_object'):
+            self._memoized_object = get_object(self)
+        return self._memoized_object
+    return wrapper
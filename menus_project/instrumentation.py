@@ -0,0 +1,196 @@
+import collections
+import contextlib
+import functools
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.template.base import Template
+
+logger = logging.getLogger(__name__)
+
+# upper bounds (in milliseconds) of the request time histogram's buckets
+HISTOGRAM_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+UNRESOLVED_VIEW_NAME = '<unresolved>'
+
+_local = threading.local()
+
+
+class RequestRecorder:
+    """Record the queries and the template render time of a single request."""
+
+    def __init__(self):
+        self.queries = []
+        self.db_time = 0
+        self.render_time = 0
+        self.render_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        # used as a database execute wrapper
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start_time
+            self.queries.append(sql)
+
+
+def _record_render_time(render):
+    @functools.wraps(render)
+    def wrapper(self, *args, **kwargs):
+        recorder = getattr(_local, 'recorder', None)
+        # only count the outermost template (i.e. not its includes)
+        if recorder is None or recorder.render_depth:
+            return render(self, *args, **kwargs)
+
+        recorder.render_depth += 1
+        start_time = time.perf_counter()
+        try:
+            return render(self, *args, **kwargs)
+        finally:
+            recorder.render_time += time.perf_counter() - start_time
+            recorder.render_depth -= 1
+    wrapper.records_render_time = True
+    return wrapper
+
+
+def get_duplicated_queries(queries):
+    """
+    Return the SQL statements that were executed more than once, and how many
+    times, starting with the most frequent one. The statements contain
+    placeholders instead of their parameters, so a query that is made once
+    per object of a list (an 'N+1' query) is counted as a duplicate.
+    """
+    return [(sql, count)
+            for sql, count in collections.Counter(queries).most_common()
+            if count > 1]
+
+
+class RequestStats:
+    """Aggregate the timings of requests per view, in this process only."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, timings):
+        with self.lock:
+            stats = self.views.get(view_name)
+            if stats is None:
+                stats = self.views[view_name] = {
+                    'count': 0, 'queries': 0, 'db_ms': 0, 'render_ms': 0,
+                    'view_ms': 0, 'total_ms': 0, 'max_total_ms': 0,
+                    'histogram': [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)}
+            stats['count'] += 1
+            for key in ('queries', 'db_ms', 'render_ms', 'view_ms',
+                        'total_ms'):
+                stats[key] += timings[key]
+            stats['max_total_ms'] = \
+                max(stats['max_total_ms'], timings['total_ms'])
+            bucket = len(HISTOGRAM_BUCKETS_MS)
+            for i, upper_bound in enumerate(HISTOGRAM_BUCKETS_MS):
+                if timings['total_ms'] <= upper_bound:
+                    bucket = i
+                    break
+            stats['histogram'][bucket] += 1
+
+    def get_summary(self):
+        """
+        Return the number of requests, the average timings, the maximum
+        request time and the request time histogram of each view.
+        """
+        with self.lock:
+            summary = {}
+            for view_name, stats in sorted(self.views.items()):
+                count = stats['count']
+                summary[view_name] = {
+                    'count': count,
+                    'avg_queries': round(stats['queries'] / count, 1),
+                    **{f'avg_{key}': round(stats[key] / count, 2)
+                       for key in ('db_ms', 'render_ms', 'view_ms',
+                                   'total_ms')},
+                    'max_total_ms': round(stats['max_total_ms'], 2),
+                    'histogram': [
+                        {'le_ms': upper_bound, 'count': bucket_count}
+                        for upper_bound, bucket_count in zip(
+                            HISTOGRAM_BUCKETS_MS + [None],
+                            stats['histogram'])],
+                }
+            return summary
+
+    def reset(self):
+        with self.lock:
+            self.views = {}
+
+
+request_stats = RequestStats()
+
+
+class InstrumentationMiddleware:
+    """
+    Record the number of queries, the database time, the template render
+    time and the view time of each request.
+
+    The timings are sent to the client in a 'Server-Timing' header (which
+    browsers show in their developer tools), and aggregated per URL name
+    (e.g. 'menus:menu_detail') in request_stats, which staff members can
+    see at the API's 'stats' endpoint. Requests that take longer than
+    INSTRUMENTATION_SLOW_REQUEST_MS are logged along with their duplicated
+    queries.
+
+    This middleware is only installed when INSTRUMENTATION_ENABLED is set.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not getattr(Template.render, 'records_render_time', False):
+            Template.render = _record_render_time(Template.render)
+
+    def __call__(self, request):
+        recorder = RequestRecorder()
+        _local.recorder = recorder
+        start_time = time.perf_counter()
+        try:
+            with contextlib.ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            _local.recorder = None
+        total_time = time.perf_counter() - start_time
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        view_name = resolver_match.view_name if resolver_match \
+            else UNRESOLVED_VIEW_NAME
+        timings = {
+            'queries': len(recorder.queries),
+            'db_ms': recorder.db_time * 1000,
+            'render_ms': recorder.render_time * 1000,
+            'view_ms': (total_time - recorder.render_time) * 1000,
+            'total_ms': total_time * 1000,
+        }
+        request_stats.record(view_name, timings)
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timings["db_ms"]:.1f};'
+            f'desc="{timings["queries"]} queries"',
+            f'render;dur={timings["render_ms"]:.1f}',
+            f'view;dur={timings["view_ms"]:.1f}',
+            f'total;dur={timings["total_ms"]:.1f}',
+        ])
+
+        if timings['total_ms'] >= settings.INSTRUMENTATION_SLOW_REQUEST_MS:
+            self.log_slow_request(request, view_name, timings, recorder)
+        return response
+
+    def log_slow_request(self, request, view_name, timings, recorder):
+        duplicated_queries = get_duplicated_queries(recorder.queries)
+        logger.warning(
+            "Slow request: %s %s (%s) took %.1f ms, with %d queries "
+            "(%.1f ms) and %.1f ms of template rendering. "
+            "Duplicated queries:%s",
+            request.method, request.path, view_name, timings['total_ms'],
+            timings['queries'], timings['db_ms'], timings['render_ms'],
+            ''.join(f"\n  {count}x {sql}"
+                    for sql, count in duplicated_queries) or " none")
@@ -0,0 +1,67 @@
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(name, pk, reverse=False):
+    """
+    Encode the position of an object in a ('name', 'id') ordering, and
+    whether the page that it points to comes after it or (with 'reverse')
+    before it.
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps([name, pk, reverse]).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(encoded):
+    """
+    Return the name, id and direction of an encoded cursor, or raise
+    InvalidCursor.
+    """
+    try:
+        name, pk, reverse = json.loads(
+            base64.urlsafe_b64decode(encoded.encode('ascii')))
+        if not isinstance(name, str) or not isinstance(pk, int):
+            raise ValueError
+    except (TypeError, ValueError, binascii.Error):
+        raise InvalidCursor
+    return name, pk, bool(reverse)
+
+
+def get_keyset_page(queryset, page_size, name=None, pk=None, reverse=False,
+                    name_field='name'):
+    """
+    Return up to page_size objects in ('name', 'id') order that come after
+    the given name and id (or, with 'reverse', before them), and whether
+    there are more objects beyond them.
+
+    The page is fetched with a single range query over a (name, id) index,
+    no matter how deep into the list it is. 'name_field' may also be an
+    annotation, e.g. an upper-case name that has an index of its own.
+    """
+    if reverse:
+        queryset = queryset.order_by(f'-{name_field}', '-id')
+        if pk is not None:
+            queryset = queryset.filter(
+                Q(**{f'{name_field}__lt': name})
+                | Q(**{name_field: name, 'id__lt': pk}))
+    else:
+        queryset = queryset.order_by(name_field, 'id')
+        if pk is not None:
+            queryset = queryset.filter(
+                Q(**{f'{name_field}__gt': name})
+                | Q(**{name_field: name, 'id__gt': pk}))
+
+    # fetch one extra object to find out if there is another page
+    objs = list(queryset[:page_size + 1])
+    has_more = len(objs) > page_size
+    objs = objs[:page_size]
+    if reverse:
+        objs.reverse()
+    return objs, has_more
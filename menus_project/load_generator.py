@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+
+def percentile(sorted_values, percent):
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+async def fetch(host, port, path, delay=0, headers=None):
+    """
+    Make a single HTTP/1.1 request like a slow client would: send the request
+    one line at a time and read the response in small chunks, sleeping for
+    'delay' seconds in between. Return the status code and the latency.
+    """
+    lines = [f'GET {path} HTTP/1.1', f'Host: {host}', 'Connection: close']
+    lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+    lines.append('')
+
+    start_time = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for line in lines:
+            writer.write(f'{line}\r\n'.encode('latin-1'))
+            await writer.drain()
+            await asyncio.sleep(delay)
+        status_line = await reader.readline()
+        while await reader.read(4096):
+            await asyncio.sleep(delay)
+    finally:
+        writer.close()
+    return int(status_line.split()[1]), time.perf_counter() - start_time
+
+
+async def run_client(host, port, path, delay, headers, requests, results):
+    for i in range(requests):
+        try:
+            results.append(await fetch(host, port, path, delay, headers))
+        except (OSError, IndexError, ValueError):
+            results.append((None, None))
+
+
+async def run_clients(
+        host, port, path, clients, requests, delay=0, headers=None):
+    results = []
+    await asyncio.gather(*[
+        run_client(host, port, path, delay, headers, requests, results)
+        for i in range(clients)])
+    return results
+
+
+def run_load(host, port, path, clients, requests, delay=0, headers=None):
+    """
+    Request a path with a number of concurrent clients, and return the
+    number of requests and errors, the throughput and the latency
+    percentiles (in milliseconds).
+    """
+    start_time = time.perf_counter()
+    results = asyncio.run(run_clients(
+        host, port, path, clients, requests, delay, headers))
+    elapsed_time = time.perf_counter() - start_time
+
+    latencies = sorted(
+        latency for status, latency in results
+        if status is not None and status < 400)
+    stats = {
+        'requests': len(results),
+        'errors': len(results) - len(latencies),
+        'total_time_s': round(elapsed_time, 3),
+        'throughput_rps': round(len(latencies) / elapsed_time, 1),
+    }
+    for percent in (50, 95, 99):
+        stats[f'p{percent}_ms'] = \
+            round(percentile(latencies, percent) * 1000, 2) \
+            if latencies else None
+    return stats
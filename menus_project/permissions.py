@@ -1,7 +1,58 @@
+from django.conf import settings
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.core.cache import caches
+
 from restaurants.models import Restaurant
 from menus.models import Menu, MenuSection, MenuItem
 
+RESTAURANT_OBJECT_TYPES = (Restaurant, Menu, MenuSection, MenuItem)
+
+
+def get_restaurant_pk(obj):
+    """Return the pk of the restaurant that a restaurant object belongs to."""
+    if type(obj) == Restaurant:
+        return obj.pk
+    elif type(obj) in (Menu, MenuSection, MenuItem):
+        return obj.restaurant_id
+
+
+def get_restaurant_admin_cache_key(restaurant_pk, user_pk):
+    return f'restaurant_admin:{restaurant_pk}:{user_pk}'
+
+
+def user_is_restaurant_admin(request, obj):
+    """
+    Check if request.user is one of the admin_users of the restaurant that
+    obj (a Restaurant, Menu, MenuSection or MenuItem) belongs to.
+
+    The result is memoized on the request, and is also cached across
+    requests for settings.RESTAURANT_ADMIN_CACHE_TIMEOUT seconds. (The
+    cross-request cache is invalidated by the signals in restaurants.signals)
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return False
+
+    restaurant_pk = get_restaurant_pk(obj)
+    memo_key = (restaurant_pk, user.pk)
+    if not hasattr(request, '_restaurant_admin_memo'):
+        request._restaurant_admin_memo = {}
+    if memo_key in request._restaurant_admin_memo:
+        return request._restaurant_admin_memo[memo_key]
+
+    timeout = settings.RESTAURANT_ADMIN_CACHE_TIMEOUT
+    cache = caches[settings.RESTAURANT_ADMIN_CACHE_ALIAS]
+    cache_key = get_restaurant_admin_cache_key(restaurant_pk, user.pk)
+    is_admin = cache.get(cache_key) if timeout else None
+    if is_admin is None:
+        is_admin = Restaurant.admin_users.through.objects.filter(
+            restaurant_id=restaurant_pk, user_id=user.pk).exists()
+        if timeout:
+            cache.set(cache_key, is_admin, timeout)
+
+    request._restaurant_admin_memo[memo_key] = is_admin
+    return is_admin
+
 
 class UserHasRestaurantPermissionsMixin(UserPassesTestMixin):
 
@@ -24,31 +75,9 @@ class UserHasRestaurantPermissionsMixin(UserPassesTestMixin):
         if not obj:
             obj = self.get_object()
 
-        if type(obj) == Restaurant:
-            if self.request.user in obj.admin_users.all() \
-                    or self.request.user.is_staff:
-                return True
-            else:
-                return False
-        elif type(obj) == Menu:
-            if self.request.user in obj.restaurant.admin_users.all() \
-                    or self.request.user.is_staff:
-                return True
-            else:
-                return False
-        elif type(obj) == MenuSection:
-            if self.request.user in obj.menu.restaurant.admin_users.all() \
-                    or self.request.user.is_staff:
-                return True
-            else:
-                return False
-        elif type(obj) == MenuItem:
-            if self.request.user in \
-                    obj.menusection.menu.restaurant.admin_users.all() \
-                    or self.request.user.is_staff:
-                return True
-            else:
-                return False
+        if type(obj) in RESTAURANT_OBJECT_TYPES:
+            return self.request.user.is_staff \
+                or user_is_restaurant_admin(self.request, obj)
 
         raise AttributeError(
                 "This permission needs to be called on a view with a "
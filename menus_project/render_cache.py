@@ -0,0 +1,171 @@
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+
+RESTAURANT_LIST_FIRST_PAGE_KEY = 'render_cache:restaurant_list:first_page'
+
+
+class RenderCacheStats:
+    """
+    Count the page lookups that hit and missed the render cache, in this
+    process only (like the request statistics), so that counting them does
+    not write to the shared cache on every request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit):
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get_summary(self):
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def reset(self):
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+
+
+render_cache_stats = RenderCacheStats()
+
+
+def get_cache():
+    return caches[settings.RENDER_CACHE_ALIAS]
+
+
+def _get_generation_key(restaurant_slug):
+    return f'render_cache:generation:{restaurant_slug}'
+
+
+def _incr(key):
+    cache = get_cache()
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        return cache.incr(key)
+
+
+def get_generation(key):
+    """
+    Return the current value of a generation counter, which is part of the
+    keys of the cached values that it invalidates.
+
+    New generations start from the current time (in milliseconds) so that a
+    generation that has been evicted from the cache can never be reused.
+    """
+    cache = get_cache()
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def bump_generation(key):
+    """
+    Bump a generation counter, in every process that shares the cache.
+
+    Inside a transaction, the counter is bumped again once it commits: until
+    then, other requests (and processes) still read the old rows, and may
+    cache what they render from them under the new generation.
+    """
+    get_generation(key)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _incr(key))
+    return _incr(key)
+
+
+def get_restaurant_generation(restaurant_slug):
+    """Return the current generation of a restaurant's rendered pages."""
+    return get_generation(_get_generation_key(restaurant_slug))
+
+
+def bump_restaurant_generation(restaurant_slug):
+    """Invalidate every cached page that belongs to a restaurant."""
+    return bump_generation(_get_generation_key(restaurant_slug))
+
+
+def get_page_cache_key(restaurant_slug, path):
+    generation = get_restaurant_generation(restaurant_slug)
+    path_hash = hashlib.md5(path.encode('utf-8')).hexdigest()
+    return f'render_cache:page:{restaurant_slug}:{generation}:{path_hash}'
+
+
+def get_cached_page(restaurant_slug, path):
+    """Return the cached content of a page (or None) and count the lookup."""
+    content = get_cache().get(get_page_cache_key(restaurant_slug, path))
+    render_cache_stats.record(hit=content is not None)
+    return content
+
+
+def get_restaurant_list_first_page(get_page):
+    """
+    Return the first page of the restaurant list from the cache, or get it
+    with get_page() and cache it. The page is deleted from the cache whenever
+    a restaurant is saved or deleted.
+    """
+    if not settings.RENDER_CACHE_ENABLED:
+        return get_page()
+    cache = get_cache()
+    page = cache.get(RESTAURANT_LIST_FIRST_PAGE_KEY)
+    if page is None:
+        page = get_page()
+        cache.set(RESTAURANT_LIST_FIRST_PAGE_KEY, page,
+                  settings.RENDER_CACHE_TIMEOUT)
+    return page
+
+
+def delete_restaurant_list_first_page():
+    get_cache().delete(RESTAURANT_LIST_FIRST_PAGE_KEY)
+
+
+class RestaurantRenderCacheMixin:
+    """
+    Serve the rendered HTML of public restaurant pages from the cache.
+
+    Only anonymous GET requests without a query string or pending messages
+    are cached, since those are the only requests whose pages are identical
+    for every visitor. The cache key contains the restaurant's generation,
+    which is bumped whenever the restaurant or one of its menus, sections or
+    items is saved or deleted. (See the 'signals' module of each app.)
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not self.can_use_render_cache(request):
+            return super().get(request, *args, **kwargs)
+
+        restaurant_slug = self.kwargs['restaurant_slug']
+        content = get_cached_page(restaurant_slug, request.path)
+        if content is not None:
+            return HttpResponse(content)
+
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        # do not cache pages that contain messages
+        if response.status_code == 200 \
+                and not len(messages.get_messages(request)):
+            get_cache().set(
+                get_page_cache_key(restaurant_slug, request.path),
+                response.content, settings.RENDER_CACHE_TIMEOUT)
+        return response
+
+    def can_use_render_cache(self, request):
+        return settings.RENDER_CACHE_ENABLED \
+            and not request.user.is_authenticated \
+            and not request.GET \
+            and not len(messages.get_messages(request))
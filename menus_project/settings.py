@@ -4,6 +4,7 @@ Generated by 'django-admin startproject' using Django 3.1.2.
 
 import os
 import sys
+import tempfile
 
 from pathlib import Path
 
@@ -14,6 +15,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_AUTO_FIELD = 'django.db.models.AutoField'
 
 DEBUG = server_config.DEBUG
+TESTING = 'test' in sys.argv or 'test_coverage' in sys.argv
 SECRET_KEY = secret_key.SECRET_KEY
 ALLOWED_HOSTS = ['*']
 
@@ -30,8 +32,11 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     # local
     'api.apps.ApiConfig',
+    'images.apps.ImagesConfig',
+    'jobs.apps.JobsConfig',
     'menus.apps.MenusConfig',
     'restaurants.apps.RestaurantsConfig',
+    'search.apps.SearchConfig',
     'users.apps.UsersConfig',
     # third-party
     'allauth',
@@ -58,6 +63,20 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# run the API's GET requests in a thread pool under ASGI (the tests' data is
+# only visible from the thread that created it)
+ASYNC_API_THREAD_POOL = \
+    getattr(server_config, 'ASYNC_API_THREAD_POOL', not TESTING)
+
+# instrumentation (optional): query count and timings of each request
+INSTRUMENTATION_ENABLED = \
+    getattr(server_config, 'INSTRUMENTATION_ENABLED', False)
+INSTRUMENTATION_SLOW_REQUEST_MS = \
+    getattr(server_config, 'INSTRUMENTATION_SLOW_REQUEST_MS', 500)
+if INSTRUMENTATION_ENABLED:
+    MIDDLEWARE.insert(
+        0, 'menus_project.instrumentation.InstrumentationMiddleware')
+
 ROOT_URLCONF = 'menus_project.urls'
 
 TEMPLATES = [
@@ -88,6 +107,49 @@ DATABASES = {
     }
 }
 
+# cache (shared by every process of the server by default, since the signals
+# that invalidate it also run in the job workers and management commands)
+CACHES = getattr(server_config, 'CACHES', {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    } if TESTING else {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'menus_project_cache'),
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+})
+RENDER_CACHE_ENABLED = \
+    getattr(server_config, 'RENDER_CACHE_ENABLED', not TESTING)
+RENDER_CACHE_ALIAS = 'default'
+RENDER_CACHE_TIMEOUT = 60 * 60 * 24
+RESTAURANT_ADMIN_CACHE_ALIAS = 'default'
+RESTAURANT_ADMIN_CACHE_TIMEOUT = 0 if TESTING else 60 * 5  # 0 = disabled
+MENU_SNAPSHOT_CACHE_ALIAS = 'default'
+# username and email availability checks (0 = disabled)
+USER_AVAILABILITY_CACHE_ALIAS = 'default'
+USER_AVAILABILITY_CACHE_TIMEOUT = 0 if TESTING else 60
+USER_AVAILABILITY_FILTER_TIMEOUT = 0 if TESTING else 60 * 5
+USER_AVAILABILITY_FILTER_ERROR_RATE = 0.01
+
+# image variants (resized copies of uploaded images, generated by the job
+# queue's workers)
+IMAGE_VARIANT_WIDTHS = \
+    getattr(server_config, 'IMAGE_VARIANT_WIDTHS', [320, 640, 1280])
+IMAGE_VARIANT_QUALITY = getattr(server_config, 'IMAGE_VARIANT_QUALITY', 80)
+
+# job queue (see 'manage.py run_workers'); the tests run jobs right away
+JOBS_RUN_IMMEDIATELY = \
+    getattr(server_config, 'JOBS_RUN_IMMEDIATELY', TESTING)
+JOBS_WORKER_PROCESSES = getattr(server_config, 'JOBS_WORKER_PROCESSES', 2)
+JOBS_POLL_INTERVAL = 1  # seconds
+JOBS_MAX_ATTEMPTS = 5
+JOBS_RETRY_DELAY = 10  # seconds, doubled after each attempt
+JOBS_TIMEOUT = 60 * 10  # seconds, after which a running job is retried
+
+# search ('sqlite', 'postgres' or 'python', default: the database's own
+# full-text search)
+SEARCH_BACKEND = getattr(server_config, 'SEARCH_BACKEND', None)
+
 # allauth
 SITE_ID = 1
 
@@ -100,6 +162,9 @@ SPECTACULAR_SETTINGS = {
     'LICENSE': {'name': 'Creative Commons (CC BY 4.0)'},
     'VERSION': '0.0.l',
 }
+# a schema that is generated at deploy time, which is served instead of
+# generating it (e.g. './manage.py spectacular --file schema.yml')
+API_SCHEMA_FILE = getattr(server_config, 'API_SCHEMA_FILE', None)
 
 # authentication
 LOGIN_URL = 'users:login'
@@ -111,7 +176,7 @@ CAPTCHA_CHALLENGE_FUNCT = 'captcha.helpers.random_char_challenge'
 CAPTCHA_NOISE_FUNCTIONS = []
 CAPTCHA_LETTER_ROTATION = (-20, 25)
 
-if 'test' in sys.argv or 'test_coverage' in sys.argv:
+if TESTING:
     CAPTCHA_TEST_MODE = True
 
 # corsheaders
@@ -161,4 +226,9 @@ REST_FRAMEWORK = {
     ],
     'TEST_REQUEST_DEFAULT_FORMAT': 'json',
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.NameCursorPagination',
 }
+API_PAGE_SIZE = getattr(server_config, 'API_PAGE_SIZE', 50)
+API_MAX_PAGE_SIZE = getattr(server_config, 'API_MAX_PAGE_SIZE', 200)
+RESTAURANT_LIST_PAGE_SIZE = \
+    getattr(server_config, 'RESTAURANT_LIST_PAGE_SIZE', 50)
@@ -0,0 +1,141 @@
+import collections
+import hashlib
+import threading
+
+from django.conf import settings
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+
+from menus_project import render_cache
+from restaurants.models import Restaurant
+from menus.models import Menu, MenuSection, MenuItem
+
+# the URL kwargs of a slug path, from the restaurant down to the menu item
+SLUG_PATH_KWARGS = (
+    'restaurant_slug', 'menu_slug', 'menusection_slug', 'menuitem_slug')
+
+# the model of the last object of a slug path, and the lookups of its slugs
+SLUG_PATH_MODELS = {
+    1: (Restaurant, ('slug',)),
+    2: (Menu, ('restaurant__slug', 'slug')),
+    3: (MenuSection, ('restaurant__slug', 'menu__slug', 'slug')),
+    4: (MenuItem,
+        ('restaurant__slug', 'menu__slug', 'menusection__slug', 'slug')),
+}
+
+# the pks of the slug paths that this process has resolved most recently
+MAX_LOCAL_SLUG_PATHS = 10000
+_local_slug_paths = collections.OrderedDict()
+_local_slug_paths_lock = threading.Lock()
+
+
+def _get_generation_key(restaurant_slug):
+    return f'slug_path:generation:{restaurant_slug}'
+
+
+def get_slug_path_generation(restaurant_slug):
+    """
+    Return the current generation of a restaurant's slug paths, which is
+    bumped whenever one of the paths may stop pointing to the same objects.
+    """
+    return render_cache.get_generation(_get_generation_key(restaurant_slug))
+
+
+def bump_slug_path_generation(restaurant_slug):
+    """
+    Forget the resolved slug paths of a restaurant, in every process. (Inside
+    a transaction, they are forgotten again once it commits.)
+    """
+    return render_cache.bump_generation(_get_generation_key(restaurant_slug))
+
+
+def get_slug_path_key(slug_path, generation):
+    path_hash = hashlib.md5('/'.join(slug_path).encode('utf-8')).hexdigest()
+    return f'slug_path:{slug_path[0]}:{generation}:{path_hash}'
+
+
+def get_slug_path(kwargs):
+    """Return the slugs of a view's URL kwargs, as a tuple."""
+    return tuple(kwargs[name] for name in SLUG_PATH_KWARGS if name in kwargs)
+
+
+def query_slug_path(slug_path):
+    model, lookups = SLUG_PATH_MODELS[len(slug_path)]
+    # the pks of the object's ancestors are denormalized on the object
+    fields = ['restaurant_id', 'menu_id', 'menusection_id'][
+        :len(slug_path) - 1] + ['pk']
+    return model.objects.filter(**dict(zip(lookups, slug_path))) \
+        .values_list(*fields).first()
+
+
+def resolve_slug_path(slug_path):
+    """
+    Return the pks of the objects of a slug path (e.g. the restaurant, menu
+    and section of a section's URL), or None if there is no such path.
+
+    When the render cache is enabled, resolved paths are kept in this
+    process and in the shared cache, until their restaurant's slug path
+    generation is bumped (see the 'signals' module of each app). Paths that
+    do not exist are not cached.
+    """
+    if not settings.RENDER_CACHE_ENABLED:
+        return query_slug_path(slug_path)
+
+    generation = get_slug_path_generation(slug_path[0])
+    local_key = (generation,) + slug_path
+    with _local_slug_paths_lock:
+        pks = _local_slug_paths.get(local_key)
+        if pks is not None:
+            _local_slug_paths.move_to_end(local_key)
+            return pks
+
+    cache = render_cache.get_cache()
+    key = get_slug_path_key(slug_path, generation)
+    pks = cache.get(key)
+    if pks is None:
+        pks = query_slug_path(slug_path)
+        if pks is None:
+            return None
+        cache.set(key, pks, settings.RENDER_CACHE_TIMEOUT)
+
+    with _local_slug_paths_lock:
+        _local_slug_paths[local_key] = pks
+        if len(_local_slug_paths) > MAX_LOCAL_SLUG_PATHS:
+            _local_slug_paths.popitem(last=False)
+    return pks
+
+
+def forget_slug_path(slug_path):
+    """Forget a single resolved slug path, in this process and the cache."""
+    generation = get_slug_path_generation(slug_path[0])
+    with _local_slug_paths_lock:
+        _local_slug_paths.pop((generation,) + slug_path, None)
+    render_cache.get_cache().delete(get_slug_path_key(slug_path, generation))
+
+
+def clear_local_slug_paths():
+    with _local_slug_paths_lock:
+        _local_slug_paths.clear()
+
+
+def get_object_by_slug_path(queryset, kwargs):
+    """
+    Return the object at the end of the slug path in a view's URL kwargs,
+    which is fetched by its primary key, or raise Http404. (Without the
+    render cache, the object is fetched by its slug path instead.)
+    """
+    slug_path = get_slug_path(kwargs)
+    model, lookups = SLUG_PATH_MODELS[len(slug_path)]
+    if settings.RENDER_CACHE_ENABLED:
+        pks = resolve_slug_path(slug_path)
+        if pks is None:
+            model = getattr(queryset, 'model', queryset)
+            raise Http404(
+                f"No {model._meta.object_name} matches the given query.")
+        obj = get_object_or_404(queryset, pk=pks[-1])
+        if obj.slug == slug_path[-1]:
+            return obj
+        # the path was resolved while the object's slug was being changed,
+        # so it is forgotten and the object is looked up by its slugs
+        forget_slug_path(slug_path)
+    return get_object_or_404(queryset, **dict(zip(lookups, slug_path)))
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.test import (
+    AsyncClient, TestCase, TransactionTestCase, override_settings)
+from django.urls import resolve, reverse
+
+from menus_project import constants as c
+from menus_project import factories as f
+from menus_project import render_cache
+from menus.views import MenuDetailView
+
+
+@override_settings(RENDER_CACHE_ENABLED=True)
+class AsAsyncViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menu = cls.test_menuitem.menusection.menu
+
+        cls.current_test_url = reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': cls.test_menu.restaurant.slug,
+            'menu_slug': cls.test_menu.slug})
+
+    def setUp(self):
+        render_cache.get_cache().clear()
+
+    def test_view_is_async(self):
+        view = resolve(self.current_test_url).func
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+        self.assertEqual(view.view_class, MenuDetailView)
+
+    def test_cached_page_is_served_without_queries(self):
+        first_response = self.client.get(self.current_test_url)
+        self.assertIsNotNone(first_response.context)
+
+        with self.assertNumQueries(0):
+            self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.content, first_response.content)
+        self.assertEqual(self.response['ETag'], first_response['ETag'])
+        # the page varies on the same headers as the sync view's page
+        self.assertEqual(
+            set(self.response['Vary'].split(', ')),
+            set(first_response['Vary'].split(', ')))
+        self.assertIn('Cookie', self.response['Vary'])
+
+    def test_cached_page_if_none_match_returns_304(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        with self.assertNumQueries(0):
+            self.response = self.client.get(
+                self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 304)
+
+    def test_request_with_session_cookie_is_handled_by_sync_view(self):
+        self.client.get(self.current_test_url)
+
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.assertIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+        self.response = self.client.get(self.current_test_url)
+        self.assertIsNotNone(self.response.context)
+
+    def test_uncached_page_is_handled_by_sync_view(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertIsNotNone(self.response.context)
+
+    async def test_async_client(self):
+        async_client = AsyncClient()
+        first_response = await async_client.get(self.current_test_url)
+        self.assertEqual(first_response.status_code, 200)
+
+        self.response = await async_client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.content, first_response.content)
+
+
+# the tests' data must be committed to be visible from the thread pool
+@override_settings(ASYNC_API_THREAD_POOL=True)
+class AsAsyncApiViewTest(TransactionTestCase):
+
+    def setUp(self):
+        self.test_user = f.UserFactory()
+        self.test_menu = f.MenuFactory()
+        self.current_test_url = reverse('api:menu_detail', kwargs={
+            'restaurant_pk': self.test_menu.restaurant.pk,
+            'menu_pk': self.test_menu.pk})
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+
+        # the threads that open a database connection
+        self.connection_threads = []
+        connection_created.connect(self.connection_created)
+        self.addCleanup(
+            connection_created.disconnect, self.connection_created)
+
+    def connection_created(self, sender, connection, **kwargs):
+        self.connection_threads.append(threading.current_thread())
+
+    def test_view_is_async(self):
+        view = resolve(self.current_test_url).func
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+        self.assertTrue(view.csrf_exempt)
+
+    def test_get_request_runs_in_thread_pool(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.json()['name'], self.test_menu.name)
+        # the request's queries ran in another thread, on its own connection
+        self.assertTrue(self.connection_threads)
+        self.assertNotIn(threading.main_thread(), self.connection_threads)
+
+    def test_write_request_runs_on_sync_thread(self):
+        self.test_menu.restaurant.admin_users.add(self.test_user)
+        self.response = self.client.patch(
+            self.current_test_url, {'name': 'Updated Menu'},
+            content_type='application/json')
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.connection_threads, [])
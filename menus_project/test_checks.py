@@ -0,0 +1,29 @@
+from django.test import SimpleTestCase, override_settings
+
+from menus_project.checks import check_shared_render_cache
+
+LOCAL_MEMORY_CACHES = {'default': {
+    'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+FILE_BASED_CACHES = {'default': {
+    'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+    'LOCATION': '/tmp/menus_project_test_cache'}}
+
+
+class CheckSharedRenderCacheTest(SimpleTestCase):
+
+    @override_settings(
+        RENDER_CACHE_ENABLED=True, CACHES=LOCAL_MEMORY_CACHES)
+    def test_local_memory_cache_is_an_error(self):
+        errors = check_shared_render_cache(None)
+        self.assertEqual([error.id for error in errors],
+                         ['menus_project.E001'])
+
+    @override_settings(
+        RENDER_CACHE_ENABLED=True, CACHES=FILE_BASED_CACHES)
+    def test_shared_cache_is_valid(self):
+        self.assertEqual(check_shared_render_cache(None), [])
+
+    @override_settings(
+        RENDER_CACHE_ENABLED=False, CACHES=LOCAL_MEMORY_CACHES)
+    def test_local_memory_cache_without_render_cache_is_valid(self):
+        self.assertEqual(check_shared_render_cache(None), [])
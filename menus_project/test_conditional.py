@@ -0,0 +1,147 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from menus_project import constants as c
+from menus_project import factories as f
+from menus.models import Menu, MenuSection
+from restaurants.models import Restaurant
+
+
+class UpdatedAtPropagationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menusection = cls.test_menuitem.menusection
+        cls.test_menu = cls.test_menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+    def get_updated_at(self, model, obj):
+        return model.objects.get(pk=obj.pk).updated_at
+
+    def test_menuitem_save_updates_ancestors(self):
+        self.test_menuitem.save()
+        for model, obj in ((MenuSection, self.test_menusection),
+                           (Menu, self.test_menu),
+                           (Restaurant, self.test_restaurant)):
+            self.assertEqual(self.get_updated_at(model, obj),
+                             self.test_menuitem.updated_at)
+
+    def test_menusection_delete_updates_ancestors(self):
+        old_updated_at = self.get_updated_at(Restaurant, self.test_restaurant)
+        self.test_menusection.delete()
+        self.assertGreater(
+            self.get_updated_at(Restaurant, self.test_restaurant),
+            old_updated_at)
+
+    def test_admin_users_change_updates_restaurant(self):
+        old_updated_at = self.get_updated_at(Restaurant, self.test_restaurant)
+        self.test_restaurant.admin_users.add(f.UserFactory())
+        self.assertGreater(
+            self.get_updated_at(Restaurant, self.test_restaurant),
+            old_updated_at)
+
+
+class RestaurantConditionalGetMixinTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menu = cls.test_menuitem.menusection.menu
+
+        cls.current_test_url = reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': cls.test_menu.restaurant.slug,
+            'menu_slug': cls.test_menu.slug})
+
+    def test_response_has_validators(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertIn('ETag', self.response)
+        self.assertIn('Last-Modified', self.response)
+        self.assertEqual(self.response['Cache-Control'], 'no-cache')
+
+    def test_if_none_match_returns_304_without_loading_the_page(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        with self.assertNumQueries(1):
+            self.response = self.client.get(
+                self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 304)
+
+    def test_if_modified_since_returns_304(self):
+        last_modified = \
+            self.client.get(self.current_test_url)['Last-Modified']
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(self.response.status_code, 304)
+
+    def test_descendant_change_returns_200(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.test_menuitem.save()
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertNotEqual(self.response['ETag'], etag)
+
+    def test_authenticated_user_is_not_handled(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+        self.assertNotIn('ETag', self.response)
+
+    def test_bad_kwargs_return_404(self):
+        self.response = self.client.get(reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': self.test_menu.restaurant.slug,
+            'menu_slug': 'bad-slug'}))
+        self.assertEqual(self.response.status_code, 404)
+        self.assertNotIn('ETag', self.response)
+
+
+class RestaurantObjectConditionalGetMixinTest(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menu = cls.test_menuitem.menusection.menu
+
+        cls.current_test_url = reverse('api:menu_detail', kwargs={
+            'restaurant_pk': cls.test_menu.restaurant.pk,
+            'menu_pk': cls.test_menu.pk})
+
+    def setUp(self):
+        self.client.login(
+            username=self.test_user.username, password=c.TEST_USER_PASSWORD)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 304)
+        self.assertEqual(self.response['Cache-Control'], 'no-cache')
+
+    def test_object_is_retrieved_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(
+            len([query for query in queries
+                 if query['sql'].startswith('SELECT')
+                 and 'FROM "menus_menu"' in query['sql']]),
+            1)
+
+    def test_if_none_match_unauthenticated_user_returns_403(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.client.logout()
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 403)
+
+    def test_descendant_change_returns_200(self):
+        etag = self.client.get(self.current_test_url)['ETag']
+        self.test_menuitem.save()
+        self.response = self.client.get(
+            self.current_test_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.response.status_code, 200)
@@ -1,7 +1,7 @@
 from django.test import RequestFactory, SimpleTestCase
 from django.urls import reverse
 
-from menus_project.helpers import get_next_url
+from menus_project.helpers import get_next_url, memoize_object
 
 
 class GetNextUrlTest(SimpleTestCase):
@@ -20,3 +20,22 @@ class GetNextUrlTest(SimpleTestCase):
         self.request = RequestFactory().get(self.url)
         func_to_test = get_next_url(self.request, self.url)
         self.assertEqual(func_to_test, self.url)
+
+
+class MemoizeObjectTest(SimpleTestCase):
+
+    def setUp(self):
+        class TestView:
+            calls = 0
+
+            @memoize_object
+            def get_object(self):
+                self.calls += 1
+                return object()
+
+        self.view = TestView()
+
+    def test_object_is_retrieved_once(self):
+        obj = self.view.get_object()
+        self.assertIs(self.view.get_object(), obj)
+        self.assertEqual(self.view.calls, 1)
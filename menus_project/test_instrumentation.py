@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from menus_project import factories as f
+from menus_project.instrumentation import (
+    RequestStats, get_duplicated_queries, request_stats)
+
+INSTRUMENTATION_MIDDLEWARE = \
+    'menus_project.instrumentation.InstrumentationMiddleware'
+
+
+@override_settings(
+    MIDDLEWARE=[INSTRUMENTATION_MIDDLEWARE] + settings.MIDDLEWARE,
+    INSTRUMENTATION_SLOW_REQUEST_MS=60000)
+class InstrumentationMiddlewareTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menu = cls.test_menuitem.menusection.menu
+
+        cls.current_test_url = reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': cls.test_menu.restaurant.slug,
+            'menu_slug': cls.test_menu.slug})
+
+    def setUp(self):
+        request_stats.reset()
+
+    def get_server_timing(self, response):
+        return dict(metric.split(';', 1)
+                    for metric in response['Server-Timing'].split(', '))
+
+    def test_response_has_server_timing_header(self):
+        self.response = self.client.get(self.current_test_url)
+        server_timing = self.get_server_timing(self.response)
+        self.assertEqual(
+            list(server_timing), ['db', 'render', 'view', 'total'])
+        self.assertIn('desc="4 queries"', server_timing['db'])
+
+    def test_request_is_recorded_per_url_name(self):
+        self.client.get(self.current_test_url)
+        self.client.get(self.current_test_url)
+
+        stats = request_stats.get_summary()['menus:menu_detail']
+        self.assertEqual(stats['count'], 2)
+        self.assertEqual(stats['avg_queries'], 4)
+        self.assertGreater(stats['avg_render_ms'], 0)
+        self.assertEqual(
+            sum(bucket['count'] for bucket in stats['histogram']), 2)
+
+    def test_unresolved_request_is_recorded(self):
+        self.client.get('/does-not-exist/')
+        self.assertIn('<unresolved>', request_stats.get_summary())
+
+    def test_slow_request_is_logged(self):
+        with self.settings(INSTRUMENTATION_SLOW_REQUEST_MS=0), \
+                self.assertLogs('menus_project.instrumentation') as logs:
+            self.client.get(self.current_test_url)
+        self.assertIn('(menus:menu_detail)', logs.output[0])
+        self.assertIn('Duplicated queries: none', logs.output[0])
+
+    def test_fast_request_is_not_logged(self):
+        with self.assertRaises(AssertionError), \
+                self.assertLogs('menus_project.instrumentation'):
+            self.client.get(self.current_test_url)
+
+
+class RequestStatsTest(SimpleTestCase):
+
+    def setUp(self):
+        self.stats = RequestStats()
+        self.timings = {'queries': 3, 'db_ms': 2, 'render_ms': 4,
+                        'view_ms': 6, 'total_ms': 10}
+
+    def test_get_duplicated_queries(self):
+        self.assertEqual(
+            get_duplicated_queries(['SELECT 1', 'SELECT 2', 'SELECT 1']),
+            [('SELECT 1', 2)])
+
+    def test_record_averages_timings(self):
+        self.stats.record('api:menu_list', self.timings)
+        self.stats.record('api:menu_list', dict(self.timings, total_ms=20))
+
+        summary = self.stats.get_summary()['api:menu_list']
+        self.assertEqual(summary['count'], 2)
+        self.assertEqual(summary['avg_queries'], 3)
+        self.assertEqual(summary['avg_total_ms'], 15)
+        self.assertEqual(summary['max_total_ms'], 20)
+
+    def test_record_histogram_buckets(self):
+        self.stats.record('api:menu_list', self.timings)
+        self.stats.record('api:menu_list', dict(self.timings, total_ms=9999))
+
+        histogram = self.stats.get_summary()['api:menu_list']['histogram']
+        self.assertEqual(histogram[1], {'le_ms': 10, 'count': 1})
+        self.assertEqual(histogram[-1], {'le_ms': None, 'count': 1})
+
+    def test_reset(self):
+        self.stats.record('api:menu_list', self.timings)
+        self.stats.reset()
+        self.assertEqual(self.stats.get_summary(), {})
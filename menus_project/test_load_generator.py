@@ -0,0 +1,29 @@
+from django.test import LiveServerTestCase, SimpleTestCase
+
+from menus_project.load_generator import percentile, run_load
+
+
+class PercentileTest(SimpleTestCase):
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 51)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([5], 95), 5)
+
+
+class RunLoadTest(LiveServerTestCase):
+    host = '127.0.0.1'
+
+    def test_run_load(self):
+        stats = run_load(self.host, self.server_thread.port, '/', 2, 3)
+        self.assertEqual(stats['requests'], 6)
+        self.assertEqual(stats['errors'], 0)
+        self.assertGreater(stats['throughput_rps'], 0)
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+
+    def test_run_load_counts_errors(self):
+        stats = run_load(
+            self.host, self.server_thread.port, '/bad-path/', 1, 2)
+        self.assertEqual(stats['errors'], 2)
+        self.assertIsNone(stats['p50_ms'])
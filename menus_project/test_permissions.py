@@ -1,8 +1,109 @@
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
-from django.test import TestCase, RequestFactory
+from django.core.cache import caches
+from django.test import TestCase, RequestFactory, override_settings
 
 import menus_project.factories as f
-from .permissions import UserHasRestaurantPermissionsMixin
+from .permissions import (
+    UserHasRestaurantPermissionsMixin, get_restaurant_pk,
+    user_is_restaurant_admin)
+
+
+class GetRestaurantPkTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_restaurant = cls.test_menuitem.menusection.menu.restaurant
+
+    def test_restaurant_objects(self):
+        for obj in (self.test_restaurant,
+                    self.test_menuitem.menusection.menu,
+                    self.test_menuitem.menusection,
+                    self.test_menuitem):
+            self.assertEqual(get_restaurant_pk(obj), self.test_restaurant.pk)
+
+    def test_non_restaurant_object(self):
+        self.assertIsNone(get_restaurant_pk(AnonymousUser()))
+
+
+class UserIsRestaurantAdminTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = f.UserFactory()
+        cls.restaurant_admin_user = f.UserFactory()
+        cls.test_menuitem = \
+            f.MenuItemFactory(admin_users=[cls.restaurant_admin_user])
+        cls.test_restaurant = cls.test_menuitem.menusection.menu.restaurant
+
+    def setUp(self):
+        caches[settings.RESTAURANT_ADMIN_CACHE_ALIAS].clear()
+
+    def get_request(self, user):
+        request = RequestFactory().get('/')
+        request.user = user
+        return request
+
+    def test_unauthenticated_user_returns_false_without_queries(self):
+        request = self.get_request(AnonymousUser())
+        with self.assertNumQueries(0):
+            self.assertFalse(
+                user_is_restaurant_admin(request, self.test_restaurant))
+
+    def test_unprivileged_user_returns_false(self):
+        request = self.get_request(self.test_user)
+        self.assertFalse(
+            user_is_restaurant_admin(request, self.test_menuitem))
+
+    def test_authorized_user_returns_true(self):
+        request = self.get_request(self.restaurant_admin_user)
+        self.assertTrue(
+            user_is_restaurant_admin(request, self.test_menuitem))
+
+    def test_result_is_memoized_per_request(self):
+        request = self.get_request(self.restaurant_admin_user)
+        with self.assertNumQueries(1):
+            for i in range(3):
+                self.assertTrue(
+                    user_is_restaurant_admin(request, self.test_restaurant))
+
+    def test_result_is_not_cached_across_requests_when_disabled(self):
+        user_is_restaurant_admin(
+            self.get_request(self.restaurant_admin_user), self.test_restaurant)
+        with self.assertNumQueries(1):
+            user_is_restaurant_admin(
+                self.get_request(self.restaurant_admin_user),
+                self.test_restaurant)
+
+    @override_settings(RESTAURANT_ADMIN_CACHE_TIMEOUT=60)
+    def test_result_is_cached_across_requests(self):
+        user_is_restaurant_admin(
+            self.get_request(self.restaurant_admin_user), self.test_restaurant)
+        with self.assertNumQueries(0):
+            self.assertTrue(user_is_restaurant_admin(
+                self.get_request(self.restaurant_admin_user),
+                self.test_restaurant))
+
+    @override_settings(RESTAURANT_ADMIN_CACHE_TIMEOUT=60)
+    def test_cache_is_invalidated_when_admin_users_change(self):
+        def is_admin(user):
+            return user_is_restaurant_admin(
+                self.get_request(user), self.test_restaurant)
+
+        # add
+        self.assertFalse(is_admin(self.test_user))
+        self.test_restaurant.admin_users.add(self.test_user)
+        self.assertTrue(is_admin(self.test_user))
+
+        # remove (reverse relation)
+        self.test_user.restaurant_set.remove(self.test_restaurant)
+        self.assertFalse(is_admin(self.test_user))
+
+        # clear
+        self.assertTrue(is_admin(self.restaurant_admin_user))
+        self.test_restaurant.admin_users.clear()
+        self.assertFalse(is_admin(self.restaurant_admin_user))
 
 
 class UserHasRestaurantPermissionsMixinTest(TestCase):
@@ -0,0 +1,176 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from menus_project import constants as c
+from menus_project import factories as f
+from menus_project import render_cache
+
+
+class RestaurantGenerationTest(TestCase):
+
+    def setUp(self):
+        render_cache.get_cache().clear()
+
+    def test_get_restaurant_generation_is_stable(self):
+        generation = render_cache.get_restaurant_generation('test-slug')
+        self.assertEqual(
+            render_cache.get_restaurant_generation('test-slug'), generation)
+
+    def test_bump_restaurant_generation(self):
+        generation = render_cache.get_restaurant_generation('test-slug')
+        render_cache.bump_restaurant_generation('test-slug')
+        self.assertEqual(
+            render_cache.get_restaurant_generation('test-slug'),
+            generation + 1)
+
+    def test_bump_restaurant_generation_in_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            render_cache.bump_restaurant_generation('test-slug')
+            # e.g. another process caches a page of the uncommitted rows
+            generation = render_cache.get_restaurant_generation('test-slug')
+        # the generation is bumped again once the transaction commits
+        self.assertEqual(
+            render_cache.get_restaurant_generation('test-slug'),
+            generation + 1)
+
+    def test_get_page_cache_key_changes_with_generation(self):
+        old_key = render_cache.get_page_cache_key('test-slug', '/')
+        render_cache.bump_restaurant_generation('test-slug')
+        self.assertNotEqual(
+            render_cache.get_page_cache_key('test-slug', '/'), old_key)
+
+    def test_get_page_cache_key_depends_on_path(self):
+        self.assertNotEqual(
+            render_cache.get_page_cache_key('test-slug', '/a/'),
+            render_cache.get_page_cache_key('test-slug', '/b/'))
+
+
+class RenderCacheSignalsTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menusection = cls.test_menuitem.menusection
+        cls.test_menu = cls.test_menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+    def setUp(self):
+        self.generation = render_cache.get_restaurant_generation(
+            self.test_restaurant.slug)
+
+    def assertGenerationBumped(self):
+        self.assertGreater(
+            render_cache.get_restaurant_generation(self.test_restaurant.slug),
+            self.generation)
+
+    def test_restaurant_save_bumps_generation(self):
+        self.test_restaurant.save()
+        self.assertGenerationBumped()
+
+    def test_restaurant_slug_change_bumps_old_generation(self):
+        old_slug = self.test_restaurant.slug
+        old_generation = render_cache.get_restaurant_generation(old_slug)
+
+        self.test_restaurant.name = 'Renamed Restaurant'
+        self.test_restaurant.save()
+        self.assertGreater(
+            render_cache.get_restaurant_generation(old_slug), old_generation)
+
+    def test_menu_save_bumps_generation(self):
+        self.test_menu.save()
+        self.assertGenerationBumped()
+
+    def test_menusection_save_bumps_generation(self):
+        self.test_menusection.save()
+        self.assertGenerationBumped()
+
+    def test_menuitem_save_bumps_generation(self):
+        self.test_menuitem.save()
+        self.assertGenerationBumped()
+
+    def test_menuitem_delete_bumps_generation(self):
+        self.test_menuitem.delete()
+        self.assertGenerationBumped()
+
+    def test_restaurant_delete_bumps_generation(self):
+        restaurant_slug = self.test_restaurant.slug
+        self.test_restaurant.delete()
+        self.assertGreater(
+            render_cache.get_restaurant_generation(restaurant_slug),
+            self.generation)
+
+
+@override_settings(RENDER_CACHE_ENABLED=True)
+class RestaurantRenderCacheMixinTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.restaurant_admin_user = f.UserFactory()
+        cls.test_menuitem = f.MenuItemFactory(
+            admin_users=[cls.restaurant_admin_user])
+        cls.test_menu = cls.test_menuitem.menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+        cls.current_test_url = reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': cls.test_restaurant.slug,
+            'menu_slug': cls.test_menu.slug})
+
+    def setUp(self):
+        render_cache.get_cache().clear()
+        render_cache.render_cache_stats.reset()
+
+    def test_anonymous_user_second_request_is_served_from_cache(self):
+        first_response = self.client.get(self.current_test_url)
+        self.assertIsNotNone(first_response.context)
+
+        with self.assertNumQueries(0):
+            second_response = self.client.get(self.current_test_url)
+        self.assertIsNone(second_response.context)
+        self.assertEqual(second_response.status_code, 200)
+        self.assertEqual(second_response.content, first_response.content)
+
+        self.assertEqual(
+            render_cache.render_cache_stats.get_summary(),
+            {'hits': 1, 'misses': 1})
+
+    def test_authenticated_user_is_not_served_from_cache(self):
+        self.client.get(self.current_test_url)
+
+        self.client.login(
+            username=self.restaurant_admin_user.username,
+            password=c.TEST_USER_PASSWORD)
+        self.response = self.client.get(self.current_test_url)
+        self.assertIsNotNone(self.response.context)
+        self.assertIn('auth-links', self.response.content.decode('utf-8'))
+
+    def test_request_with_query_string_is_not_served_from_cache(self):
+        self.client.get(self.current_test_url)
+
+        self.response = self.client.get(self.current_test_url + '?next=/')
+        self.assertIsNotNone(self.response.context)
+
+    def test_menuitem_change_invalidates_cached_page(self):
+        self.client.get(self.current_test_url)
+
+        self.test_menuitem.name = 'Updated Menu Item Name'
+        self.test_menuitem.save()
+
+        self.response = self.client.get(self.current_test_url)
+        self.assertIsNotNone(self.response.context)
+        self.assertIn(
+            'Updated Menu Item Name', self.response.content.decode('utf-8'))
+
+    def test_restaurant_detail_view_is_cached(self):
+        restaurant_url = self.test_restaurant.get_absolute_url()
+        self.client.get(restaurant_url)
+
+        self.response = self.client.get(restaurant_url)
+        self.assertIsNone(self.response.context)
+
+    def test_bad_kwargs_are_not_cached(self):
+        bad_url = reverse('menus:menu_detail', kwargs={
+            'restaurant_slug': self.test_restaurant.slug,
+            'menu_slug': 'bad-slug'})
+        for i in range(2):
+            self.response = self.client.get(bad_url)
+            self.assertEqual(self.response.status_code, 404)
@@ -0,0 +1,182 @@
+from django.http import Http404
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from menus_project import factories as f
+from menus_project import render_cache
+from menus_project import slug_paths
+from menus.models import Menu, MenuSection, MenuItem
+
+
+@override_settings(RENDER_CACHE_ENABLED=True)
+class SlugPathTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory()
+        cls.test_menusection = cls.test_menuitem.menusection
+        cls.test_menu = cls.test_menusection.menu
+        cls.test_restaurant = cls.test_menu.restaurant
+
+    def setUp(self):
+        render_cache.get_cache().clear()
+        slug_paths.clear_local_slug_paths()
+        self.addCleanup(slug_paths.clear_local_slug_paths)
+
+    def get_menuitem_slug_path(self):
+        return (self.test_restaurant.slug, self.test_menu.slug,
+                self.test_menusection.slug, self.test_menuitem.slug)
+
+    def test_get_slug_path(self):
+        self.assertEqual(
+            slug_paths.get_slug_path(
+                {'menu_slug': 'b', 'restaurant_slug': 'a', 'pk': 1}),
+            ('a', 'b'))
+
+    def test_resolve_slug_path(self):
+        self.assertEqual(
+            slug_paths.resolve_slug_path((self.test_restaurant.slug,)),
+            (self.test_restaurant.pk,))
+        self.assertEqual(
+            slug_paths.resolve_slug_path(
+                (self.test_restaurant.slug, self.test_menu.slug)),
+            (self.test_restaurant.pk, self.test_menu.pk))
+        self.assertEqual(
+            slug_paths.resolve_slug_path(self.get_menuitem_slug_path()),
+            (self.test_restaurant.pk, self.test_menu.pk,
+             self.test_menusection.pk, self.test_menuitem.pk))
+
+    def test_resolve_slug_path_does_not_exist(self):
+        self.assertIsNone(slug_paths.resolve_slug_path(
+            (self.test_restaurant.slug, 'no-such-menu')))
+
+    def test_resolved_slug_paths_are_cached(self):
+        slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(slug_path)
+        with self.assertNumQueries(0):
+            slug_paths.resolve_slug_path(slug_path)
+
+        # other processes use the shared cache
+        slug_paths.clear_local_slug_paths()
+        with self.assertNumQueries(0):
+            slug_paths.resolve_slug_path(slug_path)
+
+    def test_get_object_by_slug_path(self):
+        kwargs = {'restaurant_slug': self.test_restaurant.slug,
+                  'menu_slug': self.test_menu.slug,
+                  'menusection_slug': self.test_menusection.slug}
+        self.assertEqual(
+            slug_paths.get_object_by_slug_path(MenuSection, kwargs),
+            self.test_menusection)
+        # the object is fetched by its pk
+        with self.assertNumQueries(1):
+            slug_paths.get_object_by_slug_path(
+                MenuSection.objects.all(), kwargs)
+
+        kwargs['menusection_slug'] = 'no-such-section'
+        with self.assertRaises(Http404):
+            slug_paths.get_object_by_slug_path(MenuSection, kwargs)
+
+    def test_get_object_by_slug_path_rejects_a_stale_path(self):
+        old_kwargs = {'restaurant_slug': self.test_restaurant.slug,
+                      'menu_slug': self.test_menu.slug}
+        slug_paths.get_object_by_slug_path(Menu, old_kwargs)
+
+        # the menu is renamed without bumping the slug path generation, as
+        # if its old path had been resolved again before the rename commits
+        Menu.objects.filter(pk=self.test_menu.pk).update(slug='renamed-menu')
+        with self.assertRaises(Http404):
+            slug_paths.get_object_by_slug_path(Menu, old_kwargs)
+        self.assertIsNone(slug_paths.resolve_slug_path(
+            slug_paths.get_slug_path(old_kwargs)))
+
+    @override_settings(RENDER_CACHE_ENABLED=False)
+    def test_get_object_by_slug_path_render_cache_disabled(self):
+        kwargs = {'restaurant_slug': self.test_restaurant.slug,
+                  'menu_slug': self.test_menu.slug}
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                slug_paths.get_object_by_slug_path(Menu, kwargs),
+                self.test_menu)
+
+    def test_renamed_menuitem_is_not_resolved_by_its_old_slug(self):
+        old_slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(old_slug_path)
+
+        self.test_menuitem.name = 'Renamed Item'
+        self.test_menuitem.save()
+        self.assertIsNone(slug_paths.resolve_slug_path(old_slug_path))
+        self.assertEqual(
+            slug_paths.resolve_slug_path(self.get_menuitem_slug_path())[-1],
+            self.test_menuitem.pk)
+
+    def test_renamed_menu_is_not_resolved_by_its_old_slug(self):
+        old_slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(old_slug_path)
+
+        self.test_menu.name = 'Renamed Menu'
+        self.test_menu.save()
+        self.assertIsNone(slug_paths.resolve_slug_path(old_slug_path))
+
+    def test_renamed_restaurant_is_not_resolved_by_its_old_slug(self):
+        old_slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(old_slug_path)
+
+        self.test_restaurant.name = 'Renamed Restaurant'
+        self.test_restaurant.save()
+        self.assertIsNone(slug_paths.resolve_slug_path(old_slug_path))
+
+    def test_moved_menuitem_is_not_resolved_by_its_old_slug_path(self):
+        old_slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(old_slug_path)
+
+        menuitem = MenuItem.objects.get(pk=self.test_menuitem.pk)
+        menuitem.menusection = f.MenuSectionFactory(menu=self.test_menu)
+        menuitem.save()
+        self.assertIsNone(slug_paths.resolve_slug_path(old_slug_path))
+
+    def test_slug_paths_are_forgotten_again_on_commit(self):
+        old_slug_path = self.get_menuitem_slug_path()
+        old_pks = slug_paths.resolve_slug_path(old_slug_path)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            menuitem = MenuItem.objects.get(pk=self.test_menuitem.pk)
+            menuitem.menusection = f.MenuSectionFactory(menu=self.test_menu)
+            menuitem.save()
+            # another request resolves the old path from the committed rows
+            generation = slug_paths.get_slug_path_generation(
+                self.test_restaurant.slug)
+            render_cache.get_cache().set(
+                slug_paths.get_slug_path_key(old_slug_path, generation),
+                old_pks)
+        slug_paths.clear_local_slug_paths()
+        self.assertIsNone(slug_paths.resolve_slug_path(old_slug_path))
+
+    def test_deleted_menuitem_is_not_resolved(self):
+        slug_path = self.get_menuitem_slug_path()
+        slug_paths.resolve_slug_path(slug_path)
+
+        self.test_menuitem.delete()
+        self.assertIsNone(slug_paths.resolve_slug_path(slug_path))
+
+    def test_save_without_slug_change_keeps_the_slug_paths(self):
+        generation = slug_paths.get_slug_path_generation(
+            self.test_restaurant.slug)
+        menuitem = MenuItem.objects.get(pk=self.test_menuitem.pk)
+        menuitem.price = 500
+        menuitem.save()
+        self.assertEqual(
+            slug_paths.get_slug_path_generation(self.test_restaurant.slug),
+            generation)
+
+    def test_menuitem_detail_view(self):
+        url = reverse('menus:menuitem_detail', kwargs={
+            'restaurant_slug': self.test_restaurant.slug,
+            'menu_slug': self.test_menu.slug,
+            'menusection_slug': self.test_menusection.slug,
+            'menuitem_slug': self.test_menuitem.slug})
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.test_menuitem.name = 'Renamed Item'
+        self.test_menuitem.save()
+        self.assertEqual(self.client.get(url).status_code, 404)
@@ -2,17 +2,18 @@ from django.contrib import admin
 from django.conf import settings
 from django.conf.urls.static import static
 from django.urls import include, path
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView
+from drf_spectacular.views import SpectacularRedocView
 
 import server_config
 
 from . import views
+from api.views import Schema as APISchema
 from api.views import verify_email_view as api_views_verify_email_view
 
 urlpatterns = [
     path('', views.root, name='root'),
     path('admin/', admin.site.urls),
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/schema/', APISchema.as_view(), name='schema'),
     path('api/schema/redoc/',
          SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     path('api/v1/rest-auth/registration/account-confirm-email/<key>/',
@@ -25,6 +26,7 @@ urlpatterns = [
     path('captcha/', include('captcha.urls')),
     path('restaurants/', include('restaurants.urls')),
     path('restaurants/<slug:restaurant_slug>/menus/', include('menus.urls')),
+    path('search/', include('search.urls')),
     path('users/', include('users.urls')),
     path('users/', include('django.contrib.auth.urls')),
 ]
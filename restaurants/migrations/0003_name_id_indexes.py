@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-17 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0002_auto_20201229_0321'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['name', 'id'], name='restaurant_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2 on 2026-10-17 22:13
+
+from django.db import migrations, models
+import django.db.models.expressions
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0005_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(django.db.models.functions.text.Upper('name'), django.db.models.expressions.F('id'), name='restaurant_upper_name_id_idx'),
+        ),
+    ]
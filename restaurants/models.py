@@ -3,9 +3,12 @@ import os
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.urls import reverse
 from django.utils.text import slugify
 
+from images.variants import delete_variants
 from menus_project import constants
 
 
@@ -22,9 +25,20 @@ class Restaurant(models.Model):
     image = models.ImageField(
         upload_to=upload_to, blank=True, null=True,
         help_text="An image or logo for your restaurant (optional)")
+    # resized copies of the image (see the 'images' app)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+    # also updated when one of the restaurant's menu objects changes
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # used by the api's cursor pagination
+            models.Index(fields=['name', 'id'], name='restaurant_name_id_idx'),
+            # used by the restaurant list's case-insensitive pagination
+            models.Index(
+                Upper('name'), F('id'), name='restaurant_upper_name_id_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -44,8 +58,10 @@ class Restaurant(models.Model):
                 constants.RESTAURANT_DUPLICATE_SLUG_ERROR_STRING)
 
     def delete(self, *args, **kwargs):
+        image_variants = self.image_variants
         if self.image:
             self.image.delete()
+        delete_variants(self.image.storage, image_variants)
         super().delete(*args, **kwargs)
 
     def get_absolute_url(self):
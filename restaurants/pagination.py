@@ -0,0 +1,67 @@
+from django.db.models.functions import Upper
+from django.http import Http404
+
+from menus_project.keyset import (
+    InvalidCursor, decode_cursor, encode_cursor, get_keyset_page)
+
+
+class KeysetPage:
+    """
+    A page of a list of restaurants, with the cursors of the pages before and
+    after it (or None if there is no such page).
+    """
+
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+def get_restaurant_page(queryset, page_size, cursor=None, starts_at=None):
+    """
+    Return a KeysetPage of the restaurants that a cursor points to, or of the
+    restaurants from the first one whose name is at or after 'starts_at'
+    (e.g. a letter), or else the first page.
+
+    The restaurants are in case-insensitive alphabetical order, so that the
+    names that start with a lowercase letter are listed (and found with
+    'starts_at') along with the uppercase ones. This ordering is backed by
+    the 'restaurant_upper_name_id_idx' index.
+    """
+    queryset = queryset.annotate(upper_name=Upper('name'))
+    name, pk, reverse = None, None, False
+    if cursor is not None:
+        try:
+            name, pk, reverse = decode_cursor(cursor)
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        has_previous = not reverse
+    elif starts_at is not None:
+        starts_at = starts_at.upper()
+        has_previous = queryset.filter(upper_name__lt=starts_at).exists()
+        queryset = queryset.filter(upper_name__gte=starts_at)
+    else:
+        has_previous = False
+
+    objs, has_more = get_keyset_page(
+        queryset, page_size, name, pk, reverse, name_field='upper_name')
+    if reverse:
+        has_next, has_previous = True, has_more
+    else:
+        has_next = has_more
+    return KeysetPage(
+        objs,
+        next_cursor=encode_cursor(objs[-1].upper_name, objs[-1].pk)
+        if has_next and objs else None,
+        previous_cursor=encode_cursor(
+            objs[0].upper_name, objs[0].pk, reverse=True)
+        if has_previous and objs else None)
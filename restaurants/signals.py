@@ -0,0 +1,104 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Restaurant
+from menus_project.permissions import get_restaurant_admin_cache_key
+from menus_project.render_cache import (
+    bump_restaurant_generation, delete_restaurant_list_first_page)
+from menus_project.slug_paths import bump_slug_path_generation
+
+UserModel = get_user_model()
+
+
+# render cache
+
+@receiver(pre_save, sender=Restaurant)
+def restaurant_pre_save(sender, instance, **kwargs):
+    # if the slug is about to change, invalidate the pages of the old slug
+    if instance.pk:
+        old_slug = Restaurant.objects.filter(pk=instance.pk) \
+            .values_list('slug', flat=True).first()
+        if old_slug and old_slug != instance.slug:
+            bump_restaurant_generation(old_slug)
+            # the old URLs are forgotten once the new slug has been saved
+            instance._old_slug = old_slug
+
+
+@receiver([post_save, post_delete], sender=Restaurant)
+def restaurant_changed(sender, instance, **kwargs):
+    bump_restaurant_generation(instance.slug)
+    delete_restaurant_list_first_page()
+
+
+@receiver(post_save, sender=Restaurant)
+def restaurant_saved(sender, instance, **kwargs):
+    old_slug = instance.__dict__.pop('_old_slug', None)
+    if old_slug:
+        bump_slug_path_generation(old_slug)
+
+
+@receiver(post_delete, sender=Restaurant)
+def restaurant_deleted(sender, instance, **kwargs):
+    bump_slug_path_generation(instance.slug)
+
+
+# restaurant admin cache
+
+def delete_restaurant_admin_cache_keys(pairs):
+    caches[settings.RESTAURANT_ADMIN_CACHE_ALIAS].delete_many(
+        [get_restaurant_admin_cache_key(restaurant_pk, user_pk)
+         for restaurant_pk, user_pk in pairs])
+
+
+def get_restaurant_admin_pairs(instance, reverse, pk_set=None):
+    """
+    Return the (restaurant_pk, user_pk) pairs affected by a change to
+    Restaurant.admin_users, from either side of the relation.
+    """
+    if pk_set is None:
+        if reverse:
+            pk_set = instance.restaurant_set.values_list('pk', flat=True)
+        else:
+            pk_set = instance.admin_users.values_list('pk', flat=True)
+    if reverse:
+        return [(pk, instance.pk) for pk in pk_set]
+    return [(instance.pk, pk) for pk in pk_set]
+
+
+@receiver(m2m_changed, sender=Restaurant.admin_users.through)
+def restaurant_admin_users_changed(
+        sender, instance, action, reverse, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove'):
+        pairs = get_restaurant_admin_pairs(instance, reverse, pk_set)
+    # the affected pairs are no longer known after the relation is cleared
+    elif action == 'pre_clear':
+        instance._cleared_restaurant_admin_pairs = \
+            get_restaurant_admin_pairs(instance, reverse)
+        return
+    elif action == 'post_clear':
+        pairs = instance.__dict__.pop('_cleared_restaurant_admin_pairs', [])
+    else:
+        return
+
+    delete_restaurant_admin_cache_keys(pairs)
+    # the api's representation of a restaurant contains its admin users
+    Restaurant.objects.filter(pk__in=[pair[0] for pair in pairs]) \
+        .update(updated_at=timezone.now())
+
+
+# deleting either side of the relation does not send m2m_changed
+@receiver(pre_delete, sender=Restaurant)
+def restaurant_pre_delete(sender, instance, **kwargs):
+    delete_restaurant_admin_cache_keys(
+        get_restaurant_admin_pairs(instance, reverse=False))
+
+
+@receiver(pre_delete, sender=UserModel)
+def user_pre_delete(sender, instance, **kwargs):
+    delete_restaurant_admin_cache_keys(
+        get_restaurant_admin_pairs(instance, reverse=True))
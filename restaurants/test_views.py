@@ -1,4 +1,6 @@
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.text import slugify
 
@@ -8,6 +10,8 @@ from urllib.parse import urlparse
 from menus_project import constants as c
 from menus_project import factories as f
 from .models import Restaurant
+from menus_project.render_cache import (
+    delete_restaurant_list_first_page, get_cache)
 
 
 class RestaurantListViewTest(TestCase):
@@ -34,11 +38,147 @@ class RestaurantListViewTest(TestCase):
     def test_context_object_name_is_restaurants(self):
         self.assertTrue('restaurants' in self.context)
 
+    def test_context_has_jump_letters(self):
+        self.assertEqual(self.context['jump_letters'][0], 'A')
+        self.assertEqual(self.context['jump_letters'][-1], 'Z')
+
     # request.GET
     def test_request_get_method_unauthenticated_user(self):
         self.assertEqual(self.response.status_code, 200)
 
 
+@override_settings(RESTAURANT_LIST_PAGE_SIZE=2)
+class RestaurantListViewPaginationTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.current_test_url = reverse('restaurants:restaurant_list')
+
+        # create model objects
+        cls.restaurants = [
+            f.RestaurantFactory(name=name)
+            for name in ('Apple', 'Banana', 'Bistro', 'Cherry', 'Diner')]
+
+    def get_restaurants(self, params=None):
+        self.response = self.client.get(self.current_test_url, params)
+        self.assertEqual(self.response.status_code, 200)
+        return [restaurant.name
+                for restaurant in self.response.context['restaurants']]
+
+    def test_first_page(self):
+        self.assertEqual(self.get_restaurants(), ['Apple', 'Banana'])
+        page = self.response.context['page_obj']
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+        self.assertTrue(self.response.context['is_paginated'])
+
+    def test_next_and_previous_pages(self):
+        self.get_restaurants()
+        next_cursor = self.response.context['page_obj'].next_cursor
+        self.assertEqual(
+            self.get_restaurants({'cursor': next_cursor}),
+            ['Bistro', 'Cherry'])
+
+        previous_cursor = self.response.context['page_obj'].previous_cursor
+        self.assertEqual(
+            self.get_restaurants({'cursor': previous_cursor}),
+            ['Apple', 'Banana'])
+        self.assertFalse(self.response.context['page_obj'].has_previous())
+
+    def test_last_page(self):
+        self.assertEqual(
+            self.get_restaurants({'letter': 'C'}), ['Cherry', 'Diner'])
+        page = self.response.context['page_obj']
+        self.assertFalse(page.has_next())
+        self.assertTrue(page.has_previous())
+
+    def test_jump_to_letter(self):
+        self.assertEqual(
+            self.get_restaurants({'letter': 'B'}), ['Banana', 'Bistro'])
+        page = self.response.context['page_obj']
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+
+    def test_jump_to_letter_is_case_insensitive(self):
+        f.RestaurantFactory(name='bakery')
+        self.assertEqual(
+            self.get_restaurants({'letter': 'B'}), ['bakery', 'Banana'])
+        self.assertEqual(
+            self.get_restaurants({'letter': 'C'}), ['Cherry', 'Diner'])
+
+    def test_jump_to_letter_without_restaurants(self):
+        self.assertEqual(self.get_restaurants({'letter': 'Z'}), [])
+        self.assertContains(self.response, "There are no more restaurants.")
+
+    def test_invalid_letter(self):
+        self.response = self.client.get(self.current_test_url, {'letter': '%'})
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_invalid_cursor(self):
+        self.response = self.client.get(
+            self.current_test_url, {'cursor': 'invalid'})
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_template_contains_pagination_links(self):
+        self.get_restaurants()
+        self.assertContains(self.response, '?cursor=')
+        self.assertContains(self.response, '?letter=B')
+
+    def test_number_of_queries(self):
+        # the page of restaurants and the extra object that shows that there
+        # is a next page are fetched with a single query
+        with CaptureQueriesContext(connection) as queries:
+            self.get_restaurants({'letter': 'B'})
+        # one query checks for restaurants before the letter
+        self.assertEqual(len(queries), 2)
+
+
+@override_settings(RENDER_CACHE_ENABLED=True, RESTAURANT_LIST_PAGE_SIZE=2)
+class RestaurantListViewFirstPageCacheTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.current_test_url = reverse('restaurants:restaurant_list')
+        cls.restaurants = f.RestaurantFactory.create_batch(size=3)
+
+    def setUp(self):
+        delete_restaurant_list_first_page()
+        self.addCleanup(get_cache().clear)
+
+    def test_first_page_is_served_from_the_cache(self):
+        self.client.get(self.current_test_url)
+        with CaptureQueriesContext(connection) as queries:
+            self.response = self.client.get(self.current_test_url)
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(len(self.response.context['restaurants']), 2)
+        # the links are rendered when the page is cached
+        self.assertIn(
+            self.response.context['restaurants'][0].get_absolute_url(),
+            self.response.context['restaurants_html'])
+
+    def test_other_pages_are_not_cached(self):
+        self.client.get(self.current_test_url, {'letter': 'A'})
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.current_test_url, {'letter': 'A'})
+        self.assertGreater(len(queries), 0)
+
+    def test_saving_a_restaurant_invalidates_the_first_page(self):
+        self.client.get(self.current_test_url)
+        restaurant = f.RestaurantFactory(name='0 First Restaurant')
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.context['restaurants'][0], restaurant)
+
+    def test_deleting_a_restaurant_invalidates_the_first_page(self):
+        self.client.get(self.current_test_url)
+        first_restaurant = Restaurant.objects.order_by('name', 'id').first()
+        first_restaurant.delete()
+        self.response = self.client.get(self.current_test_url)
+        self.assertNotIn(
+            first_restaurant.name,
+            [restaurant.name
+             for restaurant in self.response.context['restaurants']])
+
+
 class RestaurantCreateViewTest(TestCase):
 
     @classmethod
@@ -227,6 +367,50 @@ class RestaurantDetailViewTest(TestCase):
         self.assertNotIn("Edit this menu", self.html)
         self.assertNotIn('auth-links', self.html)
 
+    # get_context_data()
+    def test_context_user_is_restaurant_admin_unauthenticated_user(self):
+        self.assertFalse(self.context['user_is_restaurant_admin'])
+
+    def test_context_user_is_restaurant_admin_authorized_user(self):
+        self.client.login(
+            username=self.restaurant_admin_user.username,
+            password=c.TEST_USER_PASSWORD)
+        self.setUp()
+
+        self.assertTrue(self.context['user_is_restaurant_admin'])
+
+    # get_object()
+    def test_method_get_object_has_annotated_menusection_count(self):
+        f.MenuSectionFactory(menu=self.test_menu)
+
+        restaurant = self.view.get_object()
+        self.assertEqual(restaurant.menu_set.all()[0].menusection_count, 1)
+
+    # template - query count
+    def test_query_count_does_not_grow_with_restaurant_size(self):
+        self.client.login(
+            username=self.restaurant_admin_user.username,
+            password=c.TEST_USER_PASSWORD)
+
+        # get query count for a restaurant with 1 menu, section and item
+        test_menusection = f.MenuSectionFactory(menu=self.test_menu)
+        f.MenuItemFactory(menusection=test_menusection)
+        with CaptureQueriesContext(connection) as small_restaurant_queries:
+            self.client.get(self.current_test_url)
+
+        # get query count for a restaurant with 3 menus (1 of them empty),
+        # multiple sections per menu and multiple items per section
+        f.MenuFactory(restaurant=self.test_restaurant)
+        test_menu_2 = f.MenuFactory(restaurant=self.test_restaurant)
+        for test_menu in (self.test_menu, test_menu_2):
+            test_menusection = f.MenuSectionFactory(menu=test_menu)
+            f.MenuItemFactory.create_batch(3, menusection=test_menusection)
+        with CaptureQueriesContext(connection) as large_restaurant_queries:
+            self.client.get(self.current_test_url)
+
+        self.assertEqual(
+            len(small_restaurant_queries), len(large_restaurant_queries))
+
     # bad kwargs
     def test_bad_kwargs(self):
         self.response = self.client.get(
@@ -323,6 +507,12 @@ class RestaurantUpdateViewTest(TestCase):
     def test_request_get_method_authorized_user(self):
         self.assertEqual(self.response.status_code, 200)
 
+    def test_request_get_method_authorized_user_query_count(self):
+        # session, user, object (with its ancestors) and permissions,
+        # plus the template's count of the user's restaurants
+        with self.assertNumQueries(5):
+            self.client.get(self.current_test_url)
+
     def test_request_get_method_staff_user(self):
         # give staff privileges to self.test_user
         self.test_user.is_staff = True
@@ -1,18 +1,19 @@
 from django.urls import path
 
 from . import views
+from menus_project.async_views import as_async_view
 
 app_name = 'restaurants'
 
 urlpatterns = [
     path('',
-         views.RestaurantListView.as_view(),
+         as_async_view(views.RestaurantListView),
          name='restaurant_list'),
     path('add-new-restaurant/',
          views.RestaurantCreateView.as_view(),
          name='restaurant_create'),
     path('<slug:restaurant_slug>/',
-         views.RestaurantDetailView.as_view(),
+         as_async_view(views.RestaurantDetailView),
          name='restaurant_detail'),
     path('<slug:restaurant_slug>/edit/',
          views.RestaurantUpdateView.as_view(),
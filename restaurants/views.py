@@ -1,20 +1,74 @@
+import string
+
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
-from django.http import HttpResponseRedirect
+from django.db.models import Count, Prefetch
+from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
 from django.urls import reverse_lazy
 from django.views.generic import CreateView, DeleteView, DetailView, ListView
 from django.views.generic.edit import UpdateView
 
 from .models import Restaurant
+from .pagination import get_restaurant_page
+from menus.models import Menu, MenuSection
 from menus_project import constants as c
-from menus_project.permissions import UserHasRestaurantPermissionsMixin
+from menus_project.helpers import memoize_object
+from menus_project.permissions import (
+    UserHasRestaurantPermissionsMixin, user_is_restaurant_admin)
+from menus_project.conditional import RestaurantConditionalGetMixin
+from menus_project.render_cache import (
+    RestaurantRenderCacheMixin, get_restaurant_list_first_page)
 
 
 class RestaurantListView(ListView):
+    """
+    A page of restaurants in alphabetical order, with keyset pagination
+    ('?cursor=') and a jump index of initial letters ('?letter='). The first
+    page, which is the most visited one, is served from the cache, along
+    with its rendered list of links.
+    """
     model = Restaurant
     context_object_name = 'restaurants'
+    items_template_name = 'restaurants/restaurant_list_items.html'
+    jump_letters = string.ascii_uppercase
+    restaurants_html = None
+
+    def get_queryset(self):
+        return Restaurant.objects.only('name', 'slug')
+
+    def get_paginate_by(self, queryset):
+        return settings.RESTAURANT_LIST_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, page_size):
+        params = self.request.GET
+        letter = params.get('letter')
+        if letter is not None and letter not in self.jump_letters:
+            raise Http404("Invalid letter")
+
+        if not any(key in params for key in ('cursor', 'letter')):
+            page, self.restaurants_html = get_restaurant_list_first_page(
+                lambda: self.get_first_page(queryset, page_size))
+        else:
+            page = get_restaurant_page(
+                queryset, page_size, cursor=params.get('cursor'),
+                starts_at=letter)
+        return (None, page, page.object_list, page.has_other_pages())
+
+    def get_first_page(self, queryset, page_size):
+        page = get_restaurant_page(queryset, page_size)
+        return page, render_to_string(
+            self.items_template_name, {'restaurants': page.object_list})
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'jump_letters': self.jump_letters,
+            'restaurants_html': self.restaurants_html})
+        return context
 
 
 class RestaurantCreateView(LoginRequiredMixin, CreateView):
@@ -46,10 +100,29 @@ class RestaurantCreateView(LoginRequiredMixin, CreateView):
         return context
 
 
-class RestaurantDetailView(DetailView):
+class RestaurantDetailView(RestaurantConditionalGetMixin,
+                           RestaurantRenderCacheMixin, DetailView):
     model = Restaurant
     slug_url_kwarg = 'restaurant_slug'
 
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context.update({
+            'user_is_restaurant_admin':
+                user_is_restaurant_admin(self.request, self.object)})
+        return context
+
+    def get_object(self):
+        # load the whole menu tree (with section counts) up front so that the
+        # template does not make any additional queries
+        menusections = MenuSection.objects.prefetch_related('menuitem_set')
+        menus = Menu.objects \
+            .annotate(menusection_count=Count('menusection')) \
+            .prefetch_related(Prefetch('menusection_set', menusections))
+        return get_object_or_404(
+            Restaurant.objects.prefetch_related(Prefetch('menu_set', menus)),
+            slug=self.kwargs['restaurant_slug'])
+
 
 class RestaurantUpdateView(
         UserHasRestaurantPermissionsMixin, SuccessMessageMixin, UpdateView):
@@ -65,6 +138,7 @@ class RestaurantUpdateView(
     def get_initial(self):
         return {'name': self.get_object().name}
 
+    @memoize_object
     def get_object(self):
         return get_object_or_404(
             Restaurant, slug=self.kwargs['restaurant_slug'])
@@ -80,6 +154,7 @@ class RestaurantDeleteView(UserHasRestaurantPermissionsMixin, DeleteView):
         messages.success(self.request, self.success_message % obj.__dict__)
         return super().delete(request, *args, **kwargs)
 
+    @memoize_object
     def get_object(self):
         return get_object_or_404(
             Restaurant, slug=self.kwargs['restaurant_slug'])
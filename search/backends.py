@@ -0,0 +1,156 @@
+import collections
+import functools
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q, Sum
+
+from .models import SearchEntry, SearchTerm
+
+# the same characters as the separators of SQLite's 'unicode61' tokenizer
+TOKEN_RE = re.compile(r'[^\W_]+')
+MAX_QUERY_TERMS = 10
+MAX_TERM_LENGTH = 64
+TITLE_WEIGHT = 10
+BODY_WEIGHT = 1
+FTS_TABLE = 'search_searchentry_fts'
+
+
+def tokenize(text):
+    return [term[:MAX_TERM_LENGTH] for term in TOKEN_RE.findall(text.lower())]
+
+
+class SqliteBackend:
+    """
+    Search an SQLite FTS5 table, which is kept in sync with the search
+    entries by triggers. (See the search app's migrations.)
+    """
+    indexes_in_python = False
+
+    def index_entries(self, entries):
+        pass
+
+    def search(self, terms, restaurant_id=None, limit=20, offset=0):
+        # every term is a quoted prefix query, so it cannot contain any
+        # FTS5 syntax
+        match = ' '.join(f'"{term}"*' for term in terms)
+        params = [match]
+        restaurant_filter = ''
+        if restaurant_id is not None:
+            restaurant_filter = 'AND entry.restaurant_id = %s'
+            params.append(restaurant_id)
+        params += [limit, offset]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT entry.id, entry.kind, entry.object_id, "
+                f"-bm25({FTS_TABLE}, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS rank "
+                f"FROM {FTS_TABLE} "
+                f"JOIN search_searchentry entry "
+                f"ON entry.id = {FTS_TABLE}.rowid "
+                f"WHERE {FTS_TABLE} MATCH %s {restaurant_filter} "
+                f"ORDER BY rank DESC, entry.id LIMIT %s OFFSET %s",
+                params)
+            return cursor.fetchall()
+
+
+class PostgresBackend:
+    """
+    Search the entries' tsvector, which is indexed by a GIN expression
+    index. (See the search app's migrations.)
+    """
+    DOCUMENT = "setweight(to_tsvector('simple', title), 'A') || " \
+        "setweight(to_tsvector('simple', body), 'B')"
+    indexes_in_python = False
+
+    def index_entries(self, entries):
+        pass
+
+    def search(self, terms, restaurant_id=None, limit=20, offset=0):
+        query = ' & '.join(f'{term}:*' for term in terms)
+        params = [query, query]
+        restaurant_filter = ''
+        if restaurant_id is not None:
+            restaurant_filter = 'AND restaurant_id = %s'
+            params.append(restaurant_id)
+        params += [limit, offset]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT id, kind, object_id, ts_rank({self.DOCUMENT}, "
+                f"to_tsquery('simple', %s)) AS rank "
+                f"FROM search_searchentry "
+                f"WHERE {self.DOCUMENT} @@ to_tsquery('simple', %s) "
+                f"{restaurant_filter} "
+                f"ORDER BY rank DESC, id LIMIT %s OFFSET %s",
+                params)
+            return cursor.fetchall()
+
+
+class PythonBackend:
+    """
+    Search an inverted index of terms, which are extracted from the entries
+    in Python. This works on every database, but is slower than the full-text
+    search of SQLite or Postgres.
+    """
+    indexes_in_python = True
+
+    def index_entries(self, entries):
+        entries = list(entries)
+        SearchTerm.objects.filter(entry__in=entries).delete()
+        SearchTerm.objects.bulk_create([
+            SearchTerm(entry_id=entry.pk, term=term, weight=weight)
+            for entry in entries
+            for term, weight in self.get_term_weights(entry).items()],
+            batch_size=1000)
+
+    def get_term_weights(self, entry):
+        weights = collections.Counter()
+        for term in tokenize(entry.title):
+            weights[term] += TITLE_WEIGHT
+        for term in tokenize(entry.body):
+            weights[term] += BODY_WEIGHT
+        return weights
+
+    def search(self, terms, restaurant_id=None, limit=20, offset=0):
+        entries = SearchEntry.objects.all()
+        matching_terms = Q()
+        for term in terms:
+            entries = entries.filter(pk__in=SearchTerm.objects.filter(
+                term__startswith=term).values('entry'))
+            matching_terms |= Q(terms__term__startswith=term)
+        if restaurant_id is not None:
+            entries = entries.filter(restaurant_id=restaurant_id)
+        entries = entries \
+            .annotate(rank=Sum('terms__weight', filter=matching_terms)) \
+            .order_by('-rank', 'pk') \
+            .values_list('pk', 'kind', 'object_id', 'rank')
+        return list(entries[offset:offset + limit])
+
+
+BACKENDS = {
+    'sqlite': SqliteBackend,
+    'postgres': PostgresBackend,
+    'python': PythonBackend,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def has_fts_table():
+    with connection.cursor() as cursor:
+        return FTS_TABLE in connection.introspection.table_names(cursor)
+
+
+def get_backend():
+    """
+    Return the backend that is named in SEARCH_BACKEND or, by default, the
+    full-text search of the database, if there is one.
+    """
+    name = settings.SEARCH_BACKEND
+    if name is None:
+        if connection.vendor == 'postgresql':
+            name = 'postgres'
+        elif connection.vendor == 'sqlite' and has_fts_table():
+            name = 'sqlite'
+        else:
+            name = 'python'
+    return BACKENDS[name]()
@@ -0,0 +1,159 @@
+from restaurants.models import Restaurant
+from menus.models import Menu, MenuSection, MenuItem
+from .backends import MAX_QUERY_TERMS, get_backend, tokenize
+from .models import SearchEntry
+
+BATCH_SIZE = 1000
+RESTAURANT_CHUNK_SIZE = 500
+
+# the searchable models, the fields of their entries' title and body, and
+# the related objects that are used to show and link to a result
+SEARCH_MODELS = {
+    'restaurant': (Restaurant, 'name', None, []),
+    'menu': (Menu, 'name', 'description', ['restaurant']),
+    'menusection': (MenuSection, 'name', 'note', ['restaurant', 'menu']),
+    'menuitem': (MenuItem, 'name', 'description',
+                 ['restaurant', 'menu', 'menusection']),
+}
+
+
+def get_kind(instance):
+    return instance._meta.model_name
+
+
+def get_entry_values(kind, obj):
+    model, title_field, body_field, related = SEARCH_MODELS[kind]
+    return {
+        'restaurant_id': obj.pk if kind == 'restaurant' else obj.restaurant_id,
+        'title': getattr(obj, title_field),
+        'body': (getattr(obj, body_field) if body_field else None) or '',
+    }
+
+
+def update_entry(instance):
+    """
+    Create or update the search entry of a single object, and return True if
+    the object has been moved to another restaurant.
+
+    (Only UPDATE queries are made for an existing entry, so that saving an
+    object stays cheap.)
+    """
+    kind = get_kind(instance)
+    values = get_entry_values(kind, instance)
+    entries = SearchEntry.objects.filter(kind=kind, object_id=instance.pk)
+    moved = bool(entries.exclude(restaurant=values['restaurant_id'])
+                 .update(restaurant=values['restaurant_id']))
+    if not entries.update(**values):
+        SearchEntry.objects.create(kind=kind, object_id=instance.pk, **values)
+
+    backend = get_backend()
+    if backend.indexes_in_python:
+        backend.index_entries(entries)
+    return moved
+
+
+def delete_entry(instance):
+    SearchEntry.objects.filter(
+        kind=get_kind(instance), object_id=instance.pk).delete()
+
+
+def index_restaurants(restaurant_pks, batch_size=BATCH_SIZE):
+    """
+    Replace the search entries of the given restaurants and their menus,
+    sections and items, using bulk inserts. This is used instead of the
+    signals after objects have been created with bulk_create().
+    """
+    restaurant_pks = list(restaurant_pks)
+    # the restaurants are indexed in chunks to stay below SQLite's limit of
+    # query parameters
+    for i in range(0, len(restaurant_pks), RESTAURANT_CHUNK_SIZE):
+        _index_restaurants(
+            restaurant_pks[i:i + RESTAURANT_CHUNK_SIZE], batch_size)
+
+
+def _index_restaurants(restaurant_pks, batch_size):
+    backend = get_backend()
+    SearchEntry.objects.filter(restaurant__in=restaurant_pks).delete()
+    for kind, (model, title_field, body_field, related) \
+            in SEARCH_MODELS.items():
+        lookup = 'pk__in' if kind == 'restaurant' else 'restaurant__in'
+        objs = model.objects.filter(**{lookup: restaurant_pks}) \
+            .order_by('pk').iterator(chunk_size=batch_size)
+        entries = []
+        for obj in objs:
+            entries.append(SearchEntry(
+                kind=kind, object_id=obj.pk, **get_entry_values(kind, obj)))
+            if len(entries) >= batch_size:
+                _insert_entries(backend, entries)
+                entries = []
+        _insert_entries(backend, entries)
+
+
+def _insert_entries(backend, entries):
+    if not entries:
+        return
+    SearchEntry.objects.bulk_create(entries)
+    if backend.indexes_in_python:
+        # bulk_create() does not set the primary keys on every database
+        backend.index_entries(SearchEntry.objects.filter(
+            kind=entries[0].kind,
+            object_id__in=[entry.object_id for entry in entries]))
+
+
+def rebuild_index(batch_size=BATCH_SIZE):
+    """Replace every search entry."""
+    SearchEntry.objects.all().delete()
+    index_restaurants(
+        Restaurant.objects.order_by('pk').values_list('pk', flat=True),
+        batch_size)
+
+
+class SearchResult:
+    """A restaurant, menu, menu section or menu item that has been found."""
+
+    def __init__(self, kind, obj, rank):
+        self.kind = kind
+        self.object = obj
+        self.rank = rank
+
+    @property
+    def kind_display(self):
+        return dict(SearchEntry.KIND_CHOICES)[self.kind]
+
+    @property
+    def restaurant(self):
+        return self.object if self.kind == 'restaurant' \
+            else self.object.restaurant
+
+    @property
+    def description(self):
+        return get_entry_values(self.kind, self.object)['body']
+
+    def get_absolute_url(self):
+        return self.object.get_absolute_url()
+
+
+def search(query, restaurant_id=None, limit=20, offset=0):
+    """
+    Return the restaurants, menus, menu sections and menu items that contain
+    every word of the query (or a word that starts with it), as a list of
+    SearchResult objects, from the most relevant one.
+    """
+    terms = tokenize(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+    rows = get_backend().search(terms, restaurant_id, limit, offset)
+
+    # load the objects of the results with one query per kind
+    object_ids = {}
+    for entry_pk, kind, object_id, rank in rows:
+        object_ids.setdefault(kind, []).append(object_id)
+    objs = {}
+    for kind, ids in object_ids.items():
+        model, title_field, body_field, related = SEARCH_MODELS[kind]
+        objs[kind] = model.objects.select_related(*related).in_bulk(ids)
+
+    # entries of objects that have just been deleted are skipped
+    return [SearchResult(kind, objs[kind][object_id], rank)
+            for entry_pk, kind, object_id, rank in rows
+            if object_id in objs[kind]]
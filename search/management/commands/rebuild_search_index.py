@@ -0,0 +1,21 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from search.index import rebuild_index
+from search.models import SearchEntry
+
+
+class Command(BaseCommand):
+    help = "Replace the search entries of every restaurant, menu, menu " \
+        "section and menu item, e.g. after objects have been inserted " \
+        "without sending signals, or after changing the search backend."
+
+    def handle(self, *args, **options):
+        start_time = time.perf_counter()
+        with transaction.atomic():
+            rebuild_index()
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {SearchEntry.objects.count()} objects in "
+            f"{time.perf_counter() - start_time:.1f} s."))
@@ -0,0 +1,103 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+FTS_TABLE = 'search_searchentry_fts'
+
+# SQLite: an external content FTS5 table, which is kept in sync with the
+# search entries by triggers (note that the triggers would have to be
+# recreated if a later migration rebuilds the search_searchentry table), with
+# prefix indexes for the short prefixes of terms that are still being typed
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+    "title, body, content='search_searchentry', content_rowid='id', "
+    "tokenize='unicode61', prefix='2 3')",
+    f"CREATE TRIGGER {FTS_TABLE}_insert AFTER INSERT ON search_searchentry "
+    f"BEGIN INSERT INTO {FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+    f"CREATE TRIGGER {FTS_TABLE}_delete AFTER DELETE ON search_searchentry "
+    f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    f"CREATE TRIGGER {FTS_TABLE}_update AFTER UPDATE ON search_searchentry "
+    f"BEGIN INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+]
+SQLITE_REVERSE = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_insert",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_delete",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_update",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# Postgres: a GIN index of the same expression as PostgresBackend.DOCUMENT
+POSTGRES_FORWARD = [
+    "CREATE INDEX searchentry_document_idx ON search_searchentry USING GIN "
+    "((setweight(to_tsvector('simple', title), 'A') || "
+    "setweight(to_tsvector('simple', body), 'B')))",
+]
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS searchentry_document_idx",
+]
+
+
+def create_full_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        try:
+            schema_editor.execute(SQLITE_FORWARD[0])
+        # SQLite has been compiled without FTS5, so the pure-Python search
+        # backend will be used
+        except OperationalError:
+            return
+        for sql in SQLITE_FORWARD[1:]:
+            schema_editor.execute(sql)
+    elif vendor == 'postgresql':
+        for sql in POSTGRES_FORWARD:
+            schema_editor.execute(sql)
+
+
+def drop_full_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for sql in SQLITE_REVERSE:
+            schema_editor.execute(sql)
+    elif vendor == 'postgresql':
+        for sql in POSTGRES_REVERSE:
+            schema_editor.execute(sql)
+
+
+def populate_search_entries(apps, schema_editor):
+    SearchEntry = apps.get_model('search', 'SearchEntry')
+    searchable_models = [
+        ('restaurant', apps.get_model('restaurants', 'Restaurant'), None),
+        ('menu', apps.get_model('menus', 'Menu'), 'description'),
+        ('menusection', apps.get_model('menus', 'MenuSection'), 'note'),
+        ('menuitem', apps.get_model('menus', 'MenuItem'), 'description'),
+    ]
+    for kind, model, body_field in searchable_models:
+        restaurant_field = 'id' if kind == 'restaurant' else 'restaurant_id'
+        fields = ['id', restaurant_field, 'name'] + \
+            ([body_field] if body_field else [])
+        SearchEntry.objects.bulk_create([
+            SearchEntry(kind=kind, object_id=row[0], restaurant_id=row[1],
+                        title=row[2], body=(row[3:] or [''])[0] or '')
+            for row in model.objects.values_list(*fields).iterator()],
+            batch_size=1000)
+
+
+def delete_search_entries(apps, schema_editor):
+    apps.get_model('search', 'SearchEntry').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menus', '0014_updated_at'),
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_full_text_index, drop_full_text_index),
+        migrations.RunPython(populate_search_entries, delete_search_entries),
+    ]
@@ -0,0 +1,54 @@
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """
+    The searchable text of a restaurant, menu, menu section or menu item.
+
+    Entries are kept up to date by this app's signals, and are indexed by
+    the search backend. (See the 'backends' module.)
+    """
+
+    KIND_CHOICES = [
+        ('restaurant', "Restaurant"),
+        ('menu', "Menu"),
+        ('menusection', "Menu Section"),
+        ('menuitem', "Menu Item")]
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()
+    restaurant = models.ForeignKey(
+        'restaurants.Restaurant', on_delete=models.CASCADE)
+    title = models.CharField(max_length=128)
+    body = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name_plural = "search entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'object_id'],
+                name='searchentry_unique_kind_object_id'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}: {self.title}"
+
+
+class SearchTerm(models.Model):
+    """
+    A term of a search entry and its weight. This inverted index is only
+    used by the pure-Python search backend.
+    """
+    entry = models.ForeignKey(
+        'SearchEntry', on_delete=models.CASCADE, related_name='terms')
+    term = models.CharField(max_length=64)
+    weight = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['term', 'entry'], name='searchterm_term_entry_idx'),
+        ]
+
+    def __str__(self):
+        return self.term
@@ -0,0 +1,35 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .index import delete_entry, update_entry
+from .models import SearchEntry
+from restaurants.models import Restaurant
+from menus.models import Menu, MenuSection, MenuItem
+
+
+@receiver(post_save, sender=Restaurant)
+@receiver(post_save, sender=Menu)
+@receiver(post_save, sender=MenuSection)
+@receiver(post_save, sender=MenuItem)
+def searchable_object_saved(sender, instance, **kwargs):
+    moved = update_entry(instance)
+
+    # a menu or section that has been moved to another restaurant takes its
+    # descendants along
+    if moved and sender in (Menu, MenuSection):
+        descendants = [('menuitem', instance.menuitem_set)]
+        if sender == Menu:
+            descendants.append(('menusection', instance.menusection_set))
+        for kind, queryset in descendants:
+            SearchEntry.objects \
+                .filter(kind=kind, object_id__in=queryset.values('pk')) \
+                .exclude(restaurant=instance.restaurant_id) \
+                .update(restaurant=instance.restaurant_id)
+
+
+@receiver(post_delete, sender=Restaurant)
+@receiver(post_delete, sender=Menu)
+@receiver(post_delete, sender=MenuSection)
+@receiver(post_delete, sender=MenuItem)
+def searchable_object_deleted(sender, instance, **kwargs):
+    delete_entry(instance)
@@ -0,0 +1,16 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from menus_project import factories as f
+from .models import SearchEntry
+
+
+class RebuildSearchIndexCommandTest(TestCase):
+
+    def test_rebuild_search_index(self):
+        f.MenuItemFactory()
+        SearchEntry.objects.all().delete()
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(SearchEntry.objects.count(), 4)
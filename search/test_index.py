@@ -0,0 +1,147 @@
+from django.test import TestCase, override_settings
+
+from menus_project import factories as f
+from restaurants.models import Restaurant
+from menus.models import MenuItem
+from .backends import PythonBackend, SqliteBackend, get_backend, tokenize
+from .index import index_restaurants, rebuild_index, search
+from .models import SearchEntry, SearchTerm
+
+
+class SearchIndexTestMixin:
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_restaurant = f.RestaurantFactory(name='Pasta Palace')
+        cls.test_menu = f.MenuFactory(
+            restaurant=cls.test_restaurant, name='Dinner',
+            description='Served after five')
+        cls.test_menusection = f.MenuSectionFactory(
+            menu=cls.test_menu, name='Pasta', note='Made fresh daily')
+        cls.test_menuitem = f.MenuItemFactory(
+            menusection=cls.test_menusection, name='Spaghetti',
+            description='Pasta with tomato sauce')
+        cls.other_menuitem = f.MenuItemFactory(
+            name='Pizza', description='With tomato sauce and cheese')
+
+    def get_results(self, query, **kwargs):
+        return [(result.kind, result.object)
+                for result in search(query, **kwargs)]
+
+    def test_search_finds_every_kind_of_object(self):
+        self.assertEqual(self.get_results('palace'),
+                         [('restaurant', self.test_restaurant)])
+        self.assertEqual(self.get_results('dinner'),
+                         [('menu', self.test_menu)])
+        self.assertEqual(self.get_results('daily'),
+                         [('menusection', self.test_menusection)])
+        self.assertEqual(self.get_results('spaghetti'),
+                         [('menuitem', self.test_menuitem)])
+
+    def test_search_matches_every_term_by_prefix(self):
+        self.assertEqual(self.get_results('TOM chee'),
+                         [('menuitem', self.other_menuitem)])
+
+    def test_search_ranks_title_matches_first(self):
+        results = self.get_results('pasta')
+        self.assertEqual(results[:2], [
+            ('restaurant', self.test_restaurant),
+            ('menusection', self.test_menusection)])
+        self.assertEqual(results[2], ('menuitem', self.test_menuitem))
+
+    def test_search_restaurant_id(self):
+        self.assertEqual(len(self.get_results('tomato')), 2)
+        self.assertEqual(
+            self.get_results('tomato', restaurant_id=self.test_restaurant.pk),
+            [('menuitem', self.test_menuitem)])
+
+    def test_search_limit_and_offset(self):
+        all_results = self.get_results('tomato')
+        self.assertEqual(self.get_results('tomato', limit=1), all_results[:1])
+        self.assertEqual(
+            self.get_results('tomato', limit=1, offset=1), all_results[1:])
+
+    def test_search_without_terms_returns_no_results(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(search(' - '), [])
+
+    def test_search_query_syntax_is_ignored(self):
+        self.assertEqual(self.get_results('"spaghetti" OR* NEAR(pizza'), [])
+        self.assertEqual(self.get_results('spaghetti*:'),
+                         [('menuitem', self.test_menuitem)])
+
+    def test_search_loads_results_with_one_query_per_kind(self):
+        # a restaurant, a menu section and a menu item are found
+        with self.assertNumQueries(4):
+            results = search('pasta')
+            for result in results:
+                result.get_absolute_url()
+
+    def test_saved_object_is_reindexed(self):
+        self.test_menuitem.name = 'Linguine'
+        self.test_menuitem.save()
+        self.assertEqual(self.get_results('spaghetti'), [])
+        self.assertEqual(self.get_results('linguine'),
+                         [('menuitem', self.test_menuitem)])
+
+    def test_deleted_object_is_removed_from_index(self):
+        self.test_menu.delete()
+        self.assertEqual(self.get_results('dinner'), [])
+        self.assertEqual(self.get_results('spaghetti'), [])
+
+    def test_moved_menu_takes_its_descendants_along(self):
+        other_restaurant = self.other_menuitem.restaurant
+        self.test_menu.restaurant = other_restaurant
+        self.test_menu.save()
+        self.assertEqual(
+            self.get_results('spaghetti', restaurant_id=other_restaurant.pk),
+            [('menuitem', self.test_menuitem)])
+
+    def test_index_restaurants(self):
+        MenuItem.objects.filter(pk=self.test_menuitem.pk) \
+            .update(name='Linguine')
+        index_restaurants([self.test_restaurant.pk])
+        self.assertEqual(self.get_results('linguine'),
+                         [('menuitem', self.test_menuitem)])
+        self.assertEqual(SearchEntry.objects.count(), 8)
+
+    def test_rebuild_index(self):
+        SearchEntry.objects.all().delete()
+        rebuild_index()
+        self.assertEqual(SearchEntry.objects.count(), 8)
+        self.assertEqual(self.get_results('spaghetti'),
+                         [('menuitem', self.test_menuitem)])
+
+
+@override_settings(SEARCH_BACKEND='sqlite')
+class SqliteSearchIndexTest(SearchIndexTestMixin, TestCase):
+
+    def test_backend(self):
+        self.assertEqual(type(get_backend()), SqliteBackend)
+        self.assertFalse(SearchTerm.objects.exists())
+
+
+@override_settings(SEARCH_BACKEND='python')
+class PythonSearchIndexTest(SearchIndexTestMixin, TestCase):
+
+    def test_backend(self):
+        self.assertEqual(type(get_backend()), PythonBackend)
+        self.assertEqual(
+            SearchTerm.objects.get(
+                entry__object_id=self.test_restaurant.pk,
+                entry__kind='restaurant', term='pasta').weight, 10)
+
+
+class SearchBackendTest(TestCase):
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Fish_and-Chips (Café's)"),
+                         ['fish', 'and', 'chips', 'café', 's'])
+
+    def test_default_backend_is_database_full_text_search(self):
+        self.assertEqual(type(get_backend()), SqliteBackend)
+
+    def test_deleted_restaurant_entries_are_deleted(self):
+        f.MenuItemFactory()
+        Restaurant.objects.all().delete()
+        self.assertFalse(SearchEntry.objects.exists())
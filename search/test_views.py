@@ -0,0 +1,76 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from menus_project import factories as f
+from . import views
+
+
+class SearchViewTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_menuitem = f.MenuItemFactory(name='Spaghetti')
+        cls.test_restaurant = cls.test_menuitem.restaurant
+        cls.current_test_url = reverse('search:search')
+
+    def setUp(self):
+        self.response = self.client.get(self.current_test_url, {'q': 'spag'})
+        self.context = self.response.context
+        self.view = self.context['view']
+
+    def test_view_class_name(self):
+        self.assertEqual(self.view.__class__.__name__, 'SearchView')
+
+    def test_template_name(self):
+        self.assertEqual(self.view.template_name, 'search/search.html')
+
+    # request.GET
+    def test_request_get_method_unauthenticated_user(self):
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.context['query'], 'spag')
+        self.assertEqual(
+            [result.object for result in self.context['results']],
+            [self.test_menuitem])
+        self.assertContains(
+            self.response, self.test_menuitem.get_absolute_url())
+
+    def test_request_get_method_without_query(self):
+        self.response = self.client.get(self.current_test_url)
+        self.assertEqual(self.response.status_code, 200)
+        self.assertEqual(self.response.context['results'], [])
+
+    def test_request_get_method_no_results(self):
+        self.response = self.client.get(self.current_test_url, {'q': 'soup'})
+        self.assertContains(self.response, 'No results were found')
+
+    def test_request_get_method_restaurant(self):
+        other_restaurant = f.RestaurantFactory()
+        self.response = self.client.get(self.current_test_url, {
+            'q': 'spag', 'restaurant': other_restaurant.slug})
+        self.assertEqual(self.response.context['results'], [])
+        self.assertEqual(
+            self.response.context['restaurant'], other_restaurant)
+
+    def test_request_get_method_unknown_restaurant(self):
+        self.response = self.client.get(self.current_test_url, {
+            'q': 'spag', 'restaurant': 'unknown-restaurant'})
+        self.assertEqual(self.response.status_code, 404)
+
+    def test_request_get_method_pages(self):
+        f.MenuItemFactory.create_batch(
+            views.PAGE_SIZE, menusection=self.test_menuitem.menusection,
+            description='Spaghetti')
+        self.response = self.client.get(self.current_test_url, {'q': 'spag'})
+        self.assertEqual(
+            len(self.response.context['results']), views.PAGE_SIZE)
+        self.assertTrue(self.response.context['has_next_page'])
+
+        self.response = self.client.get(
+            self.current_test_url, {'q': 'spag', 'page': 2})
+        self.assertEqual(len(self.response.context['results']), 1)
+        self.assertFalse(self.response.context['has_next_page'])
+
+    def test_request_get_method_bad_page(self):
+        self.response = self.client.get(
+            self.current_test_url, {'q': 'spag', 'page': 'x'})
+        self.assertEqual(self.response.context['page'], 1)
@@ -0,0 +1,37 @@
+from django.shortcuts import get_object_or_404
+from django.views.generic import TemplateView
+
+from .index import search
+from restaurants.models import Restaurant
+
+PAGE_SIZE = 20
+
+
+class SearchView(TemplateView):
+    template_name = 'search/search.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        query = self.request.GET.get('q', '').strip()
+        try:
+            page = max(int(self.request.GET.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+
+        # optionally, only search a single restaurant
+        restaurant = None
+        if self.request.GET.get('restaurant'):
+            restaurant = get_object_or_404(
+                Restaurant, slug=self.request.GET['restaurant'])
+
+        # get one more result than needed to know if there is a next page
+        results = search(
+            query, restaurant.pk if restaurant else None,
+            limit=PAGE_SIZE + 1, offset=(page - 1) * PAGE_SIZE)
+
+        context.update({'query': query,
+                        'restaurant': restaurant,
+                        'results': results[:PAGE_SIZE],
+                        'page': page,
+                        'has_next_page': len(results) > PAGE_SIZE})
+        return context
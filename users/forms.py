@@ -10,12 +10,33 @@ from django.utils.encoding import force_bytes
 from django.urls import reverse
 
 from server_config import SERVER_LOCATION
+from jobs.queue import enqueue
 from menus_project import constants as c
 
 UserModel = get_user_model()
 
 
-class NewUserCreationForm(PasswordResetForm, UserCreationForm):
+class QueuedEmailMixin:
+    """
+    Send the emails of a PasswordResetForm from the job queue, so that the
+    request does not wait for the email backend.
+    """
+
+    def send_mail(self, subject_template_name, email_template_name, context,
+                  from_email, to_email, html_email_template_name=None):
+        # the user is loaded again by the job
+        context = dict(context)
+        user = context.pop('user', None)
+        enqueue(
+            'users.send_mail', subject_template_name=subject_template_name,
+            email_template_name=email_template_name, context=context,
+            from_email=from_email, to_email=to_email,
+            html_email_template_name=html_email_template_name,
+            user_pk=user.pk if user is not None else None)
+
+
+class NewUserCreationForm(
+        QueuedEmailMixin, PasswordResetForm, UserCreationForm):
     """Register new users and send them a welcome email."""
     captcha = CaptchaField(
         help_text=c.FORMS_CAPTCHA_FIELD_HELP_TEXT)
@@ -169,6 +190,6 @@ class UserAuthenticationForm(AuthenticationForm):
         return self.cleaned_data
 
 
-class UserPasswordResetForm(PasswordResetForm):
+class UserPasswordResetForm(QueuedEmailMixin, PasswordResetForm):
     captcha = CaptchaField(
         help_text=c.FORMS_CAPTCHA_FIELD_HELP_TEXT)
@@ -0,0 +1,24 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.forms import PasswordResetForm
+
+from jobs.queue import task
+
+UserModel = get_user_model()
+
+
+@task('users.send_mail')
+def send_mail(subject_template_name, email_template_name, context,
+              from_email, to_email, html_email_template_name=None,
+              user_pk=None):
+    """
+    Render and send an email of a PasswordResetForm (e.g. a password reset
+    or a new user's confirmation email). See QueuedEmailMixin.
+    """
+    if user_pk is not None:
+        context['user'] = UserModel.objects.filter(pk=user_pk).first()
+        # the user has been deleted since the email was queued
+        if context['user'] is None:
+            return
+    PasswordResetForm().send_mail(
+        subject_template_name, email_template_name, context, from_email,
+        to_email, html_email_template_name=html_email_template_name)
@@ -1,11 +1,13 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.core import mail
-from django.test import SimpleTestCase, TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils.http import urlsafe_base64_decode
 from django.urls import reverse
 from html import unescape
 
+from jobs.models import Job
+from jobs.queue import run_next_job
 from menus_project import constants as c
 from menus_project import factories as f
 from .forms import (
@@ -219,3 +221,60 @@ class UserPasswordResetFormTest(SimpleTestCase):
         self.assertEqual(
             self.form_instance.fields['captcha'].help_text,
             c.FORMS_CAPTCHA_FIELD_HELP_TEXT)
+
+
+@override_settings(JOBS_RUN_IMMEDIATELY=False)
+class QueuedEmailTest(TestCase):
+
+    def test_new_user_email_is_sent_by_a_job(self):
+        form = NewUserCreationForm(data={
+            'username': 'new_user',
+            'email': 'new_user@email.local',
+            'password1': c.TEST_USER_PASSWORD,
+            'password2': c.TEST_USER_PASSWORD,
+            'captcha_0': 'test',
+            'captcha_1': 'PASSED'})
+        self.assertTrue(form.is_valid())
+        form.save()
+
+        # the email is not sent during the request
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(Job.objects.get().task, 'users.send_mail')
+
+        run_next_job()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['new_user@email.local'])
+
+    def test_password_reset_email_is_sent_by_a_job(self):
+        test_user = f.UserFactory()
+        form = UserPasswordResetForm(data={
+            'email': test_user.email,
+            'captcha_0': 'test',
+            'captcha_1': 'PASSED'})
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.assertEqual(len(mail.outbox), 0)
+
+        # the job loads the user again
+        self.assertEqual(Job.objects.get().kwargs['user_pk'], test_user.pk)
+        run_next_job()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [test_user.email])
+        self.assertIn(test_user.username, mail.outbox[0].body)
+
+    def test_email_of_deleted_user_is_not_sent(self):
+        test_user = f.UserFactory()
+        form = UserPasswordResetForm(data={
+            'email': test_user.email,
+            'captcha_0': 'test',
+            'captcha_1': 'PASSED'})
+        self.assertTrue(form.is_valid())
+        form.save()
+        # as if the user had been deleted
+        job = Job.objects.get()
+        job.kwargs['user_pk'] = test_user.pk + 1
+        job.save()
+
+        run_next_job()
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(Job.objects.exists())